@@ -0,0 +1,231 @@
+"""
+Benchmark de la boucle principale du jeu.
+
+Mesure, pour des flottes de 10 à 10 000 avions répartis sur les trois
+niveaux, la latence par appel (p50/p95/p99) et le débit de
+GameManager.update, GameManager._check_collisions,
+GameManager.select_airplane, ConflictProbe.predict,
+RadarScene.update_airplanes et le dessin du radar (plateforme Qt
+offscreen). Les résultats sont écrits en JSON et peuvent être comparés
+à une référence :
+
+    python -m benchmarks.bench_core --output bench.json
+    python -m benchmarks.bench_core --baseline bench.json --threshold 0.15
+"""
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+
+from models.airplane import Airplane
+from models.conflict_probe import ConflictProbe
+from models.events import EventLog
+from models.game_manager import GameManager
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+REFERENCE_FLEET = 100  # taille de flotte pour laquelle le radar garde sa taille d'origine
+
+
+def seed_game(size, seed=0, engine='objects', factory=GameManager, **options):
+    """
+    Crée un GameManager contenant exactement size avions.
+
+    La surface du radar croît avec la flotte pour garder la densité du
+    jeu normal : sinon une flotte de 10 000 avions sur 800x600 ne
+    mesurerait que des collisions.
+
+    Args:
+        factory, options: Classe à instancier à la place de GameManager
+            et ses arguments supplémentaires (voir bench_sectors)
+    """
+    rng = random.Random(seed)
+    scale = max(1.0, math.sqrt(size / REFERENCE_FLEET))
+    game_manager = factory(int(800 * scale), int(600 * scale), engine=engine,
+                           events=EventLog(), seed=seed, **options)
+    for airplane in game_manager.airplanes[:]:
+        game_manager.remove_airplane(airplane)
+
+    for index in range(size):
+        game_manager.add_airplane(Airplane(
+            x=rng.uniform(0, game_manager.radar_width),
+            y=rng.uniform(0, game_manager.radar_height),
+            level=index % 3 + 1,
+            speed=rng.randint(200, 400),
+            heading=rng.uniform(0, 360),
+            fuel=rng.randint(60, 100),
+        ))
+    game_manager._sync_grid()
+    # Le benchmark ne doit jamais s'arrêter sur un game over ni sur des spawns
+    game_manager.lives = float('inf')
+    game_manager.spawn_timer = -float('inf')
+    return game_manager
+
+
+def measure(operation, iterations, setup=None, warmup=3):
+    """Exécute operation et retourne les durées en nanosecondes de chaque appel"""
+    samples = []
+    for index in range(warmup + iterations):
+        if setup is not None:
+            setup()
+        start = time.perf_counter_ns()
+        operation()
+        elapsed = time.perf_counter_ns() - start
+        if index >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] / 1e6
+
+    mean = sum(ordered) / len(ordered) / 1e6
+    return {
+        'iterations': len(ordered),
+        'mean_ms': mean,
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99),
+        'throughput_per_s': 1000 / mean if mean > 0 else None,
+    }
+
+
+def default_iterations(size):
+    return max(10, min(200, 20000 // size))
+
+
+def bench_model(size, iterations, engine, seed):
+    results = {}
+    dt = 0.05
+
+    game_manager = seed_game(size, seed, engine)
+    results['update'] = measure(lambda: game_manager.update(dt), iterations)
+
+    game_manager = seed_game(size, seed, engine)
+    results['check_collisions'] = measure(game_manager._check_collisions, iterations)
+
+    game_manager = seed_game(size, seed, engine)
+    rng = random.Random(seed)
+    clicks = [(rng.uniform(0, game_manager.radar_width), rng.uniform(0, game_manager.radar_height))
+              for _ in range(iterations + 3)]
+    clicks_iter = iter(clicks)
+    results['select_airplane'] = measure(
+        lambda: game_manager.select_airplane(*next(clicks_iter)), iterations)
+
+    game_manager = seed_game(size, seed, engine)
+    probe = ConflictProbe()
+    results['conflict_probe'] = measure(lambda: probe.predict(game_manager, dt), iterations)
+    return results
+
+
+def bench_scene(size, iterations, engine, seed):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PySide6.QtGui import QImage, QPainter
+    from PySide6.QtWidgets import QApplication
+    from views.radar_view import RadarScene
+
+    app = QApplication.instance() or QApplication([])
+    game_manager = seed_game(size, seed, engine)
+    scene = RadarScene(game_manager.radar_width, game_manager.radar_height, game_manager)
+    scene.update_airplanes()
+    samples = measure(scene.update_airplanes, iterations,
+                      setup=lambda: game_manager.update(0.05))
+
+    # Dessin de tout le radar dans une image de la taille de la vue
+    image = QImage(800, 600, QImage.Format_ARGB32_Premultiplied)
+
+    def render():
+        painter = QPainter(image)
+        scene.render(painter)
+        painter.end()
+
+    render_samples = measure(render, iterations)
+    scene.clear()
+    app.processEvents()
+    return {'scene_update_airplanes': samples, 'scene_render': render_samples}
+
+
+def run(sizes, iterations=None, engine='objects', seed=0, scene=True):
+    results = {}
+    for size in sizes:
+        count = iterations or default_iterations(size)
+        samples = bench_model(size, count, engine, seed)
+        if scene:
+            samples.update(bench_scene(size, count, engine, seed))
+        for name, values in samples.items():
+            results[f"{name}/{size}"] = summarize(values)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Retourne les mesures dont le p50 dépasse la référence de plus de threshold"""
+    regressions = []
+    for key, current in results.items():
+        reference = baseline.get(key)
+        if not reference or not reference['p50_ms']:
+            continue
+        ratio = current['p50_ms'] / reference['p50_ms']
+        if ratio > 1 + threshold:
+            regressions.append((key, reference['p50_ms'], current['p50_ms'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de GameManager.update et du radar")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--iterations', type=int,
+                        help="Nombre d'appels mesurés (défaut: selon la taille de flotte)")
+    parser.add_argument('--engine', choices=GameManager.ENGINES, default='objects')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-scene', action='store_true', help="Ne mesure pas RadarScene")
+    parser.add_argument('--output', help="Fichier JSON de résultats")
+    parser.add_argument('--baseline', help="Fichier JSON de référence à comparer")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Régression tolérée sur le p50 (défaut: 0.15 = +15%%)")
+    args = parser.parse_args(argv)
+
+    scene = not args.no_scene
+    if scene:
+        if importlib.util.find_spec('PySide6') is None:
+            print("PySide6 absent : RadarScene n'est pas mesuré", file=sys.stderr)
+            scene = False
+
+    results = run(args.sizes, args.iterations, args.engine, args.seed, scene)
+
+    for key, stats in results.items():
+        print(f"{key:32} p50 {stats['p50_ms']:9.3f} ms  p95 {stats['p95_ms']:9.3f} ms  "
+              f"p99 {stats['p99_ms']:9.3f} ms  {stats['throughput_per_s'] or 0:10.1f}/s")
+
+    if args.output:
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'engine': args.engine,
+                'seed': args.seed,
+                'timestamp': time.time(),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"RÉGRESSION {key}: {before:.3f} ms -> {after:.3f} ms (x{ratio:.2f})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark du découpage en secteurs (models.sectors).
+
+Mesure GameManager.update sur une même flotte (seed_game de bench_core)
+simulée par un GameManager unique puis par un SectorCoordinator à 2, 4...
+secteurs, un processus chacun. Le gain attendu suit le nombre de cœurs
+disponibles, moins le coût des deux échanges par tick (fusion de la flotte
+dans le coordinateur) :
+
+    python -m benchmarks.bench_sectors --sizes 1000 10000 --sectors 2 4 8
+    python -m benchmarks.bench_sectors --output sectors.json
+    python -m benchmarks.bench_sectors --baseline sectors.json --threshold 0.15
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from benchmarks.bench_core import compare, measure, seed_game, summarize
+from models.game_manager import GameManager
+from models.sectors import SectorCoordinator
+
+DEFAULT_SIZES = (1000, 10000)
+
+
+def default_sector_counts():
+    cores = os.cpu_count() or 1
+    counts = [2, 4]
+    if cores not in counts and cores > 1:
+        counts.append(cores)
+    return sorted(counts)
+
+
+def bench_sectors(size, sectors, iterations, engine, seed):
+    """Durées de update pour un découpage (sectors=None : GameManager unique)"""
+    dt = 0.05
+    if sectors is None:
+        game_manager = seed_game(size, seed, engine)
+    else:
+        game_manager = seed_game(size, seed, engine, factory=SectorCoordinator, sectors=sectors)
+    try:
+        return measure(lambda: game_manager.update(dt), iterations)
+    finally:
+        game_manager.close()
+
+
+def run(sizes, sector_counts, iterations=None, engine='objects', seed=0):
+    results = {}
+    for size in sizes:
+        count = iterations or max(10, min(100, 20000 // size))
+        for sectors in [None, *sector_counts]:
+            key = f"update/{size}/{'single' if sectors is None else f'sectors-{sectors}'}"
+            results[key] = summarize(bench_sectors(size, sectors, count, engine, seed))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de la simulation par secteurs")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--sectors', type=int, nargs='+', default=default_sector_counts(),
+                        help="Nombres de secteurs mesurés (défaut: 2, 4 et le nombre de cœurs)")
+    parser.add_argument('--iterations', type=int,
+                        help="Nombre d'appels mesurés (défaut: selon la taille de flotte)")
+    parser.add_argument('--engine', choices=GameManager.ENGINES, default='objects')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Fichier JSON de résultats")
+    parser.add_argument('--baseline', help="Fichier JSON de référence à comparer")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Régression tolérée sur le p50 (défaut: 0.15 = +15%%)")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.sectors, args.iterations, args.engine, args.seed)
+
+    for key, stats in results.items():
+        single = results[key.rsplit('/', 1)[0] + '/single']['p50_ms']
+        print(f"{key:28} p50 {stats['p50_ms']:9.3f} ms  p95 {stats['p95_ms']:9.3f} ms  "
+              f"x{single / stats['p50_ms'] if stats['p50_ms'] else 0:5.2f}")
+    print(f"{os.cpu_count()} cœur(s) disponible(s)")
+
+    if args.output:
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'engine': args.engine,
+                'seed': args.seed,
+                'timestamp': time.time(),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"RÉGRESSION {key}: {before:.3f} ms -> {after:.3f} ms (x{ratio:.2f})")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
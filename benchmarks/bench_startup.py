@@ -0,0 +1,146 @@
+"""
+Benchmark du démarrage.
+
+Chaque mesure tourne dans un processus Python neuf (imports à froid) :
+import de models et de models.run (qui ne doivent pas charger PySide6),
+import de views.main_window, création de la QApplication, construction de
+MainWindow avec la classe de formulaire précompilée puis avec QUiLoader,
+première image affichée, étapes différées après l'affichage (sonde de
+conflits, NumPy) et durée totale du processus (plateforme Qt offscreen). Mêmes sorties et même comparaison à une référence que
+bench_core :
+
+    python -m benchmarks.bench_startup --output startup.json
+    python -m benchmarks.bench_startup --baseline startup.json --threshold 0.15
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_core import compare, summarize
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Exécuté dans le processus mesuré ; écrit les durées en nanosecondes en JSON
+CHILD = '''
+import json, os, sys, time
+timings = {{}}
+start = time.perf_counter_ns()
+import models
+timings['import_models'] = time.perf_counter_ns() - start
+mark = time.perf_counter_ns()
+import models.run
+timings['import_models_run'] = time.perf_counter_ns() - mark
+headless_qt = [name for name in sys.modules if name.startswith('PySide6')]
+if {ui}:
+    mark = time.perf_counter_ns()
+    import views.main_window
+    from PySide6.QtWidgets import QApplication
+    timings['import_views'] = time.perf_counter_ns() - mark
+    mark = time.perf_counter_ns()
+    app = QApplication([])
+    timings['qapplication'] = time.perf_counter_ns() - mark
+    views.main_window.MainWindow.USE_COMPILED_UI = {compiled}
+    mark = time.perf_counter_ns()
+    window = views.main_window.MainWindow()
+    timings['main_window/{form}'] = time.perf_counter_ns() - mark
+    mark = time.perf_counter_ns()
+    window.show()
+    window.grab()
+    timings['first_frame'] = time.perf_counter_ns() - mark
+    mark = time.perf_counter_ns()
+    app.processEvents()
+    timings['deferred_startup'] = time.perf_counter_ns() - mark
+    window.simulation.stop()
+print(json.dumps({{'timings': timings, 'headless_qt': headless_qt}}))
+sys.stdout.flush()
+os._exit(0)  # sans closeEvent : pas de sauvegarde de la partie
+'''
+
+
+def run_child(ui=True, compiled=True):
+    """Un démarrage mesuré ; retourne ({mesure: ns}, modules PySide6 chargés par models)"""
+    code = CHILD.format(ui=ui, compiled=compiled, form='compiled' if compiled else 'uiloader')
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(ROOT))
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    start = time.perf_counter_ns()
+    result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True,
+                            text=True, check=True)
+    elapsed = time.perf_counter_ns() - start
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    timings = report['timings']
+    timings['process/ui' if ui else 'process/headless'] = elapsed
+    return timings, report['headless_qt']
+
+
+def run(repeat=5, ui=True):
+    samples = {}
+    headless_qt = []
+    variants = [(False, True)]
+    if ui:
+        variants += [(True, True), (True, False)]
+    for _ in range(repeat):
+        for with_ui, compiled in variants:
+            timings, loaded = run_child(with_ui, compiled)
+            headless_qt.extend(loaded)
+            for name, value in timings.items():
+                samples.setdefault(name, []).append(value)
+    return {name: summarize(values) for name, values in samples.items()}, sorted(set(headless_qt))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage et des imports")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="Démarrages mesurés par variante (défaut: 5)")
+    parser.add_argument('--no-ui', action='store_true', help="Ne mesure que les imports de models")
+    parser.add_argument('--output', help="Fichier JSON de résultats")
+    parser.add_argument('--baseline', help="Fichier JSON de référence à comparer")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Régression tolérée sur le p50 (défaut: 0.15 = +15%%)")
+    args = parser.parse_args(argv)
+
+    ui = not args.no_ui
+    if ui:
+        if importlib.util.find_spec('PySide6') is None:
+            print("PySide6 absent : seuls les imports de models sont mesurés", file=sys.stderr)
+            ui = False
+
+    results, headless_qt = run(args.repeat, ui)
+
+    for key, stats in sorted(results.items()):
+        print(f"{key:24} p50 {stats['p50_ms']:9.3f} ms  p95 {stats['p95_ms']:9.3f} ms  "
+              f"p99 {stats['p99_ms']:9.3f} ms")
+    if headless_qt:
+        print(f"ERREUR : models charge PySide6 ({', '.join(headless_qt)})")
+
+    if args.output:
+        report = {
+            'meta': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeat': args.repeat,
+                'timestamp': time.time(),
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for key, before, after, ratio in regressions:
+            print(f"RÉGRESSION {key}: {before:.3f} ms -> {after:.3f} ms (x{ratio:.2f})")
+        if regressions:
+            sys.exit(1)
+    if headless_qt:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
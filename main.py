@@ -1,13 +1,36 @@
+import argparse
 import sys
-from PySide6.QtWidgets import QApplication
-from views.main_window import MainWindow
 
 
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Contrôle aérien")
+    parser.add_argument('--seed', type=int, help="Graine de la partie (tirée au hasard sinon)")
+    parser.add_argument('--record', metavar='PATH',
+                        help="Enregistre la partie pour la rejouer avec models.replay")
+    parser.add_argument('--perf-overlay', action='store_true',
+                        help="Affiche les mesures de performance sur le radar (F3)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Chronomètre chaque phase du tick et de l'affichage (rapport : F11)")
+    parser.add_argument('--sectors', type=int, metavar='N',
+                        help="Découpe l'espace aérien en N secteurs simulés chacun dans son processus")
+    parser.add_argument('--telemetry', metavar='ADRESSE',
+                        help="Diffuse l'état de chaque tick aux abonnés (unix:/chemin ou hôte:port)")
+    parser.add_argument('--fleet-threshold', type=int, metavar='N',
+                        help="Avions au-delà desquels le radar dessine la flotte d'un seul item")
+    args, qt_args = parser.parse_known_args()
+    if args.sectors is not None and args.record:
+        parser.error("--record n'est pas disponible avec --sectors")
+    
+    # Qt n'est chargé qu'après les arguments : --help reste instantané
+    from PySide6.QtWidgets import QApplication
+    from views.main_window import MainWindow
+    
+    app = QApplication(sys.argv[:1] + qt_args)
     
    
-    window = MainWindow()
+    window = MainWindow(record_path=args.record, seed=args.seed, profile=args.profile,
+                        performance_overlay=args.perf_overlay, sectors=args.sectors,
+                        telemetry=args.telemetry, fleet_threshold=args.fleet_threshold)
     window.show()
     
     
@@ -1,4 +1,25 @@
-from models.airplane import Airplane, AirplaneState
-from models.game_manager import GameManager
+import importlib
 
-__all__ = ['Airplane', 'AirplaneState', 'GameManager']
+# Exports chargés au premier accès : « import models » ne coûte rien, et les
+# sous-modules (models.run, models.replay...) n'importent que ce qu'ils utilisent
+_EXPORTS = {
+    'Airplane': 'models.airplane',
+    'AirplaneState': 'models.airplane',
+    'CommandResult': 'models.game_manager',
+    'GameManager': 'models.game_manager',
+}
+
+__all__ = ['Airplane', 'AirplaneState', 'CommandResult', 'GameManager']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -11,6 +11,28 @@ class AirplaneState(Enum):
     EMERGENCY = "emergency"
 
 
+class _FleetColumn:
+    """Attribut stocké sur l'avion, ou dans sa ligne de la flotte s'il y est rattaché"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, airplane, owner=None):
+        if airplane is None:
+            return self
+        fleet = airplane._fleet
+        if fleet is None:
+            return airplane.__dict__[self.name]
+        return fleet.get(self.name, airplane._row)
+
+    def __set__(self, airplane, value):
+        fleet = airplane._fleet
+        if fleet is None:
+            airplane.__dict__[self.name] = value
+        else:
+            fleet.set(self.name, airplane._row, value)
+
+
 class Airplane:
 
     LEVEL_1 = 1
@@ -25,32 +47,62 @@ class Airplane:
     CRITICAL_FUEL_LEVEL = 15
     COLLISION_DISTANCE = 30
     SAFE_DISTANCE = 80
+    TURN_RATE = 2.0  # degrés par tick en virage d'approche
     
     _airplane_counter = 0
     
-    def __init__(self, name=None, x=0, y=0, level=3, speed=250, heading=0, fuel=100):
-        Airplane._airplane_counter += 1
-        self.id = Airplane._airplane_counter
-        self.name = name or self._generate_name()
+    # Colonnes stockées dans la flotte vectorisée (voir models.fleet)
+    x = _FleetColumn()
+    y = _FleetColumn()
+    level = _FleetColumn()
+    speed = _FleetColumn()
+    heading = _FleetColumn()
+    fuel = _FleetColumn()
+    state = _FleetColumn()
+    has_emergency = _FleetColumn()
+    landing_target_x = _FleetColumn()
+    landing_target_y = _FleetColumn()
+    prev_x = _FleetColumn()  # position au début du dernier pas (détection balayée)
+    prev_y = _FleetColumn()
+    
+    def __init__(self, name=None, x=0, y=0, level=3, speed=250, heading=0, fuel=100,
+                 airplane_id=None, rng=None):
+        """
+        Args:
+            airplane_id: Identifiant imposé (GameManager numérote ses avions
+                lui-même pour que les parties soient reproductibles) ;
+                sinon un compteur global est utilisé
+            rng: Générateur utilisé pour tirer le nom (module random par défaut)
+        """
+        self._fleet = None
+        self._row = None
+        if airplane_id is None:
+            Airplane._airplane_counter += 1
+            airplane_id = Airplane._airplane_counter
+        self.id = airplane_id
+        self.name = name or self._generate_name(rng or random)
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.level = max(self.MIN_LEVEL, min(self.MAX_LEVEL, level))
         self.speed = speed
         self.heading = heading
         self.fuel = fuel
         self.state = AirplaneState.FLYING
-        self.selected = False
         self.has_emergency = False
         self.landing_target_x = None
         self.landing_target_y = None
         
     @staticmethod
-    def _generate_name():
+    def _generate_name(rng=random):
         airlines = ["AFR", "BAW", "LH", "DLH", "UAE", "AAL", "UAL"]
-        number = random.randint(100, 999)
-        return f"{random.choice(airlines)}{number}"
+        number = rng.randint(100, 999)
+        return f"{rng.choice(airlines)}{number}"
     
     def update(self, dt):
+        self.prev_x = self.x
+        self.prev_y = self.y
         if self.state == AirplaneState.LANDED:
             return
         
@@ -74,7 +126,7 @@ class Airplane:
                 target_heading = math.degrees(math.atan2(dx, -dy)) % 360
                 
                 heading_diff = (target_heading - self.heading + 180) % 360 - 180
-                turn_rate = 2.0
+                turn_rate = self.TURN_RATE
                 if abs(heading_diff) > turn_rate:
                     self.heading += turn_rate if heading_diff > 0 else -turn_rate
                 else:
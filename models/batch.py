@@ -0,0 +1,240 @@
+"""
+Parties automatiques en masse pour régler la courbe de difficulté.
+
+Chaque jeu de paramètres (les constantes DIFFICULTY_PERIOD,
+SPAWN_INTERVAL_* et LOW_FUEL_PROBABILITY de GameManager) est joué sur les
+mêmes graines par un contrôleur automatique, sur tous les cœurs. Le
+résumé donne, par jeu de paramètres, la survie, les atterrissages, les
+crashs et les collisions.
+
+Exemple :
+    python -m models.batch --games 200 --period 20 30 40 --spawn-min 2 2.5 3
+    python -m models.batch --games 50 --controller monpaquet.politique:Prudente
+"""
+import argparse
+import csv
+import importlib
+import itertools
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from models.controllers import CONTROLLERS
+from models.events import WARNING, EventLog, EventType
+from models.game_manager import GameManager
+from models.run import simulate
+
+# Option de ligne de commande -> attribut de GameManager
+PARAMETERS = {
+    'period': 'DIFFICULTY_PERIOD',
+    'spawn_base': 'SPAWN_INTERVAL_BASE',
+    'spawn_step': 'SPAWN_INTERVAL_STEP',
+    'spawn_min': 'SPAWN_INTERVAL_MIN',
+    'low_fuel': 'LOW_FUEL_PROBABILITY',
+}
+PARAMETERS_BY_ATTRIBUTE = {attribute: option for option, attribute in PARAMETERS.items()}
+
+
+class _EventCounter:
+    """Sink qui compte les crashs et collisions sans garder les messages"""
+
+    def __init__(self):
+        self.level = WARNING
+        self.crashes = 0
+        self.collisions = 0
+
+    def write(self, event):
+        if event.type == EventType.CRASH:
+            self.crashes += 1
+        elif event.type == EventType.COLLISION:
+            self.collisions += 1
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def load_controller(name):
+    """
+    Contrôleur par nom (voir models.controllers.CONTROLLERS) ou par chemin
+    'module:Classe' pour une politique définie ailleurs.
+    """
+    if name in CONTROLLERS:
+        return CONTROLLERS[name]
+    module_name, _, class_name = name.partition(':')
+    if not class_name:
+        raise ValueError(f"Contrôleur inconnu: {name}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def play(params, seed, controller='autoland', engine='objects', dt=0.05, max_duration=1800):
+    """
+    Joue une partie jusqu'au game over ou max_duration secondes simulées.
+
+    Args:
+        params: {attribut de GameManager: valeur} appliqués avant les
+            premières apparitions
+
+    Returns:
+        dict des résultats de la partie
+    """
+    tuned = type('TunedGameManager', (GameManager,), dict(params))
+    counter = _EventCounter()
+    game_manager = tuned(engine=engine, events=EventLog(buffer_level=WARNING, sinks=[counter]),
+                         seed=seed)
+    ticks, elapsed = simulate(game_manager, load_controller(controller)(), dt,
+                              duration=max_duration)
+    return {
+        'seed': seed,
+        'survival': game_manager.game_time,
+        'game_over': game_manager.game_over,
+        'landed': game_manager.planes_landed,
+        'crashes': counter.crashes,
+        'collisions': counter.collisions,
+        'avoided': game_manager.collisions_avoided,
+        'score': game_manager.score,
+        'difficulty': game_manager.difficulty_level,
+        'ticks': ticks,
+        'cpu': elapsed,
+    }
+
+
+def _play_task(task):
+    index, params, seed, options = task
+    return index, play(params, seed, **options)
+
+
+def parameter_grid(**values):
+    """
+    Produit cartésien des valeurs données par option ; les options absentes
+    gardent la valeur de GameManager.
+
+    Returns:
+        Liste de dicts {attribut de GameManager: valeur}
+    """
+    names = [PARAMETERS[option] for option in PARAMETERS if values.get(option)]
+    choices = [values[option] for option in PARAMETERS if values.get(option)]
+    return [dict(zip(names, combination)) for combination in itertools.product(*choices)]
+
+
+def run_batch(param_sets, games, controller='autoland', engine='objects', dt=0.05,
+              max_duration=1800, workers=None, first_seed=0):
+    """
+    Joue games parties par jeu de paramètres, réparties sur un pool de processus.
+
+    Tous les jeux de paramètres utilisent les mêmes graines : les écarts
+    mesurés viennent des paramètres, pas du tirage des parties.
+
+    Returns:
+        Liste, par jeu de paramètres, de la liste des résultats de play()
+    """
+    options = {'controller': controller, 'engine': engine, 'dt': dt,
+               'max_duration': max_duration}
+    load_controller(controller)  # erreur immédiate plutôt que dans chaque processus
+    tasks = [(index, params, first_seed + game, options)
+             for index, params in enumerate(param_sets)
+             for game in range(games)]
+    results = [[] for _ in param_sets]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for index, result in map(_play_task, tasks):
+            results[index].append(result)
+        return results
+
+    # Des lots de tâches limitent les allers-retours entre processus
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(workers) as executor:
+        for index, result in executor.map(_play_task, tasks, chunksize=chunksize):
+            results[index].append(result)
+    return results
+
+
+def summarize(params, results):
+    """Ligne de résumé d'un jeu de paramètres"""
+    survival = [result['survival'] for result in results]
+    count = len(results)
+    return {
+        **{PARAMETERS_BY_ATTRIBUTE[name]: value for name, value in params.items()},
+        'games': count,
+        'survival_mean': statistics.fmean(survival),
+        'survival_p50': statistics.median(survival),
+        'game_over_rate': sum(result['game_over'] for result in results) / count,
+        'landed': statistics.fmean(result['landed'] for result in results),
+        'crashes': statistics.fmean(result['crashes'] for result in results),
+        'collisions': statistics.fmean(result['collisions'] for result in results),
+        'score': statistics.fmean(result['score'] for result in results),
+    }
+
+
+def print_table(rows, file=None):
+    if not rows:
+        return
+    columns = list(rows[0])
+    cells = [[f"{value:.2f}" if isinstance(value, float) else str(value) for value in row.values()]
+             for row in rows]
+    widths = [max(len(column), *(len(line[index]) for line in cells))
+              for index, column in enumerate(columns)]
+    file = file or sys.stdout
+    print("  ".join(column.rjust(width) for column, width in zip(columns, widths)), file=file)
+    for line in cells:
+        print("  ".join(cell.rjust(width) for cell, width in zip(line, widths)), file=file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Balayage de la courbe de difficulté")
+    parser.add_argument('--games', type=int, default=100,
+                        help="Parties par jeu de paramètres (défaut: 100)")
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--controller', default='autoland',
+                        help=f"{', '.join(sorted(CONTROLLERS))} ou module:Classe")
+    parser.add_argument('--engine', choices=GameManager.ENGINES, default='objects')
+    parser.add_argument('--dt', type=float, default=0.05)
+    parser.add_argument('--max-duration', type=float, default=1800,
+                        help="Arrêt d'une partie après cette durée simulée (défaut: 1800 s)")
+    parser.add_argument('--workers', type=int, help="Processus (défaut: nombre de cœurs)")
+    for option, attribute in PARAMETERS.items():
+        parser.add_argument(f"--{option.replace('_', '-')}", dest=option, type=float, nargs='+',
+                            metavar='V', help=f"Valeurs de GameManager.{attribute} "
+                                              f"(défaut: {getattr(GameManager, attribute)})")
+    parser.add_argument('--output', metavar='CSV', help="Écrit le résumé en CSV")
+    parser.add_argument('--results', metavar='CSV', help="Écrit le résultat de chaque partie")
+    args = parser.parse_args(argv)
+    if args.games < 1:
+        parser.error("--games doit valoir au moins 1")
+
+    param_sets = parameter_grid(**{option: getattr(args, option) for option in PARAMETERS})
+    start = time.perf_counter()
+    results = run_batch(param_sets, args.games, args.controller, args.engine, args.dt,
+                        args.max_duration, args.workers, args.first_seed)
+    elapsed = time.perf_counter() - start
+
+    rows = [summarize(params, games) for params, games in zip(param_sets, results)]
+    print_table(rows)
+    total = sum(len(games) for games in results)
+    print(f"{total} parties en {elapsed:.1f} s ({total / elapsed:.1f} parties/s)")
+
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+    if args.results:
+        with open(args.results, 'w', newline='', encoding='utf-8') as file:
+            writer = None
+            for params, games in zip(param_sets, results):
+                for result in games:
+                    row = {**{PARAMETERS_BY_ATTRIBUTE[name]: value
+                              for name, value in params.items()}, **result}
+                    if writer is None:
+                        writer = csv.DictWriter(file, fieldnames=list(row))
+                        writer.writeheader()
+                    writer.writerow(row)
+
+
+if __name__ == '__main__':
+    main()
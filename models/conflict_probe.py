@@ -0,0 +1,443 @@
+"""
+Prédiction des conflits par point de plus proche approche (CPA).
+
+Chaque avion est projeté sur sa trajectoire actuelle : ligne droite au cap
+et à la vitesse courants, arrêt sur place en attente, et pour un avion en
+approche au niveau 1, virage tick par tick vers la zone d'atterrissage
+exactement comme dans Airplane.update, puis ligne droite jusqu'à la zone.
+Pour chaque paire d'un même niveau, on cherche l'instant et la distance
+de plus proche approche sur l'horizon ; les paires qui passent à moins de
+`separation` sont publiées, triées par instant.
+
+Tout le calcul est vectorisé avec NumPy. Les virages sont propagés
+d'abord, pour tous les avions à la fois, jusqu'à ce que chacun soit
+aligné. Seules sont ensuite examinées les paires dont les positions sont
+dans des cellules voisines au milieu d'une des fenêtres courtes qui
+découpent l'horizon, prises sur le chemin propagé pour un avion qui vire.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from models.airplane import Airplane, AirplaneState
+
+PredictedConflict = namedtuple('PredictedConflict', [
+    'time',         # secondes avant la plus proche approche
+    'distance',     # distance à la plus proche approche
+    'airplane_ids', # (id1, id2)
+    'level',
+    'x', 'y',       # milieu des deux avions à la plus proche approche
+])
+
+# Demi-voisinage d'une cellule : chaque paire de cellules n'est vue qu'une fois
+_HALF_NEIGHBOURHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+
+def _cell_pairs(level, cell_x, cell_y):
+    """
+    Indices (i, j) des avions dont les cellules sont identiques ou voisines,
+    générés sans boucle Python par avion.
+    """
+    packed = (level << 42) | ((cell_x & 0x1FFFFF) << 21) | (cell_y & 0x1FFFFF)
+    order = np.argsort(packed, kind='stable')
+    ordered = packed[order]
+    # Début de chaque cellule dans l'ordre trié (np.unique trierait une seconde fois)
+    starts = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1])))
+    keys = ordered[starts]
+    counts = np.diff(np.append(starts, len(ordered)))
+    first = order[starts]
+    key_level = level[first]
+    key_x = cell_x[first]
+    key_y = cell_y[first]
+
+    pairs_i = []
+    pairs_j = []
+    for dx, dy in _HALF_NEIGHBOURHOOD:
+        neighbour = (key_level << 42) | (((key_x + dx) & 0x1FFFFF) << 21) | ((key_y + dy) & 0x1FFFFF)
+        found = np.minimum(np.searchsorted(keys, neighbour), len(keys) - 1)
+        valid = np.flatnonzero(keys[found] == neighbour)
+        cells_a = valid
+        cells_b = found[valid]
+        sizes = counts[cells_a] * counts[cells_b]
+        total = int(sizes.sum())
+        if total == 0:
+            continue
+        # Pour chaque couple de cellules, toutes les combinaisons de membres
+        group = np.repeat(np.arange(len(cells_a)), sizes)
+        local = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        width = counts[cells_b][group]
+        member_a = starts[cells_a][group] + local // width
+        member_b = starts[cells_b][group] + local % width
+        if dx == 0 and dy == 0:
+            keep = member_a < member_b
+            member_a = member_a[keep]
+            member_b = member_b[keep]
+        pairs_i.append(order[member_a])
+        pairs_j.append(order[member_b])
+
+    if not pairs_i:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+class ConflictProbe:
+    """
+    Sonde de conflits appelée par GameManager à chaque tick.
+
+    Args:
+        horizon: Durée de projection en secondes
+        separation: Distance en dessous de laquelle une approche est un conflit
+        max_conflicts: Nombre maximal de conflits publiés (les plus proches
+            dans le temps)
+    """
+
+    # Distance parcourue pendant une fenêtre de recherche, en multiples de
+    # separation : des fenêtres plus longues font moins de passes, mais
+    # des cellules plus grandes et plus de paires candidates
+    WINDOW_TRAVEL = 2
+    # En dessous, une seule passe (toutes les paires voisines) coûte moins
+    # que plusieurs fenêtres
+    WINDOWED_FLEET = 500
+    # Ticks d'une tranche du premier passage sur les virages (_curved_cpa)
+    CURVE_CHUNK = 8
+
+    def __init__(self, horizon=10.0, separation=Airplane.COLLISION_DISTANCE, max_conflicts=50):
+        self.horizon = horizon
+        self.separation = separation
+        self.max_conflicts = max_conflicts
+
+    def _columns(self, game_manager):
+        """Colonnes des avions, depuis la flotte ou depuis les objets"""
+        fleet = game_manager.fleet
+        if fleet is not None:
+            state = fleet.column('state')
+            return (fleet.airplanes, fleet.column('x'), fleet.column('y'),
+                    fleet.column('level').astype(np.int64), fleet.column('speed'),
+                    fleet.column('heading'), fleet.column('fuel'),
+                    state == fleet.LANDING, state == fleet.HOLDING, state == fleet.LANDED,
+                    fleet.column('landing_target_x'), fleet.column('landing_target_y'))
+
+        airplanes = game_manager.airplanes
+        count = len(airplanes)
+        # Sans flotte, les valeurs sont dans le __dict__ de chaque avion :
+        # on évite le descripteur _FleetColumn, appelé 11 fois par avion
+        values = [airplane.__dict__ for airplane in airplanes]
+
+        def column(name, dtype=np.float64):
+            return np.fromiter((value[name] for value in values), dtype, count)
+
+        def target(name):
+            return np.fromiter((math.nan if value[name] is None else value[name]
+                                for value in values), np.float64, count)
+
+        states = [value['state'] for value in values]
+        return (airplanes, column('x'), column('y'), column('level', np.int64),
+                column('speed'), column('heading'), column('fuel'),
+                np.fromiter((state == AirplaneState.LANDING for state in states), np.bool_, count),
+                np.fromiter((state == AirplaneState.HOLDING for state in states), np.bool_, count),
+                np.fromiter((state == AirplaneState.LANDED for state in states), np.bool_, count),
+                target('landing_target_x'), target('landing_target_y'))
+
+    def predict(self, game_manager, dt):
+        """
+        Returns:
+            Liste de PredictedConflict triée par instant de plus proche approche
+        """
+        if len(game_manager.airplanes) < 2:
+            return []
+        (airplanes, x, y, level, speed, heading, fuel,
+         landing, holding, landed, target_x, target_y) = self._columns(game_manager)
+
+        horizon = self.horizon
+        ticks = max(1, int(math.ceil(horizon / dt)))
+        zone_x = game_manager.landing_zone_x
+        zone_y = game_manager.landing_zone_y
+        zone_radius = game_manager.landing_zone_radius
+
+        # Vitesses en pixels par seconde (Airplane.update avance de speed * dt * 0.1)
+        velocity = np.where(holding, 0.0, speed * 0.1)
+        heading_rad = np.radians(heading)
+        vx = np.sin(heading_rad) * velocity
+        vy = -np.cos(heading_rad) * velocity
+        # Fin de trajectoire : panne sèche, ou atterrissage pour les avions en approche
+        end = np.where(landed, -1.0, fuel / Airplane.FUEL_CONSUMPTION_RATE)
+
+        # Début de la phase rectiligne : 0 sauf pour les avions qui virent
+        start_time = np.zeros(len(x))
+        start_x = x.copy()
+        start_y = y.copy()
+
+        turning = np.flatnonzero(landing & ~holding & ~landed & (level == Airplane.LEVEL_1) &
+                                 ~np.isnan(target_x))
+        turn_path = None
+        if len(turning):
+            turn_path, turn_ticks, turn_end = self._propagate_turns(
+                x[turning], y[turning], heading[turning], speed[turning],
+                target_x[turning], target_y[turning], zone_x, zone_y, zone_radius, dt, ticks)
+            last = turn_path[turn_ticks, np.arange(len(turning))]
+            start_time[turning] = turn_ticks * dt
+            start_x[turning] = last[:, 0]
+            start_y[turning] = last[:, 1]
+            final_heading = last[:, 2]
+            vx[turning] = np.sin(np.radians(final_heading)) * velocity[turning]
+            vy[turning] = -np.cos(np.radians(final_heading)) * velocity[turning]
+            arrival = np.where(np.isinf(turn_end),
+                               start_time[turning] + self._arrival_time(
+                                   start_x[turning], start_y[turning], vx[turning],
+                                   vy[turning], zone_x, zone_y, zone_radius),
+                               turn_end)
+            end[turning] = np.minimum(end[turning], arrival)
+
+        # Phase rectiligne, en forme close : p(t) = origin + v * t pour t >= start_time
+        origin_x = start_x - vx * start_time
+        origin_y = start_y - vy * start_time
+
+        first, second = self._candidates(level, origin_x, origin_y, vx, vy, velocity,
+                                         horizon, dt, turning, turn_path, start_time)
+        if len(first) == 0:
+            return []
+
+        rel_x = origin_x[second] - origin_x[first]
+        rel_y = origin_y[second] - origin_y[first]
+        rel_vx = vx[second] - vx[first]
+        rel_vy = vy[second] - vy[first]
+        linear_from = np.maximum(start_time[first], start_time[second])
+        until = np.minimum(np.minimum(end[first], end[second]), horizon)
+
+        speed_squared = rel_vx * rel_vx + rel_vy * rel_vy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cpa_time = np.where(speed_squared > 0,
+                                -(rel_x * rel_vx + rel_y * rel_vy) / speed_squared, 0.0)
+        cpa_time = np.clip(cpa_time, linear_from, np.maximum(until, linear_from))
+        dx = rel_x + rel_vx * cpa_time
+        dy = rel_y + rel_vy * cpa_time
+        cpa_distance = dx * dx + dy * dy
+        cpa_distance[until < linear_from] = np.inf
+
+        # Paires dont un avion vire : les premiers ticks sont comparés
+        # point par point sur les trajectoires propagées
+        if turn_path is not None:
+            curved = np.flatnonzero(linear_from > 0)
+            if len(curved):
+                self._curved_cpa(curved, first, second, turning, turn_path,
+                                 origin_x, origin_y, vx, vy, start_time, linear_from, until,
+                                 dt, self.separation, cpa_time, cpa_distance)
+
+        limit = self.separation * self.separation
+        hits = np.flatnonzero(cpa_distance < limit)
+        if len(hits) == 0:
+            return []
+        hits = hits[np.lexsort((cpa_distance[hits], cpa_time[hits]))][:self.max_conflicts]
+
+        conflicts = []
+        for pair in hits.tolist():
+            i = first[pair]
+            j = second[pair]
+            t = cpa_time[pair]
+            position_i = self._position(i, t, turning, turn_path, origin_x, origin_y,
+                                        vx, vy, start_time, dt)
+            position_j = self._position(j, t, turning, turn_path, origin_x, origin_y,
+                                        vx, vy, start_time, dt)
+            conflicts.append(PredictedConflict(
+                float(t), math.sqrt(cpa_distance[pair]),
+                (airplanes[i].id, airplanes[j].id), int(level[i]),
+                (position_i[0] + position_j[0]) / 2, (position_i[1] + position_j[1]) / 2))
+        return conflicts
+
+    def _candidates(self, level, x, y, vx, vy, velocity, horizon, dt,
+                    turning, turn_path, start_time):
+        """
+        Paires d'avions (indices, i < j) pouvant passer à moins de
+        separation pendant l'horizon.
+
+        L'horizon est découpé en fenêtres assez courtes pour qu'un avion y
+        parcoure au plus separation : deux avions qui se rapprochent à
+        moins de separation pendant une fenêtre sont, au milieu de celle-ci,
+        à moins de separation + vitesse max * durée de la fenêtre, donc dans
+        des cellules voisines de cette taille. Les cellules restent petites
+        quelle que soit la longueur de l'horizon. Un avion qui vire est pris
+        sur son chemin propagé, au tick qui précède le milieu de la
+        fenêtre : un tick de déplacement de plus dans la taille des cellules.
+
+        Args:
+            x, y: Origine de la phase rectiligne (position à l'instant 0
+                prolongée en arrière pour un avion qui vire)
+        """
+        planes = np.arange(len(x))
+        fastest = float(velocity.max())
+        windows = 1
+        if fastest > 0 and len(planes) >= self.WINDOWED_FLEET:
+            windows = max(1, min(int(math.ceil(fastest * horizon /
+                                               (self.WINDOW_TRAVEL * self.separation))),
+                                 int(math.ceil(horizon / dt))))
+        window = horizon / windows
+        reach = self.separation + fastest * window
+        if turn_path is not None:
+            reach += fastest * dt
+            turn_start = start_time[turning]
+        keys = []
+        for index in range(windows):
+            middle = (index + 0.5) * window
+            middle_x = x + vx * middle
+            middle_y = y + vy * middle
+            if turn_path is not None:
+                bending = middle < turn_start
+                tick = min(int(middle / dt), len(turn_path) - 1)
+                middle_x[turning[bending]] = turn_path[tick, bending, 0]
+                middle_y[turning[bending]] = turn_path[tick, bending, 1]
+            cell_x = np.floor(middle_x / reach).astype(np.int64)
+            cell_y = np.floor(middle_y / reach).astype(np.int64)
+            i, j = _cell_pairs(level, cell_x, cell_y)
+            if windows == 1:
+                return np.minimum(i, j), np.maximum(i, j)
+            if len(i):
+                keys.append(np.minimum(i, j) * len(planes) + np.maximum(i, j))
+        if not keys:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        # Une paire vue dans plusieurs fenêtres n'est gardée qu'une fois
+        keys = np.sort(np.concatenate(keys))
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+        return keys // len(planes), keys % len(planes)
+
+    @staticmethod
+    def _propagate_turns(x, y, heading, speed, target_x, target_y,
+                         zone_x, zone_y, zone_radius, dt, ticks):
+        """
+        Rejoue tick par tick, pour tous les avions à la fois, le virage
+        d'approche de Airplane.update. La boucle s'arrête dès que tous sont
+        alignés sur leur cible ou arrivés dans la zone : au plus
+        180 / TURN_RATE ticks pour un virage normal, ticks au pire.
+
+        Returns:
+            (chemin (ticks+1, n, 3) de x, y, cap ; tick d'alignement par
+            avion ; instant d'arrivée dans la zone pendant le virage ou inf)
+        """
+        count = len(x)
+        step = speed * dt * 0.1
+        path = [np.stack([x, y, heading], axis=1)]
+        aligned_at = np.full(count, ticks)
+        arrival = np.full(count, np.inf)
+        turning = np.ones(count, dtype=bool)
+        turn_rate = Airplane.TURN_RATE
+        radius_squared = zone_radius * zone_radius
+
+        for tick in range(1, ticks + 1):
+            target_heading = np.degrees(np.arctan2(target_x - x, -(target_y - y))) % 360
+            heading_diff = (target_heading - heading + 180) % 360 - 180
+            snapping = np.abs(heading_diff) <= turn_rate
+            heading = np.where(snapping, target_heading,
+                               heading + np.where(heading_diff > 0, turn_rate, -turn_rate)) % 360
+            heading_rad = np.radians(heading)
+            x = x + np.sin(heading_rad) * step
+            y = y - np.cos(heading_rad) * step
+            path.append(np.stack([x, y, heading], axis=1))
+
+            in_zone = (x - zone_x) ** 2 + (y - zone_y) ** 2 <= radius_squared
+            arrived = turning & in_zone
+            arrival[arrived] = tick * dt
+            newly_aligned = turning & (snapping | arrived)
+            aligned_at[newly_aligned] = tick
+            turning &= ~newly_aligned
+            if not turning.any():
+                break
+
+        path = np.array(path)
+        return path, np.minimum(aligned_at, len(path) - 1), arrival
+
+    @staticmethod
+    def _arrival_time(x, y, vx, vy, zone_x, zone_y, zone_radius):
+        """Instant où une trajectoire rectiligne entre dans la zone (inf si jamais)"""
+        rel_x = x - zone_x
+        rel_y = y - zone_y
+        a = vx * vx + vy * vy
+        b = 2 * (rel_x * vx + rel_y * vy)
+        c = rel_x * rel_x + rel_y * rel_y - zone_radius * zone_radius
+        discriminant = b * b - 4 * a * c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            root = (-b - np.sqrt(np.maximum(discriminant, 0))) / (2 * a)
+        return np.where(c <= 0, 0.0,
+                        np.where((discriminant >= 0) & (a > 0) & (root >= 0), root, np.inf))
+
+    @classmethod
+    def _curved_cpa(cls, curved, first, second, turning, turn_path, origin_x, origin_y,
+                    vx, vy, start_time, linear_from, until, dt, separation,
+                    cpa_time, cpa_distance):
+        """
+        Complète cpa_time/cpa_distance sur la partie en virage des paires.
+
+        Chaque paire n'est échantillonnée que sur ses propres ticks, jusqu'au
+        début de sa phase rectiligne, et tous les points de toutes les paires
+        sont calculés ensemble, à plat. Un premier passage ne regarde que le
+        début de chaque tranche de CURVE_CHUNK ticks : une tranche où les
+        deux avions sont trop loin pour passer à moins de separation n'est
+        pas détaillée.
+        """
+        path_ticks = len(turn_path) - 1
+        turn_index = np.full(len(origin_x), -1)
+        turn_index[turning] = np.arange(len(turning))
+        tick_times = np.arange(path_ticks + 1) * dt
+
+        def squared_gap(pairs, tick):
+            # Ligne droite, remplacée par le chemin propagé tant que l'avion vire
+            times = tick_times[tick]
+            gap = []
+            for planes in (first[curved][pairs], second[curved][pairs]):
+                px = origin_x[planes] + vx[planes] * times
+                py = origin_y[planes] + vy[planes] * times
+                index = turn_index[planes]
+                bending = np.flatnonzero((index >= 0) & (times < start_time[planes]))
+                px[bending] = turn_path[tick[bending], index[bending], 0]
+                py[bending] = turn_path[tick[bending], index[bending], 1]
+                gap.append((px, py))
+            (x1, y1), (x2, y2) = gap
+            return (x2 - x1) ** 2 + (y2 - y1) ** 2
+
+        limit = np.minimum(np.minimum(linear_from[curved], until[curved]), path_ticks * dt)
+        counts = np.searchsorted(tick_times, limit, side='right')
+
+        # Tranches : début et longueur, paire par paire dans l'ordre
+        chunk = cls.CURVE_CHUNK
+        chunks = -(-counts // chunk)
+        chunk_pair = np.repeat(np.arange(len(curved)), chunks)
+        chunk_start = (np.arange(len(chunk_pair)) -
+                       np.repeat(np.cumsum(chunks) - chunks, chunks)) * chunk
+        chunk_length = np.minimum(chunk, counts[chunk_pair] - chunk_start)
+        i = first[curved][chunk_pair]
+        j = second[curved][chunk_pair]
+        closing = np.hypot(vx[i], vy[i]) + np.hypot(vx[j], vy[j])
+        reach = separation + closing * (chunk_length - 1) * dt
+        near = squared_gap(chunk_pair, chunk_start) <= reach * reach
+        if not near.any():
+            return
+
+        lengths = chunk_length[near]
+        pair = np.repeat(chunk_pair[near], lengths)
+        tick = (np.repeat(chunk_start[near], lengths) + np.arange(len(pair)) -
+                np.repeat(np.cumsum(lengths) - lengths, lengths))
+        squared = squared_gap(pair, tick)
+
+        # Premier tick du minimum de chaque paire, comme argmin
+        starts = np.flatnonzero(np.concatenate(([True], pair[1:] != pair[:-1])))
+        sampled = pair[starts]
+        best = np.full(len(curved), np.inf)
+        best[sampled] = np.minimum.reduceat(squared, starts)
+        at_best = np.flatnonzero(squared == best[pair])
+        at_best = at_best[np.concatenate(([True], pair[at_best][1:] != pair[at_best][:-1]))]
+        best_tick = np.zeros(len(curved), dtype=np.int64)
+        best_tick[pair[at_best]] = tick[at_best]
+
+        better = best < cpa_distance[curved]
+        cpa_distance[curved[better]] = best[better]
+        cpa_time[curved[better]] = tick_times[best_tick[better]]
+
+    @staticmethod
+    def _position(plane, t, turning, turn_path, origin_x, origin_y, vx, vy, start_time, dt):
+        if turn_path is not None and t < start_time[plane]:
+            index = int(np.searchsorted(turning, plane))
+            tick = min(int(round(t / dt)), len(turn_path) - 1)
+            return float(turn_path[tick, index, 0]), float(turn_path[tick, index, 1])
+        return (float(origin_x[plane] + vx[plane] * t),
+                float(origin_y[plane] + vy[plane] * t))
@@ -0,0 +1,80 @@
+from models.airplane import Airplane
+
+
+def closest_approach(airplane1, airplane2):
+    """
+    Carré de la distance minimale entre deux avions pendant le dernier pas,
+    chacun allant en ligne droite de (prev_x, prev_y) à (x, y).
+    """
+    start_x = airplane1.prev_x - airplane2.prev_x
+    start_y = airplane1.prev_y - airplane2.prev_y
+    move_x = (airplane1.x - airplane2.x) - start_x
+    move_y = (airplane1.y - airplane2.y) - start_y
+    length = move_x * move_x + move_y * move_y
+    t = 0.0
+    if length > 0:
+        t = max(0.0, min(1.0, -(start_x * move_x + start_y * move_y) / length))
+    dx = start_x + t * move_x
+    dy = start_y + t * move_y
+    return dx * dx + dy * dy
+
+
+class ConflictTable:
+    """
+    Conflits calculés une fois par tick par GameManager.
+
+    - near_pairs : paires d'ids (plus petit id en premier) à moins de
+      SAFE_DISTANCE sur un même niveau
+    - collision_pairs : paires d'avions à moins de COLLISION_DISTANCE
+    - danger_ids : ids des avions ayant au moins un voisin proche
+
+    L'affichage lit cette table au lieu de comparer chaque avion à toute
+    la flotte.
+    """
+
+    def __init__(self, near_pairs=frozenset(), collision_pairs=(), danger_ids=frozenset()):
+        self.near_pairs = near_pairs
+        self.collision_pairs = collision_pairs
+        self.danger_ids = danger_ids
+
+    @classmethod
+    def build(cls, grid, motion=0.0):
+        """
+        Args:
+            motion: Distance maximale parcourue par un avion pendant le
+                dernier pas. Les collisions sont alors cherchées sur tout le
+                segment parcouru (point de plus proche approche) et pas
+                seulement aux positions finales : deux avions rapides ne
+                peuvent plus se traverser entre deux ticks, même à grand pas.
+        """
+        near_pairs = set()
+        danger_ids = set()
+        collision_pairs = []
+        safe_limit = Airplane.SAFE_DISTANCE ** 2
+        collision_limit = Airplane.COLLISION_DISTANCE ** 2
+        # Deux avions qui se sont approchés à moins de COLLISION_DISTANCE
+        # pendant le pas finissent à moins de COLLISION_DISTANCE + 2 * motion
+        sweep_limit = (Airplane.COLLISION_DISTANCE + 2 * motion) ** 2
+        radius = max(Airplane.SAFE_DISTANCE, Airplane.COLLISION_DISTANCE + 2 * motion)
+
+        for airplane1, airplane2, squared in grid.pairs_with_distance(radius):
+            if squared < safe_limit:
+                id1 = airplane1.id
+                id2 = airplane2.id
+                near_pairs.add((id1, id2) if id1 < id2 else (id2, id1))
+                danger_ids.add(id1)
+                danger_ids.add(id2)
+            if squared < collision_limit:
+                collision_pairs.append((airplane1, airplane2))
+            elif motion and squared < sweep_limit and \
+                    closest_approach(airplane1, airplane2) < collision_limit:
+                collision_pairs.append((airplane1, airplane2))
+
+        return cls(frozenset(near_pairs), tuple(collision_pairs), frozenset(danger_ids))
+
+    def is_in_danger_zone(self, airplane_id):
+        return airplane_id in self.danger_ids
+
+    def ended_pairs(self, previous):
+        """Paires proches au tick précédent qui ne le sont plus"""
+        return previous.near_pairs - self.near_pairs
@@ -0,0 +1,61 @@
+from models.airplane import AirplaneState
+
+
+class NoOpController:
+    """Contrôleur qui ne donne aucune instruction"""
+
+    def update(self, game_manager, dt):
+        pass
+
+
+class AutoLandController:
+    """
+    Contrôleur scripté simple : à intervalle régulier, fait descendre
+    chaque avion vers le niveau 1 quand le niveau inférieur est dégagé,
+    puis lui donne l'ordre d'atterrir. Un avion trop proche d'un autre
+    remonte d'un niveau si possible.
+
+    Les ordres sont envoyés en un seul lot par GameManager.queue_commands,
+    comme ceux du joueur : ils sont appliqués au début du tick suivant et
+    une partie pilotée se rejoue donc à l'identique.
+    """
+
+    def __init__(self, interval=2.0):
+        self.interval = interval
+        self._timer = 0
+
+    def update(self, game_manager, dt):
+        self._timer += dt
+        if self._timer < self.interval:
+            return
+        self._timer = 0
+
+        grid = game_manager.grid
+        commands = []
+        for airplane in game_manager.airplanes:
+            if grid.has_neighbour(airplane, airplane.SAFE_DISTANCE):
+                if airplane.level < airplane.MAX_LEVEL:
+                    commands.append((airplane.id, 'climb', ()))
+                continue
+            if airplane.state in (AirplaneState.LANDING, AirplaneState.LANDED):
+                continue
+            if airplane.level > airplane.MIN_LEVEL:
+                if not self._is_level_busy(grid, airplane, airplane.level - 1):
+                    commands.append((airplane.id, 'descend', ()))
+            else:
+                commands.append((airplane.id, 'land', ()))
+        game_manager.queue_commands(commands)
+
+    @staticmethod
+    def _is_level_busy(grid, airplane, level):
+        limit = airplane.SAFE_DISTANCE * 2
+        for other in grid.query(level, airplane.x, airplane.y, limit):
+            if airplane.distance_to(other) < limit:
+                return True
+        return False
+
+
+CONTROLLERS = {
+    'noop': NoOpController,
+    'autoland': AutoLandController,
+}
@@ -0,0 +1,36 @@
+class CollisionRing:
+    """
+    Tampon circulaire borné des collisions à animer.
+
+    Chaque entrée garde sa position et son instant d'expiration : le temps
+    restant se calcule à la lecture, sans reconstruire de liste à chaque
+    tick. Au-delà de capacity collisions simultanées, les plus anciennes
+    sont écrasées.
+    """
+
+    def __init__(self, capacity=16, duration=1.0):
+        self.capacity = capacity
+        self.duration = duration
+        self._x = [0.0] * capacity
+        self._y = [0.0] * capacity
+        self._expires = [float('-inf')] * capacity
+        self._next = 0
+
+    def add(self, x, y, now):
+        slot = self._next
+        self._x[slot] = x
+        self._y[slot] = y
+        self._expires[slot] = now + self.duration
+        self._next = (slot + 1) % self.capacity
+
+    def active(self, now):
+        """Collisions encore animées, en tuples (x, y, timer), timer de duration à 0"""
+        for slot in range(self.capacity):
+            timer = self._expires[slot] - now
+            if timer > 0:
+                yield self._x[slot], self._y[slot], timer
+
+    def clear(self):
+        for slot in range(self.capacity):
+            self._expires[slot] = float('-inf')
+        self._next = 0
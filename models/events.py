@@ -0,0 +1,160 @@
+import json
+import sys
+from collections import deque, namedtuple
+from enum import Enum
+
+# Mêmes valeurs que les niveaux du module logging, sans l'importer (~10 ms)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+
+
+class EventType(Enum):
+    SPAWN = "spawn"
+    COMMAND = "command"
+    SELECTION = "selection"
+    APPROACH = "approach"
+    LANDING = "landing"
+    CRASH = "crash"
+    COLLISION = "collision"
+    BOUNCE = "bounce"
+    STATE_CHANGE = "state_change"
+
+
+Event = namedtuple('Event', ['tick', 'time', 'type', 'level', 'message', 'data'])
+
+
+class ConsoleSink:
+    """Affiche les messages des événements à partir d'un niveau donné"""
+
+    def __init__(self, level=INFO, stream=None):
+        self.level = level
+        self.stream = stream
+
+    def write(self, event):
+        print(event.message, file=self.stream or sys.stdout)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class JsonLinesSink:
+    """
+    Écrit les événements dans un fichier JSON lines, par lots.
+
+    Les lignes sont accumulées en mémoire et écrites toutes les batch_size
+    entrées (ou à flush/close) pour ne pas faire d'I/O à chaque tick.
+    """
+
+    def __init__(self, path, level=DEBUG, batch_size=256):
+        self.level = level
+        self.batch_size = batch_size
+        self._file = open(path, 'a', encoding='utf-8')
+        self._pending = []
+
+    def write(self, event):
+        self._pending.append(json.dumps({
+            'tick': event.tick,
+            'time': round(event.time, 3),
+            'type': event.type.value,
+            'level': event.level,
+            'message': event.message,
+            **event.data,
+        }, ensure_ascii=False))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pending:
+            self._file.write('\n'.join(self._pending) + '\n')
+            self._pending.clear()
+        self._file.flush()
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+
+class FeedSink:
+    """
+    Garde les derniers messages pour un fil d'événements dans l'interface.
+
+    `version` augmente à chaque nouveau message : l'interface ne
+    rafraîchit son affichage que lorsqu'elle change.
+    """
+
+    def __init__(self, level=INFO, capacity=50):
+        self.level = level
+        self.lines = deque(maxlen=capacity)
+        self.version = 0
+
+    def write(self, event):
+        minutes = int(event.time // 60)
+        seconds = int(event.time % 60)
+        self.lines.append(f"[{minutes:02d}:{seconds:02d}] {event.message}")
+        self.version += 1
+
+    def snapshot(self):
+        """Copie des messages, lisible depuis un autre thread que l'écrivain"""
+        return tuple(self.lines)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class EventLog:
+    """
+    Canal d'événements structurés du jeu.
+
+    Les événements sont gardés dans un tampon circulaire borné (à partir de
+    buffer_level) et transmis aux sinks dont le niveau est atteint. Un
+    événement que personne n'écoute n'est pas construit : le code appelant
+    teste enabled() avant de formater un message de débogage.
+    """
+
+    def __init__(self, capacity=1000, buffer_level=INFO, sinks=()):
+        self.buffer = deque(maxlen=capacity)
+        self.buffer_level = buffer_level
+        self.sinks = []
+        self._threshold = buffer_level
+        for sink in sinks:
+            self.add_sink(sink)
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+        self._update_threshold()
+
+    def remove_sink(self, sink):
+        self.sinks.remove(sink)
+        self._update_threshold()
+
+    def _update_threshold(self):
+        self._threshold = min([self.buffer_level] + [sink.level for sink in self.sinks])
+
+    def enabled(self, level):
+        return level >= self._threshold
+
+    def emit(self, tick, time, event_type, message, level=INFO, **data):
+        if level < self._threshold:
+            return None
+        event = Event(tick, time, event_type, level, message, data)
+        if level >= self.buffer_level:
+            self.buffer.append(event)
+        for sink in self.sinks:
+            if level >= sink.level:
+                sink.write(event)
+        return event
+
+    def flush(self):
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
@@ -0,0 +1,245 @@
+import numpy as np
+
+from models.airplane import Airplane, AirplaneState
+
+
+class Fleet:
+    """
+    Flotte stockée en colonnes NumPy contiguës (struct-of-arrays).
+
+    Chaque avion rattaché occupe une ligne ; l'objet Airplane n'est plus
+    qu'une vue sur cette ligne. Toute la flotte avance en un seul pas
+    vectorisé avec step(), au lieu d'un appel Airplane.update par avion.
+    """
+
+    COLUMNS = {
+        'x': np.float64,
+        'y': np.float64,
+        'level': np.int8,
+        'speed': np.float64,
+        'heading': np.float64,
+        'fuel': np.float64,
+        'state': np.int8,
+        'has_emergency': np.bool_,
+        'landing_target_x': np.float64,
+        'landing_target_y': np.float64,
+        'prev_x': np.float64,
+        'prev_y': np.float64,
+    }
+
+    # Colonnes internes, sans équivalent sur Airplane
+    INTERNAL_COLUMNS = {
+        'cell': np.int64,  # dernière cellule connue de SpatialGrid.sync_fleet
+        'order': np.int64,  # rang de rattachement, que remove() ne garde pas sur les lignes
+    }
+
+    STATES = tuple(AirplaneState)
+    STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+    FLYING = STATE_CODES[AirplaneState.FLYING]
+    LANDING = STATE_CODES[AirplaneState.LANDING]
+    LANDED = STATE_CODES[AirplaneState.LANDED]
+    HOLDING = STATE_CODES[AirplaneState.HOLDING]
+    EMERGENCY = STATE_CODES[AirplaneState.EMERGENCY]
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        self.airplanes = []  # ligne -> Airplane
+        self._attached = 0  # avions rattachés depuis la création, pour 'order'
+        self._data = {name: np.zeros(capacity, dtype=dtype)
+                      for name, dtype in {**self.COLUMNS, **self.INTERNAL_COLUMNS}.items()}
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def capacity(self):
+        return len(self._data['x'])
+
+    def column(self, name):
+        """Vue sur la partie occupée d'une colonne"""
+        return self._data[name][:self.size]
+
+    def get(self, name, row):
+        value = self._data[name][row]
+        if name == 'state':
+            return self.STATES[value]
+        if name in ('landing_target_x', 'landing_target_y'):
+            return None if np.isnan(value) else float(value)
+        if name == 'has_emergency':
+            return bool(value)
+        if name == 'level':
+            return int(value)
+        return float(value)
+
+    def set(self, name, row, value):
+        if name == 'state':
+            value = self.STATE_CODES[value]
+        elif value is None:
+            value = np.nan
+        self._data[name][row] = value
+
+    def _grow(self):
+        for name, column in self._data.items():
+            grown = np.zeros(len(column) * 2, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            self._data[name] = grown
+
+    def add(self, airplane):
+        """Rattache un avion : ses valeurs sont copiées dans une nouvelle ligne"""
+        if self.size == self.capacity:
+            self._grow()
+        row = self.size
+        values = {name: airplane.__dict__.pop(name) for name in self.COLUMNS}
+        self.size += 1
+        self.airplanes.append(airplane)
+        airplane._fleet = self
+        airplane._row = row
+        for name, value in values.items():
+            self.set(name, row, value)
+        self._data['cell'][row] = -1
+        self._data['order'][row] = self._attached
+        self._attached += 1
+
+    def remove(self, airplane):
+        """Détache un avion ; la dernière ligne prend sa place"""
+        row = airplane._row
+        for name in self.COLUMNS:
+            airplane.__dict__[name] = self.get(name, row)
+        airplane._fleet = None
+        airplane._row = None
+
+        last = self.size - 1
+        if row != last:
+            for column in self._data.values():
+                column[row] = column[last]
+            moved = self.airplanes[last]
+            moved._row = row
+            self.airplanes[row] = moved
+        self.airplanes.pop()
+        self.size -= 1
+
+    def clear(self):
+        for airplane in self.airplanes[::-1]:
+            self.remove(airplane)
+
+    def extend(self, airplanes, columns):
+        """
+        Rattache d'un bloc des avions dont les valeurs sont déjà en colonnes
+        (chargement d'une sauvegarde) : une copie par colonne, sans passer
+        par set() avion par avion.
+
+        Args:
+            airplanes: Avions sans valeurs de colonne dans leur __dict__
+            columns: {nom: tableau} pour chaque nom de COLUMNS, 'state' en codes
+        """
+        count = len(airplanes)
+        while self.size + count > self.capacity:
+            self._grow()
+        start = self.size
+        end = start + count
+        for name in self.COLUMNS:
+            self._data[name][start:end] = columns[name]
+        self._data['cell'][start:end] = -1
+        self._data['order'][start:end] = np.arange(self._attached, self._attached + count)
+        self._attached += count
+        for row, airplane in enumerate(airplanes, start):
+            airplane._fleet = self
+            airplane._row = row
+        self.airplanes.extend(airplanes)
+        self.size = end
+
+    def step(self, dt):
+        """
+        Équivalent vectorisé de Airplane.update pour toute la flotte.
+
+        Returns:
+            Les avions passés en urgence carburant pendant ce pas
+        """
+        if self.size == 0:
+            return []
+
+        x = self.column('x')
+        y = self.column('y')
+        self.column('prev_x')[:] = x
+        self.column('prev_y')[:] = y
+        heading = self.column('heading')
+        speed = self.column('speed')
+        fuel = self.column('fuel')
+        state = self.column('state')
+        has_emergency = self.column('has_emergency')
+        target_x = self.column('landing_target_x')
+        target_y = self.column('landing_target_y')
+
+        active = state != self.LANDED
+        fuel[active] = np.maximum(0, fuel[active] - Airplane.FUEL_CONSUMPTION_RATE * dt)
+
+        emergency = active & (fuel <= Airplane.CRITICAL_FUEL_LEVEL) & ~has_emergency
+        has_emergency[emergency] = True
+        state[emergency] = self.EMERGENCY
+
+        empty = active & (fuel <= 0)
+        state[empty] = self.LANDED
+
+        moving = active & ~empty & (state != self.HOLDING)
+
+        # Virage vers la zone d'atterrissage, limité à TURN_RATE par tick
+        steering = np.flatnonzero(moving & (state == self.LANDING) & ~np.isnan(target_x))
+        if len(steering):
+            dx = target_x[steering] - x[steering]
+            dy = target_y[steering] - y[steering]
+            target_heading = np.degrees(np.arctan2(dx, -dy)) % 360
+            current = heading[steering]
+            heading_diff = (target_heading - current + 180) % 360 - 180
+            turn_rate = Airplane.TURN_RATE
+            heading[steering] = np.where(
+                np.abs(heading_diff) > turn_rate,
+                current + np.where(heading_diff > 0, turn_rate, -turn_rate),
+                target_heading,
+            ) % 360
+
+        moving = np.flatnonzero(moving)
+        heading_rad = np.radians(heading[moving])
+        distance = speed[moving] * dt * 0.1
+        x[moving] += np.sin(heading_rad) * distance
+        y[moving] -= np.cos(heading_rad) * distance
+
+        return [self.airplanes[row] for row in np.flatnonzero(emergency)]
+
+    def classify(self, zone_x, zone_y, zone_radius, min_x, max_x, min_y, max_y):
+        """
+        Repère en un passage les avions à traiter après step().
+
+        Returns:
+            (outcomes, out_of_bounds) : tuples (avion, sans_carburant,
+            dans_zone, niveau_1) pour les avions sans carburant ou en
+            approche, dans l'ordre de rattachement (celui de
+            GameManager.airplanes), et avions hors limites (hors crash et
+            atterrissage)
+        """
+        x = self.column('x')
+        y = self.column('y')
+        fuel = self.column('fuel')
+        level = self.column('level')
+        state = self.column('state')
+        airplanes = self.airplanes
+
+        crashed_mask = fuel <= 0
+        dx = x - zone_x
+        dy = y - zone_y
+        in_zone = dx * dx + dy * dy <= zone_radius * zone_radius
+        at_level_1 = level == Airplane.LEVEL_1
+        landing = ~crashed_mask & (state == self.LANDING)
+        # Crashs et approches mêlés : le score est borné à 0, l'ordre compte
+        rows = np.flatnonzero(crashed_mask | landing)
+        rows = rows[np.argsort(self.column('order')[rows], kind='stable')]
+        outcomes = [(airplanes[row], bool(crashed_mask[row]),
+                     bool(in_zone[row]), bool(at_level_1[row]))
+                    for row in rows]
+
+        landed = landing & in_zone & at_level_1
+        out = ((x < min_x) | (x > max_x) | (y < min_y) | (y > max_y))
+        out_of_bounds = [airplanes[row]
+                         for row in np.flatnonzero(out & ~crashed_mask & ~landed)]
+
+        return outcomes, out_of_bounds
@@ -1,25 +1,101 @@
+import math
 import random
+from collections import namedtuple
+
 from models.airplane import Airplane, AirplaneState
+from models.conflicts import ConflictTable
+from models.effects import CollisionRing
+from models.events import DEBUG, INFO, WARNING, ConsoleSink, EventLog, EventType
+from models.profiling import Profiler
+from models.spatial import SpatialGrid
+from models.spawn import SpawnPlanner
+
+
+class CommandResult(namedtuple('CommandResult', ['airplane_id', 'command', 'applied', 'message'])):
+    """Issue d'un ordre : message de l'événement COMMAND, ou raison du refus"""
+
+    __slots__ = ()
 
 
 class GameManager:
     
-    def __init__(self, radar_width=800, radar_height=600):
+    ENGINES = ('objects', 'fleet')
+    # Commande -> nombre d'arguments numériques attendus
+    COMMAND_ARGS = {'climb': 0, 'descend': 0, 'land': 0, 'hold': 0, 'heading': 1, 'speed': 1}
+    COMMANDS = tuple(COMMAND_ARGS)
+    
+    # Courbe de difficulté : un niveau de plus toutes les DIFFICULTY_PERIOD
+    # secondes, et l'intervalle entre deux apparitions raccourcit de
+    # SPAWN_INTERVAL_STEP par niveau jusqu'à SPAWN_INTERVAL_MIN. Ces valeurs
+    # peuvent être remplacées par instance (voir models.batch).
+    DIFFICULTY_PERIOD = 30
+    SPAWN_INTERVAL_BASE = 7
+    SPAWN_INTERVAL_STEP = 0.7
+    SPAWN_INTERVAL_MIN = 2.5
+    LOW_FUEL_PROBABILITY = 0.1  # au niveau 10 ; proportionnelle au niveau
+    MAX_PENDING_SPAWNS = 5  # apparitions différées faute d'entrée dégagée
+    SELECTION_RADIUS = 30  # distance maximale d'un clic à l'avion sélectionné
+    
+    def __init__(self, radar_width=800, radar_height=600, engine='objects', events=None,
+                 seed=None, conflict_probe=None, profiler=None, history=None):
+        """
+        Args:
+            radar_width, radar_height: Dimensions de l'espace aérien
+            engine: 'objects' (un Airplane.update par avion) ou 'fleet'
+                (flotte vectorisée NumPy, voir models.fleet)
+            events: EventLog recevant les événements du jeu ; par défaut,
+                un journal qui affiche les événements INFO et plus en console
+            seed: Graine du générateur propre à la partie ; tirée au hasard
+                si absente. Avec la même graine et le même journal de
+                commandes, une partie se rejoue à l'identique (models.replay)
+            conflict_probe: Sonde de prédiction (models.conflict_probe) ;
+                ses conflits prévus sont publiés à chaque tick dans
+                predicted_conflicts
+            profiler: Profiler (models.profiling) partagé avec l'affichage ;
+                par défaut, un profiler désactivé
+            history: TrajectoryHistory (models.history) où relever les
+                trajectoires des avions
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Moteur inconnu: {engine}")
         self.radar_width = radar_width
         self.radar_height = radar_height
+        self.engine = engine
+        self.events = events if events is not None else EventLog(sinks=[ConsoleSink(INFO)])
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.command_log = []  # (tick, airplane_id, commande, args)
+        self.pending_commands = []  # lots de queue_commands, appliqués au prochain tick
+        self.command_results = []  # CommandResult du dernier lot appliqué par update
+        self._next_airplane_id = 0
+        self.fleet = None
+        if engine == 'fleet':
+            from models.fleet import Fleet
+            self.fleet = Fleet()
         self.airplanes = []
+        self.airplanes_by_id = {}
+        self.grid = SpatialGrid()
+        self.conflicts = ConflictTable()
+        self.step_motion = 0.0  # distance maximale parcourue au dernier pas
+        self.conflict_probe = conflict_probe
+        self.predicted_conflicts = []
+        self.history = history
         self.score = 0
         self.best_score = 0  
         self.lives = 3
         self.planes_landed = 0
         self.collisions_avoided = 0
         self.game_time = 0
+        self.tick = 0
         self.difficulty_level = 1
         self.spawn_timer = 8  
         self.spawn_interval = 5  
         self.game_over = False
-        self.selected_airplane = None
-        self.collision_positions = []  
+        self.selected_id = None  # seul l'identifiant est retenu, pas un drapeau par avion
+        self.collision_positions = CollisionRing()
+        self.spawn_planner = SpawnPlanner(radar_width, radar_height, self.seed)
+        self.pending_spawns = 0
         
         
         for _ in range(8):
@@ -34,23 +110,88 @@ class GameManager:
         if self.game_over:
             return
         
+        # Chaque phase est chronométrée si le profilage est actif (models.profiling)
+        profiler = self.profiler
+        start = mark = profiler.start()
+        
+        if self.pending_commands:
+            self._apply_pending_commands()
+            mark = profiler.lap('update.commands', mark)
+        
+        self._update_schedule(dt)
+        mark = profiler.lap('update.spawn', mark)
+        
+        if self.fleet is not None:
+            mark = self._update_fleet(dt, mark)
+        else:
+            mark = self._update_objects(dt, mark)
+        
+        self._sync_grid()
+        mark = profiler.lap('update.grid', mark)
+        self._check_collisions()
+        mark = profiler.lap('update.collisions', mark)
+        
+        if self.conflict_probe is not None:
+            self.predicted_conflicts = self.conflict_probe.predict(self, dt)
+            mark = profiler.lap('update.probe', mark)
+        
+        if self.history is not None:
+            self.history.record(self)
+            mark = profiler.lap('update.history', mark)
+        
+        if self.lives <= 0:
+            self.game_over = True
+        profiler.lap('update', start)
+    
+    def _update_schedule(self, dt):
+        """Horloge, difficulté et apparitions du tick"""
+        self.tick += 1
         self.game_time += dt
+        self.step_motion = Airplane.MAX_SPEED * dt * 0.1
         self.spawn_timer += dt
         
         
-        new_difficulty = 1 + int(self.game_time / 30)  
+        new_difficulty = 1 + int(self.game_time / self.DIFFICULTY_PERIOD)
         if new_difficulty > self.difficulty_level:
             self.difficulty_level = new_difficulty
-            self.spawn_interval = max(2.5, 7 - self.difficulty_level * 0.7)  
+            self.spawn_interval = max(
+                self.SPAWN_INTERVAL_MIN,
+                self.SPAWN_INTERVAL_BASE - self.difficulty_level * self.SPAWN_INTERVAL_STEP)
         
         
         if self.spawn_timer >= self.spawn_interval:
             self.spawn_airplane()
             self.spawn_timer = 0
+        elif self.pending_spawns:
+            self._spawn_pending()
+    
+    def emit(self, event_type, message, level=INFO, **data):
+        """Publie un événement daté du tick courant dans self.events"""
+        return self.events.emit(self.tick, self.game_time, event_type, message, level, **data)
+    
+    def _update_objects(self, dt, mark=0):
+        """
+        Avance chaque avion puis traite carburant, approches et sorties.
         
-        for airplane in self.airplanes[:]:
+        Les trois passes sont séparées pour être chronométrées chacune ;
+        les avions n'interagissant pas entre eux pendant ce pas, le
+        résultat est le même qu'en un seul passage.
+        
+        Returns:
+            Nouvelle marque du profiler
+        """
+        profiler = self.profiler
+        airplanes = self.airplanes[:]
+        for airplane in airplanes:
+            had_emergency = airplane.has_emergency
             airplane.update(dt)
             
+            if airplane.has_emergency and not had_emergency:
+                self._on_emergency(airplane)
+        mark = profiler.lap('update.movement', mark)
+        
+        flying = []
+        for airplane in airplanes:
             if airplane.fuel <= 0:
                 self.handle_crash(airplane)
                 continue
@@ -59,81 +200,149 @@ class GameManager:
                 in_zone = self._is_in_landing_zone(airplane)
                 at_level_1 = (airplane.level == 1)
                 
-                print(f"🛬 {airplane.name} en approche - Dans zone: {in_zone}, Niveau 1: {at_level_1}")
-                
-                if in_zone and at_level_1:
-                    self.handle_landing(airplane)
+                if self._check_approach(airplane, in_zone, at_level_1):
                     continue
-                elif not in_zone and not at_level_1:
-                    airplane.state = AirplaneState.FLYING
-                    airplane.landing_target_x = None
-                    airplane.landing_target_y = None
-            
+            flying.append(airplane)
+        mark = profiler.lap('update.landing', mark)
+        
+        for airplane in flying:
             if self._is_out_of_bounds(airplane):
                 self._bounce_airplane(airplane)
-                continue
-        
-        self._check_collisions()
+        return profiler.lap('update.bounds', mark)
+    
+    def _update_fleet(self, dt, mark=0):
+        """Même tick que _update_objects, mais toute la flotte avance en un pas"""
+        profiler = self.profiler
+        for airplane in self.fleet.step(dt):
+            self._on_emergency(airplane)
+        mark = profiler.lap('update.movement', mark)
         
-        self.collision_positions = [
-            {'x': pos['x'], 'y': pos['y'], 'timer': pos['timer'] - dt}
-            for pos in self.collision_positions
-            if pos['timer'] > 0
-        ]
+        margin = 50
+        outcomes, out_of_bounds = self.fleet.classify(
+            self.landing_zone_x, self.landing_zone_y, self.landing_zone_radius,
+            -margin, self.radar_width + margin,
+            -margin, self.radar_height + margin)
+        
+        # Avion par avion comme _update_objects : le score étant borné à 0,
+        # traiter tous les crashs d'abord donnerait un autre score
+        for airplane, crashed, in_zone, at_level_1 in outcomes:
+            if crashed:
+                self.handle_crash(airplane)
+            else:
+                self._check_approach(airplane, in_zone, at_level_1)
+        mark = profiler.lap('update.landing', mark)
         
-        if self.lives <= 0:
-            self.game_over = True
+        for airplane in out_of_bounds:
+            self._bounce_airplane(airplane)
+        return profiler.lap('update.bounds', mark)
+    
+    def _sync_grid(self):
+        """Replace dans l'index spatial les avions qui ont changé de cellule"""
+        if self.fleet is not None:
+            self.grid.sync_fleet(self.fleet)
+        else:
+            self.grid.sync(self.airplanes)
+    
+    def _on_emergency(self, airplane):
+        self.emit(EventType.STATE_CHANGE,
+                  f"🚨 {airplane.name} - Urgence carburant ({int(airplane.fuel)}%)",
+                  WARNING, airplane_id=airplane.id, state=AirplaneState.EMERGENCY.value)
+    
+    def _check_approach(self, airplane, in_zone, at_level_1):
+        """Termine ou annule une approche ; retourne True si l'avion a atterri"""
+        # Message émis à chaque tick : construit seulement si le niveau DEBUG est écouté
+        if self.events.enabled(DEBUG):
+            self.emit(EventType.APPROACH,
+                      f"🛬 {airplane.name} en approche - Dans zone: {in_zone}, Niveau 1: {at_level_1}",
+                      DEBUG, airplane_id=airplane.id, in_zone=in_zone, at_level_1=at_level_1)
+        
+        if in_zone and at_level_1:
+            self.handle_landing(airplane)
+            return True
+        elif not in_zone and not at_level_1:
+            airplane.state = AirplaneState.FLYING
+            airplane.landing_target_x = None
+            airplane.landing_target_y = None
+            self.emit(EventType.STATE_CHANGE,
+                      f"↩️ {airplane.name} - Approche interrompue hors zone, retour en vol normal",
+                      airplane_id=airplane.id, state=AirplaneState.FLYING.value)
+        return False
+    
+    def add_airplane(self, airplane):
+        """Ajoute un avion à l'espace aérien (et à la flotte vectorisée)"""
+        self.airplanes.append(airplane)
+        self.airplanes_by_id[airplane.id] = airplane
+        if self.fleet is not None:
+            self.fleet.add(airplane)
+        self.grid.insert(airplane)
+    
+    def remove_airplane(self, airplane):
+        """Retire un avion de l'espace aérien ; retourne False s'il n'y était plus"""
+        if self.airplanes_by_id.get(airplane.id) is not airplane:
+            return False
+        if self.history is not None:
+            self.history.retire(airplane, self.tick)
+        del self.airplanes_by_id[airplane.id]
+        self.airplanes.remove(airplane)
+        self.grid.remove(airplane)
+        if self.fleet is not None:
+            self.fleet.remove(airplane)
+        if airplane.id == self.selected_id:
+            self.selected_id = None
+        return True
     
     def spawn_airplane(self):
-        """Fait apparaître un nouvel avion"""
-        max_attempts = 10
+        """
+        Fait apparaître un nouvel avion sur un emplacement d'entrée dégagé.
         
-        for attempt in range(max_attempts):
-            edge = random.randint(0, 3)
-            margin = 100
-            
-            if edge == 0:
-                x = random.uniform(margin, self.radar_width - margin)
-                y = margin
-                heading = random.uniform(135, 225)
-            elif edge == 1:
-                x = self.radar_width - margin
-                y = random.uniform(margin, self.radar_height - margin)
-                heading = random.uniform(225, 315)
-            elif edge == 2:
-                x = random.uniform(margin, self.radar_width - margin)
-                y = self.radar_height - margin
-                heading = random.uniform(315, 405) % 360
-            else:
-                x = margin
-                y = random.uniform(margin, self.radar_height - margin)
-                heading = random.uniform(45, 135)
-            
-            level = random.randint(1, 3)
-            speed = random.randint(200, 400)
-            fuel = random.randint(60, 100)
-            
-            if random.random() < 0.1 * self.difficulty_level / 10:
-                fuel = random.randint(5, 20)
-            
-            temp_airplane = Airplane(x=x, y=y, level=level, speed=speed, 
-                              heading=heading, fuel=fuel)
-            
-            too_close = False
-            for existing in self.airplanes:
-                if existing.level == temp_airplane.level:
-                    distance = temp_airplane.distance_to(existing)
-                    if distance < 150:
-                        too_close = True
-                        break
-            
-            if not too_close:
-                self.airplanes.append(temp_airplane)
-                return
+        S'il n'y en a aucun, l'apparition est mise en attente
+        (pending_spawns) et retentée aux ticks suivants au lieu de créer un
+        avion en conflit immédiat.
         
-        airplane = Airplane(x=x, y=y, level=level, speed=speed, 
-                          heading=heading, fuel=fuel)
-        self.airplanes.append(airplane)
+        Returns:
+            L'avion créé, ou None si l'apparition est différée
+        """
+        airplane = self._spawn_from_planner()
+        if airplane is None and self.pending_spawns < self.MAX_PENDING_SPAWNS:
+            self.pending_spawns += 1
+            if self.events.enabled(DEBUG):
+                self.emit(EventType.SPAWN,
+                          f"⏳ Aucune entrée dégagée, apparition différée ({self.pending_spawns} en attente)",
+                          DEBUG, pending=self.pending_spawns)
+        return airplane
+    
+    def _spawn_pending(self):
+        """Une apparition en attente par tick, dès qu'une entrée se libère"""
+        if self.pending_spawns and self._spawn_from_planner() is not None:
+            self.pending_spawns -= 1
+    
+    def _spawn_from_planner(self):
+        slot = self.spawn_planner.plan(self.grid, self.rng)
+        if slot is None:
+            return None
+        level, x, y, heading = slot
+        
+        speed = self.rng.randint(200, 400)
+        fuel = self.rng.randint(60, 100)
+        if self.rng.random() < self.LOW_FUEL_PROBABILITY * self.difficulty_level / 10:
+            fuel = self.rng.randint(5, 20)
+        
+        airplane = Airplane(x=x, y=y, level=level, speed=speed, heading=heading, fuel=fuel,
+                            airplane_id=self._new_airplane_id(), rng=self.rng)
+        self.add_airplane(airplane)
+        self._on_spawn(airplane)
+        return airplane
+    
+    def _new_airplane_id(self):
+        self._next_airplane_id += 1
+        return self._next_airplane_id
+    
+    def _on_spawn(self, airplane):
+        if self.events.enabled(DEBUG):
+            self.emit(EventType.SPAWN,
+                      f"✈️ {airplane.name} entre dans l'espace aérien au niveau {airplane.level}",
+                      DEBUG, airplane_id=airplane.id, x=airplane.x, y=airplane.y,
+                      flight_level=airplane.level, fuel=airplane.fuel)
     
     def _is_in_landing_zone(self, airplane):
         dx = airplane.x - self.landing_zone_x
@@ -147,8 +356,6 @@ class GameManager:
                 airplane.y < -margin or airplane.y > self.radar_height + margin)
     
     def _bounce_airplane(self, airplane):
-        import math
-
         margin = 50
 
         if airplane.x < -margin:
@@ -174,21 +381,35 @@ class GameManager:
             airplane.state = AirplaneState.FLYING
             airplane.landing_target_x = None
             airplane.landing_target_y = None
+
+        if self.events.enabled(DEBUG):
+            self.emit(EventType.BOUNCE,
+                      f"↪️ {airplane.name} renvoyé vers le centre (cap {int(new_heading)}°)",
+                      DEBUG, airplane_id=airplane.id, heading=new_heading)
     
     def _check_collisions(self):
-        collided_pairs = []
-        
-        for i, airplane1 in enumerate(self.airplanes):
-            for airplane2 in self.airplanes[i+1:]:
-                if airplane1.is_too_close(airplane2):
-                    collided_pairs.append((airplane1, airplane2))
+        previous = self.conflicts
+        # Table des conflits du tick, calculée sur l'index spatial ; les
+        # collisions sont testées sur les segments parcourus pendant le pas
+        self.conflicts = ConflictTable.build(self.grid, self.step_motion)
 
-        for airplane1, airplane2 in collided_pairs:
-            self.handle_collision(airplane1, airplane2)
-            break  # Une seule collision par frame pour éviter les problèmes
+        # Une seule collision par frame pour éviter les problèmes : celle de
+        # la paire aux plus petits ids, pour ne pas dépendre de l'ordre de
+        # l'index spatial (SectorCoordinator fait le même choix)
+        collision = min((sorted(pair, key=lambda airplane: airplane.id)
+                         for pair in self.conflicts.collision_pairs),
+                        key=lambda pair: (pair[0].id, pair[1].id), default=None)
+        if collision is not None:
+            self.handle_collision(*collision)
+        
+        # Une paire qui se sépare sans collision, les deux avions toujours
+        # en vol, est une collision évitée
+        for id1, id2 in self.conflicts.ended_pairs(previous):
+            if id1 in self.grid and id2 in self.grid:
+                self.collisions_avoided += 1
     
     def handle_landing(self, airplane):
-        self.airplanes.remove(airplane)
+        self.remove_airplane(airplane)
         self.planes_landed += 1
 
         base_score = 100
@@ -200,73 +421,179 @@ class GameManager:
         total_points = base_score + fuel_bonus
         self.score += total_points
         
-        print(f"✅ ATTERRISSAGE RÉUSSI! {airplane.name} - +{total_points} points (Score: {self.score})")
-        
-        if airplane == self.selected_airplane:
-            self.selected_airplane = None
+        self.emit(EventType.LANDING,
+                  f"✅ ATTERRISSAGE RÉUSSI! {airplane.name} - +{total_points} points (Score: {self.score})",
+                  airplane_id=airplane.id, points=total_points, score=self.score)
     
     def handle_crash(self, airplane):
-        print(f"\u2b62 CRASH CARBURANT! {airplane.name} est tomb\u00e9 en panne de carburant!")
-        self.airplanes.remove(airplane)
+        self.emit(EventType.CRASH,
+                  f"\u2b62 CRASH CARBURANT! {airplane.name} est tomb\u00e9 en panne de carburant!",
+                  WARNING, airplane_id=airplane.id)
+        self.remove_airplane(airplane)
         self.lives -= 1
         self.score = max(0, self.score - 150)
-        
-        if airplane == self.selected_airplane:
-            self.selected_airplane = None
     
     def handle_collision(self, airplane1, airplane2):
         """Gère une collision entre deux avions"""
-        print(f"💥 COLLISION! {airplane1.name} et {airplane2.name} se sont heurtés au niveau {airplane1.level}!")
-        
         # Stocker la position de la collision pour l'animation
         collision_x = (airplane1.x + airplane2.x) / 2
         collision_y = (airplane1.y + airplane2.y) / 2
-        self.collision_positions.append({'x': collision_x, 'y': collision_y, 'timer': 1.0})
         
-        if airplane1 in self.airplanes:
-            self.airplanes.remove(airplane1)
-        if airplane2 in self.airplanes:
-            self.airplanes.remove(airplane2)
+        self.emit(EventType.COLLISION,
+                  f"💥 COLLISION! {airplane1.name} et {airplane2.name} se sont heurtés au niveau {airplane1.level}!",
+                  WARNING, airplane_ids=[airplane1.id, airplane2.id], flight_level=airplane1.level,
+                  x=collision_x, y=collision_y)
+        self.collision_positions.add(collision_x, collision_y, self.game_time)
+        
+        self.remove_airplane(airplane1)
+        self.remove_airplane(airplane2)
         
         self.lives -= 1
         self.score = max(0, self.score - 300)
-        
-        if airplane1 == self.selected_airplane or airplane2 == self.selected_airplane:
-            self.selected_airplane = None
     
     def select_airplane(self, x, y):
         """
         Sélectionne un avion en cliquant dessus.
         
+        Les candidats viennent de l'index spatial, tous niveaux confondus :
+        un clic ne parcourt que les cellules sous le curseur.
+        
         Args:
             x, y: Coordonnées du clic
         
         Returns:
             L'avion sélectionné ou None
         """
-        # Désélectionner tous les avions
-        for airplane in self.airplanes:
-            airplane.selected = False
-        
-        # Trouver l'avion le plus proche du clic
         closest = None
-        min_dist = 30  # Distance maximale pour la sélection
-        
-        for airplane in self.airplanes:
-            dx = airplane.x - x
-            dy = airplane.y - y
-            dist = (dx*dx + dy*dy) ** 0.5
-            if dist < min_dist:
-                min_dist = dist
-                closest = airplane
-        
-        if closest:
-            closest.selected = True
-            self.selected_airplane = closest
-        else:
-            self.selected_airplane = None
-        
-        return self.selected_airplane
+        min_dist = self.SELECTION_RADIUS * self.SELECTION_RADIUS
+        
+        for level in range(Airplane.MIN_LEVEL, Airplane.MAX_LEVEL + 1):
+            for airplane in self.grid.query(level, x, y, self.SELECTION_RADIUS):
+                dx = airplane.x - x
+                dy = airplane.y - y
+                dist = dx*dx + dy*dy
+                if dist < min_dist:
+                    min_dist = dist
+                    closest = airplane
+        
+        self.selected_id = closest.id if closest is not None else None
+        return closest
+    
+    @property
+    def selected_airplane(self):
+        return self.airplanes_by_id.get(self.selected_id)
+    
+    @selected_airplane.setter
+    def selected_airplane(self, airplane):
+        self.selected_id = airplane.id if airplane is not None else None
+    
+    def apply_command(self, airplane_id, command, *args):
+        """
+        Applique un ordre du joueur (ou d'un contrôleur) à un avion.
+
+        Toutes les commandes passent par ici ou par apply_commands pour être
+        inscrites dans command_log avec le tick courant : c'est ce journal,
+        avec la graine, qui permet de rejouer la partie (voir models.replay).
+
+        Args:
+            airplane_id: Identifiant de l'avion visé
+            command: Une des COMMANDS
+            args: Paramètres de la commande (cap ou vitesse)
+
+        Returns:
+            True si l'avion existe et a reçu l'ordre
+
+        Raises:
+            ValueError: commande inconnue
+        """
+        if command not in self.COMMAND_ARGS:
+            raise ValueError(f"Commande inconnue: {command}")
+        return self._execute(airplane_id, command, args).applied
+
+    def apply_commands(self, commands):
+        """
+        Applique tout de suite un lot d'ordres, dans l'ordre donné.
+
+        Un ordre invalide (avion absent, commande inconnue, mauvais
+        arguments) est refusé sans interrompre le lot.
+
+        Args:
+            commands: Itérable de (airplane_id, commande, args), args étant
+                un tuple (vide pour climb, descend, land et hold)
+
+        Returns:
+            Liste de CommandResult, une par ordre
+        """
+        execute = self._execute
+        return [execute(airplane_id, command, tuple(args)) for airplane_id, command, args in commands]
+
+    def queue_commands(self, commands):
+        """
+        Met un lot d'ordres en attente : ils seront appliqués au début du
+        prochain update, avant tout déplacement, et leurs résultats
+        publiés dans command_results.
+        """
+        self.pending_commands.extend(commands)
+
+    def _apply_pending_commands(self):
+        commands, self.pending_commands = self.pending_commands, []
+        self.command_results = self.apply_commands(commands)
+
+    def _execute(self, airplane_id, command, args):
+        arity = self.COMMAND_ARGS.get(command)
+        if arity is None:
+            return CommandResult(airplane_id, command, False, f"Commande inconnue: {command}")
+        if len(args) != arity or not all(
+                isinstance(arg, (int, float)) and not isinstance(arg, bool) and math.isfinite(arg)
+                for arg in args):
+            return CommandResult(airplane_id, command, False,
+                                 f"{command} attend {arity} argument(s) numérique(s)")
+        airplane = self.airplanes_by_id.get(airplane_id)
+        if airplane is None:
+            return CommandResult(airplane_id, command, False, f"Avion inconnu: {airplane_id}")
+
+        self.command_log.append((self.tick, airplane_id, command, args))
+        message = getattr(self, f'_command_{command}')(airplane, *args)
+        self.emit(EventType.COMMAND, message, airplane_id=airplane_id,
+                  command=command, args=list(args))
+        return CommandResult(airplane_id, command, True, message)
+
+    def _command_climb(self, airplane):
+        old_level = airplane.level
+        airplane.climb()
+        if airplane.level != old_level:
+            return f"⬆️ {airplane.name} - Monté au niveau {airplane.level}"
+        return f"⚠️ {airplane.name} - Déjà au niveau maximum"
+
+    def _command_descend(self, airplane):
+        old_level = airplane.level
+        airplane.descend()
+        if airplane.level != old_level:
+            return f"⬇️ {airplane.name} - Descendu au niveau {airplane.level}"
+        return f"⚠️ {airplane.name} - Déjà au niveau minimum"
+
+    def _command_land(self, airplane):
+        if airplane.state == AirplaneState.LANDING:
+            airplane.land(self.landing_zone_x, self.landing_zone_y)
+            return f"❌ {airplane.name} - Atterrissage annulé, retour en vol normal"
+        if airplane.land(self.landing_zone_x, self.landing_zone_y):
+            return f"🛬 {airplane.name} - Instruction d'atterrissage donnée, direction zone verte"
+        return f"❌ {airplane.name} - Atterrissage impossible! Doit être au niveau 1"
+
+    def _command_hold(self, airplane):
+        if airplane.state == AirplaneState.HOLDING:
+            airplane.hold()
+            return f"▶️ {airplane.name} - Reprise du vol"
+        airplane.hold()
+        return f"⏸️ {airplane.name} - Mis en attente"
+
+    def _command_heading(self, airplane, heading):
+        airplane.change_heading(heading)
+        return f"🧭 {airplane.name} - Nouveau cap {int(airplane.heading)}°"
+
+    def _command_speed(self, airplane, speed):
+        airplane.change_speed(speed)
+        return f"💨 {airplane.name} - Nouvelle vitesse {int(airplane.speed)}"
     
     def get_stats(self):
         """Retourne les statistiques du jeu"""
@@ -279,26 +606,52 @@ class GameManager:
             'best_score': self.best_score,
             'time': self.game_time,
             'landed': self.planes_landed,
+            'avoided': self.collisions_avoided,
             'lives': self.lives,
             'active_planes': len(self.airplanes),
             'difficulty': self.difficulty_level
         }
     
+    def restored(self):
+        """Appelé par models.savegame une fois l'état rechargé"""
+        if self.history is not None:
+            self.history.clear()
+    
+    def close(self):
+        """Libère les ressources du moteur (processus des secteurs, voir models.sectors)"""
+    
     def reset(self):
-        """Réinitialise le jeu"""
+        """Réinitialise le jeu ; la nouvelle partie a sa propre graine"""
+        self.seed = self.rng.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.command_log = []
+        self.pending_commands = []
+        self.command_results = []
+        self._next_airplane_id = 0
         self.airplanes.clear()
+        self.airplanes_by_id.clear()
+        self.grid.clear()
+        self.conflicts = ConflictTable()
+        self.predicted_conflicts = []
+        if self.fleet is not None:
+            self.fleet.clear()
         self.collision_positions.clear()
+        if self.history is not None:
+            self.history.clear()
         # Ne pas réinitialiser best_score
         self.score = 0
         self.lives = 3
         self.planes_landed = 0
         self.collisions_avoided = 0
         self.game_time = 0
+        self.tick = 0
         self.difficulty_level = 1
         self.spawn_timer = 8
         self.spawn_interval = 5
         self.game_over = False
-        self.selected_airplane = None
+        self.selected_id = None
+        self.spawn_planner = SpawnPlanner(self.radar_width, self.radar_height, self.seed)
+        self.pending_spawns = 0
         
         # Respawn des avions initiaux
         for _ in range(8):
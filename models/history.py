@@ -0,0 +1,207 @@
+"""
+Historique borné des trajectoires.
+
+GameManager(history=TrajectoryHistory()) relève la position de chaque avion
+tous les interval ticks dans des tampons circulaires NumPy alloués une fois
+pour toutes. Le radar en tire les traînées des avions, et l'historique
+complet s'exporte en colonnes (.npz) pour analyser un incident après coup :
+
+    game_manager.history.export('trajectoires.npz')
+    columns = load_columns('trajectoires.npz')
+"""
+import threading
+from collections import deque
+
+import numpy as np
+
+
+class TrajectoryHistory:
+    """
+    Derniers points de chaque avion, un tampon circulaire par piste.
+
+    tracks pistes de length points chacune : la mémoire (memory) est fixée
+    à la création, quelle que soit la durée de la partie. La piste d'un
+    avion retiré (atterrissage, crash, collision) est close sur sa dernière
+    position et gardée jusqu'à ce qu'un nouvel avion ait besoin de sa
+    place, les plus anciennes d'abord. Si toutes les pistes sont prises par
+    des avions en vol, les points des autres ne sont pas relevés (dropped).
+
+    La simulation écrit (record, retire) pendant que l'affichage lit
+    (updates) : chaque accès prend lock.
+    """
+
+    COLUMNS = {
+        'x': np.float64,
+        'y': np.float64,
+        'heading': np.float64,
+        'level': np.int8,
+        'tick': np.int64,
+    }
+
+    def __init__(self, tracks=1024, length=64, interval=2):
+        """
+        Args:
+            tracks: Nombre d'avions suivis à la fois, retirés compris
+            length: Points gardés par avion
+            interval: Ticks entre deux relevés (64 points tous les 2 ticks :
+                6,4 s de trajectoire à 20 ticks/s)
+        """
+        self.tracks = tracks
+        self.length = length
+        self.interval = interval
+        self.lock = threading.Lock()
+        self._data = {name: np.zeros((tracks, length), dtype=dtype)
+                      for name, dtype in self.COLUMNS.items()}
+        self._ids = np.full(tracks, -1, dtype=np.int64)
+        self._written = np.zeros(tracks, dtype=np.int64)  # points écrits depuis l'attribution
+        self._retired = np.full(tracks, -1, dtype=np.int64)  # tick du retrait, -1 en vol
+        self.clear()
+
+    @property
+    def memory(self):
+        """Octets occupés par les tampons"""
+        arrays = [*self._data.values(), self._ids, self._written, self._retired]
+        return sum(array.nbytes for array in arrays)
+
+    def clear(self):
+        with self.lock:
+            self._ids.fill(-1)
+            self._written.fill(0)
+            self._retired.fill(-1)
+            self._slots = {}  # id -> piste, retirées comprises
+            self._free = list(range(self.tracks - 1, -1, -1))
+            self._retired_order = deque()  # pistes closes, la plus ancienne en tête
+            self.dropped = 0  # points non relevés faute de piste libre
+
+    def _slot(self, airplane_id):
+        """Piste de l'avion, attribuée au besoin ; -1 si aucune n'est libre"""
+        slot = self._slots.get(airplane_id)
+        if slot is not None:
+            return slot
+        if self._free:
+            slot = self._free.pop()
+        elif self._retired_order:
+            slot = self._retired_order.popleft()
+            del self._slots[int(self._ids[slot])]
+        else:
+            return -1
+        self._slots[airplane_id] = slot
+        self._ids[slot] = airplane_id
+        self._written[slot] = 0
+        self._retired[slot] = -1
+        return slot
+
+    def record(self, game_manager):
+        """Relève la flotte, si le tick courant tombe sur un relevé"""
+        tick = game_manager.tick
+        if tick % self.interval:
+            return
+        fleet = game_manager.fleet
+        airplanes = fleet.airplanes if fleet is not None else game_manager.airplanes
+        count = len(airplanes)
+        if not count:
+            return
+        if fleet is not None:
+            values = {name: fleet.column(name) for name in ('x', 'y', 'heading', 'level')}
+        else:
+            values = {name: np.fromiter((getattr(airplane, name) for airplane in airplanes),
+                                        self.COLUMNS[name], count)
+                      for name in ('x', 'y', 'heading', 'level')}
+
+        with self.lock:
+            slot = self._slot
+            rows = np.fromiter((slot(airplane.id) for airplane in airplanes), np.int64, count)
+            tracked = rows >= 0
+            if not tracked.all():
+                self.dropped += count - int(tracked.sum())
+                rows = rows[tracked]
+                values = {name: column[tracked] for name, column in values.items()}
+            positions = self._written[rows] % self.length
+            for name, column in values.items():
+                self._data[name][rows, positions] = column
+            self._data['tick'][rows, positions] = tick
+            self._written[rows] += 1
+
+    def retire(self, airplane, tick):
+        """Clôt la piste d'un avion retiré du jeu sur sa dernière position"""
+        with self.lock:
+            slot = self._slot(airplane.id)
+            if slot < 0:
+                self.dropped += 1
+                return
+            if self._retired[slot] >= 0:
+                return
+            position = self._written[slot] % self.length
+            for name in ('x', 'y', 'heading', 'level'):
+                self._data[name][slot, position] = getattr(airplane, name)
+            self._data['tick'][slot, position] = tick
+            self._written[slot] += 1
+            self._retired[slot] = tick
+            self._retired_order.append(slot)
+
+    def updates(self, cursors, until_tick=None):
+        """
+        Points relevés depuis la dernière lecture, pour prolonger les traînées.
+
+        Args:
+            cursors: {id: curseur rendu par l'appel précédent, 0 la première fois}
+            until_tick: Ignore les points relevés après ce tick (celui du
+                snapshot affiché)
+
+        Returns:
+            {id: (nouveau curseur, [(x, y), ...])} pour les seuls avions
+            ayant de nouveaux points, du plus ancien au plus récent
+        """
+        length = self.length
+        xs, ys, ticks = self._data['x'], self._data['y'], self._data['tick']
+        result = {}
+        with self.lock:
+            for airplane_id, cursor in cursors.items():
+                slot = self._slots.get(airplane_id)
+                if slot is None:
+                    continue
+                written = int(self._written[slot])
+                index = max(cursor, written - length)
+                points = []
+                while index < written:
+                    position = index % length
+                    if until_tick is not None and ticks[slot, position] > until_tick:
+                        break
+                    points.append((float(xs[slot, position]), float(ys[slot, position])))
+                    index += 1
+                if points:
+                    result[airplane_id] = (index, points)
+        return result
+
+    def columns(self):
+        """
+        Copie de tout l'historique en colonnes : un point par ligne, groupés
+        par avion (id croissant) puis par tick.
+
+        Returns:
+            {'airplane_id', 'tick', 'x', 'y', 'heading', 'level',
+             'retired_tick' (-1 pour un avion encore en vol): tableau NumPy}
+        """
+        parts = {name: [] for name in ('airplane_id', *self.COLUMNS, 'retired_tick')}
+        with self.lock:
+            for airplane_id, slot in sorted(self._slots.items()):
+                written = int(self._written[slot])
+                count = min(written, self.length)
+                order = np.arange(written - count, written) % self.length
+                parts['airplane_id'].append(np.full(count, airplane_id, dtype=np.int64))
+                parts['retired_tick'].append(np.full(count, self._retired[slot], dtype=np.int64))
+                for name, column in self._data.items():
+                    parts[name].append(column[slot, order])
+        dtypes = {'airplane_id': np.int64, 'retired_tick': np.int64, **self.COLUMNS}
+        return {name: np.concatenate(arrays) if arrays else np.empty(0, dtype=dtypes[name])
+                for name, arrays in parts.items()}
+
+    def export(self, path):
+        """Écrit columns() dans une archive NumPy compressée (.npz)"""
+        np.savez_compressed(path, **self.columns())
+
+
+def load_columns(path):
+    """Colonnes d'un historique exporté : {nom: tableau NumPy}"""
+    with np.load(path) as archive:
+        return {name: archive[name] for name in archive.files}
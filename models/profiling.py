@@ -0,0 +1,121 @@
+"""
+Mesure du temps passé dans chaque phase d'un tick.
+
+Un Profiler garde, par phase, les dernières durées mesurées (fenêtre
+glissante) et en tire p50/p95/p99 et un histogramme à la demande. Les
+phases sont chronométrées par tours de piste :
+
+    mark = profiler.start()
+    ...
+    mark = profiler.lap('update.spawn', mark)
+    ...
+    mark = profiler.lap('update.movement', mark)
+
+Désactivé, start() rend 0 et lap() s'arrête au premier test : le coût se
+limite à un appel de méthode par phase.
+"""
+import sys
+import time
+from collections import deque
+
+
+class PhaseStats:
+    """Durées récentes d'une phase, en nanosecondes"""
+
+    def __init__(self, window=1024):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def add(self, elapsed):
+        self.samples.append(elapsed)
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def percentiles(self, *ps):
+        """Percentiles de la fenêtre, en millisecondes"""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return [0.0 for _ in ps]
+        return [ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] / 1e6 for p in ps]
+
+    def histogram(self):
+        """
+        Répartition de la fenêtre par puissances de deux.
+
+        Returns:
+            Liste de (borne supérieure en µs, nombre de mesures), bornes croissantes
+        """
+        buckets = {}
+        for elapsed in list(self.samples):
+            bound = 1 << max(0, (elapsed // 1000).bit_length())
+            buckets[bound] = buckets.get(bound, 0) + 1
+        return sorted(buckets.items())
+
+    def summary(self):
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count / 1e6 if self.count else 0.0,
+            'p50_ms': p50,
+            'p95_ms': p95,
+            'p99_ms': p99,
+            'max_ms': self.max / 1e6,
+        }
+
+
+class Profiler:
+    """
+    Chronomètres par phase, activables à chaud.
+
+    Les marques sont rendues à l'appelant plutôt que gardées dans le
+    Profiler : la simulation et l'affichage le partagent depuis deux threads.
+    """
+
+    def __init__(self, enabled=False, window=1024):
+        self.enabled = enabled
+        self.window = window
+        self.phases = {}
+
+    def start(self):
+        """Marque de départ, 0 si le profilage est désactivé"""
+        return time.perf_counter_ns() if self.enabled else 0
+
+    def lap(self, name, mark):
+        """Enregistre le temps écoulé depuis mark sous name ; retourne la nouvelle marque"""
+        if not mark:
+            return 0
+        now = time.perf_counter_ns()
+        self.record(name, now - mark)
+        return now
+
+    def record(self, name, elapsed):
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats(self.window)
+        stats.add(elapsed)
+
+    def reset(self):
+        self.phases = {}
+
+    def report(self):
+        """{phase: résumé} trié par nom de phase"""
+        return {name: self.phases[name].summary() for name in sorted(self.phases)}
+
+    def dump(self, file=None):
+        """Affiche le rapport sous forme de tableau"""
+        file = file or sys.stdout
+        report = self.report()
+        if not report:
+            print("Aucune mesure (profilage désactivé ?)", file=file)
+            return
+        width = max(len(name) for name in report)
+        print(f"{'phase':{width}}  {'appels':>8}  {'moy':>8}  {'p50':>8}  {'p95':>8}  "
+              f"{'p99':>8}  {'max':>8}  (ms)", file=file)
+        for name, stats in report.items():
+            print(f"{name:{width}}  {stats['count']:8d}  {stats['mean_ms']:8.3f}  "
+                  f"{stats['p50_ms']:8.3f}  {stats['p95_ms']:8.3f}  {stats['p99_ms']:8.3f}  "
+                  f"{stats['max_ms']:8.3f}", file=file)
@@ -0,0 +1,211 @@
+"""
+Enregistrement et rejeu déterministe d'une partie.
+
+Une partie est entièrement déterminée par sa graine, les dimensions du
+radar, le moteur, le pas de temps et le journal des commandes
+(GameManager.command_log). Le rejeu reconstruit la partie sans interface,
+aussi vite que possible, et peut se positionner sur n'importe quel tick
+grâce à des états complets gardés à intervalle régulier.
+
+Exemple :
+    python -m models.run --duration 600 --seed 42 --controller autoland --record partie.json
+    python -m models.replay partie.json
+    python -m models.replay partie.json --seek 6000 --log-level info
+"""
+import argparse
+import copy
+import hashlib
+import json
+import struct
+import time
+from bisect import bisect_right
+
+from models.events import DEBUG, INFO, WARNING, ConsoleSink, EventLog
+from models.game_manager import GameManager
+
+FORMAT_VERSION = 1
+LOG_LEVELS = {'debug': DEBUG, 'info': INFO, 'warning': WARNING}
+
+
+def state_digest(game_manager):
+    """
+    Empreinte SHA-256 de l'état simulé (tick, score, avions au bit près).
+
+    Deux parties avec la même empreinte au même tick sont identiques.
+    """
+    digest = hashlib.sha256()
+    digest.update(struct.pack('<qqqd', game_manager.tick, game_manager.score,
+                              game_manager.planes_landed, game_manager.game_time))
+    digest.update(repr(game_manager.lives).encode())
+    for airplane in game_manager.airplanes:
+        digest.update(struct.pack('<qdddddb', airplane.id, airplane.x, airplane.y,
+                                  airplane.speed, airplane.heading, airplane.fuel,
+                                  airplane.level))
+        digest.update(airplane.state.value.encode())
+    return digest.hexdigest()
+
+
+class Recording:
+    """Tout ce qu'il faut pour rejouer une partie"""
+
+    def __init__(self, seed, radar_width=800, radar_height=600, engine='objects',
+                 dt=0.05, commands=(), ticks=0, digest=None):
+        self.seed = seed
+        self.radar_width = radar_width
+        self.radar_height = radar_height
+        self.engine = engine
+        self.dt = dt
+        self.commands = [tuple(command) for command in commands]
+        self.ticks = ticks
+        self.digest = digest
+
+    @classmethod
+    def from_game(cls, game_manager, dt):
+        """Enregistrement de la partie en cours (depuis le dernier reset)"""
+        return cls(game_manager.seed, game_manager.radar_width, game_manager.radar_height,
+                   game_manager.engine, dt, game_manager.command_log,
+                   game_manager.tick, state_digest(game_manager))
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({
+                'version': FORMAT_VERSION,
+                'seed': self.seed,
+                'radar_width': self.radar_width,
+                'radar_height': self.radar_height,
+                'engine': self.engine,
+                'dt': self.dt,
+                'ticks': self.ticks,
+                'digest': self.digest,
+                # Format compact : [tick, id, commande, [args...]]
+                'commands': [[tick, airplane_id, command, list(args)]
+                             for tick, airplane_id, command, args in self.commands],
+            }, file, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding='utf-8') as file:
+            data = json.load(file)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"Version d'enregistrement non supportée: {data.get('version')}")
+        return cls(data['seed'], data['radar_width'], data['radar_height'], data['engine'],
+                   data['dt'],
+                   [(tick, airplane_id, command, tuple(args))
+                    for tick, airplane_id, command, args in data['commands']],
+                   data['ticks'], data['digest'])
+
+
+class Replayer:
+    """
+    Rejoue un Recording tick par tick.
+
+    Un état complet du jeu est copié tous les keyframe_interval ticks ;
+    seek() repart de l'état gardé le plus proche avant le tick demandé au
+    lieu de tout rejouer depuis le début.
+    """
+
+    def __init__(self, recording, keyframe_interval=1000, events=None):
+        self.recording = recording
+        self.keyframe_interval = keyframe_interval
+        self.events = events if events is not None else EventLog()
+
+        self._commands = {}  # tick -> [(id, commande, args)]
+        for tick, airplane_id, command, args in recording.commands:
+            self._commands.setdefault(tick, []).append((airplane_id, command, args))
+
+        self.game_manager = GameManager(recording.radar_width, recording.radar_height,
+                                        engine=recording.engine, events=self.events,
+                                        seed=recording.seed)
+        self._keyframe_ticks = []
+        self._keyframes = {}
+        self._save_keyframe()
+
+    @property
+    def tick(self):
+        return self.game_manager.tick
+
+    def _copy(self, game_manager):
+        # Le journal d'événements (et ses fichiers) est partagé, pas copié
+        return copy.deepcopy(game_manager, {id(self.events): self.events})
+
+    def _save_keyframe(self):
+        tick = self.game_manager.tick
+        if tick not in self._keyframes:
+            self._keyframes[tick] = self._copy(self.game_manager)
+            self._keyframe_ticks.append(tick)
+
+    def step(self):
+        """Applique les commandes du tick courant puis avance d'un pas"""
+        game_manager = self.game_manager
+        game_manager.apply_commands(self._commands.get(game_manager.tick, ()))
+        game_manager.update(self.recording.dt)
+        if game_manager.tick % self.keyframe_interval == 0:
+            self._save_keyframe()
+
+    def run_to(self, tick):
+        """Avance jusqu'au tick demandé (ou jusqu'au game over)"""
+        while self.game_manager.tick < tick and not self.game_manager.game_over:
+            self.step()
+        return self.game_manager
+
+    def seek(self, tick):
+        """Positionne le rejeu sur un tick quelconque, en avant comme en arrière"""
+        index = bisect_right(self._keyframe_ticks, tick) - 1
+        keyframe = self._keyframe_ticks[index]
+        if tick < self.game_manager.tick or keyframe > self.game_manager.tick:
+            self.game_manager = self._copy(self._keyframes[keyframe])
+        return self.run_to(tick)
+
+    def run(self):
+        """
+        Rejoue toute la partie.
+
+        Returns:
+            True si l'état final correspond à l'empreinte enregistrée
+            (toujours True si l'enregistrement n'en a pas)
+        """
+        self.run_to(self.recording.ticks)
+        return self.recording.digest is None or self.recording.digest == self.digest()
+
+    def digest(self):
+        return state_digest(self.game_manager)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rejeu d'une partie enregistrée")
+    parser.add_argument('path', help="Fichier produit par --record")
+    parser.add_argument('--seek', type=int, metavar='TICK',
+                        help="S'arrête au tick donné au lieu de la fin de la partie")
+    parser.add_argument('--keyframe-interval', type=int, default=1000)
+    parser.add_argument('--log-level', choices=[*LOG_LEVELS, 'off'], default='off',
+                        help="Niveau des événements affichés en console (défaut: off)")
+    args = parser.parse_args(argv)
+
+    recording = Recording.load(args.path)
+    events = EventLog()
+    if args.log_level != 'off':
+        events.add_sink(ConsoleSink(LOG_LEVELS[args.log_level]))
+    replayer = Replayer(recording, args.keyframe_interval, events)
+
+    start = time.perf_counter()
+    if args.seek is not None:
+        replayer.seek(args.seek)
+        identical = None
+    else:
+        identical = replayer.run()
+    elapsed = time.perf_counter() - start
+    events.close()
+
+    for key, value in replayer.game_manager.get_stats().items():
+        print(f"{key}: {value}")
+    print(f"tick: {replayer.tick}")
+    print(f"ticks/s: {replayer.tick / elapsed if elapsed > 0 else float('inf'):.0f}")
+    print(f"digest: {replayer.digest()}")
+    if identical is not None:
+        print(f"identique: {'oui' if identical else 'NON'}")
+        return 0 if identical else 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
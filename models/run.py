@@ -0,0 +1,125 @@
+"""
+Simulation sans interface graphique, aussi vite que le CPU le permet.
+
+Exemple :
+    python -m models.run --duration 3600 --seed 42 --controller autoland
+"""
+import argparse
+import time
+
+from models.controllers import CONTROLLERS
+from models.events import DEBUG, INFO, WARNING, ConsoleSink, EventLog, JsonLinesSink
+from models.game_manager import GameManager
+from models.profiling import Profiler
+from models.replay import Recording
+from models.simulation import take_snapshot
+
+LOG_LEVELS = {'debug': DEBUG, 'info': INFO, 'warning': WARNING}
+
+
+def simulate(game_manager, controller, dt=0.05, ticks=None, duration=None, listener=None):
+    """
+    Fait avancer game_manager sans temporisation.
+
+    S'arrête après ticks pas, après duration secondes simulées, ou au
+    game over. Si listener est donné, il reçoit le FrameSnapshot de chaque
+    tick (voir models.telemetry).
+
+    Returns:
+        (nombre de ticks exécutés, durée réelle en secondes)
+    """
+    if ticks is None:
+        ticks = int(round(duration / dt))
+
+    done = 0
+    start = time.perf_counter()
+    while done < ticks and not game_manager.game_over:
+        controller.update(game_manager, dt)
+        game_manager.update(dt)
+        if listener is not None:
+            listener(take_snapshot(game_manager))
+        done += 1
+    return done, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation de contrôle aérien sans interface")
+    limit = parser.add_mutually_exclusive_group()
+    limit.add_argument('--duration', type=float, default=600,
+                       help="Durée simulée en secondes (défaut: 600)")
+    limit.add_argument('--ticks', type=int, help="Nombre de ticks à simuler")
+    parser.add_argument('--dt', type=float, default=0.05, help="Pas de temps (défaut: 0.05)")
+    parser.add_argument('--seed', type=int, help="Graine de la partie (tirée au hasard sinon)")
+    parser.add_argument('--controller', choices=sorted(CONTROLLERS), default='noop')
+    parser.add_argument('--engine', choices=GameManager.ENGINES, default='objects')
+    parser.add_argument('--log-level', choices=[*LOG_LEVELS, 'off'], default='off',
+                        help="Niveau des événements affichés en console (défaut: off)")
+    parser.add_argument('--events', metavar='PATH',
+                        help="Enregistre tous les événements dans un fichier JSON lines")
+    parser.add_argument('--record', metavar='PATH',
+                        help="Enregistre la partie pour la rejouer avec models.replay")
+    parser.add_argument('--profile', action='store_true',
+                        help="Affiche le temps passé par phase du tick")
+    parser.add_argument('--sectors', type=int, metavar='N',
+                        help="Découpe l'espace aérien en N secteurs simulés chacun dans son "
+                             "processus (voir models.sectors)")
+    parser.add_argument('--telemetry', metavar='ADRESSE',
+                        help="Diffuse l'état à chaque tick (unix:/chemin ou hôte:port, "
+                             "voir models.telemetry)")
+    parser.add_argument('--history', metavar='PATH',
+                        help="Exporte en fin de partie les dernières trajectoires en colonnes "
+                             "(.npz, voir models.history)")
+    args = parser.parse_args(argv)
+    if args.sectors is not None and args.record:
+        parser.error("--record n'est pas disponible avec --sectors")
+
+    events = EventLog()
+    if args.log_level != 'off':
+        events.add_sink(ConsoleSink(LOG_LEVELS[args.log_level]))
+    if args.events:
+        events.add_sink(JsonLinesSink(args.events))
+
+    profiler = Profiler(enabled=args.profile)
+    history = None
+    if args.history:
+        from models.history import TrajectoryHistory
+        history = TrajectoryHistory()
+    if args.sectors is not None:
+        from models.sectors import SectorCoordinator
+        game_manager = SectorCoordinator(sectors=args.sectors, engine=args.engine, events=events,
+                                         seed=args.seed, profiler=profiler, history=history)
+    else:
+        game_manager = GameManager(engine=args.engine, events=events, seed=args.seed,
+                                   profiler=profiler, history=history)
+    controller = CONTROLLERS[args.controller]()
+    telemetry = None
+    if args.telemetry:
+        from models.telemetry import TelemetryServer
+        telemetry = TelemetryServer(args.telemetry)
+        telemetry.start()
+    try:
+        ticks, elapsed = simulate(game_manager, controller, args.dt,
+                                  ticks=args.ticks, duration=args.duration,
+                                  listener=telemetry.publish if telemetry else None)
+    finally:
+        if telemetry is not None:
+            telemetry.stop()
+        game_manager.close()
+        events.close()
+
+    if args.record:
+        Recording.from_game(game_manager, args.dt).save(args.record)
+    if history is not None:
+        history.export(args.history)
+
+    for key, value in game_manager.get_stats().items():
+        print(f"{key}: {value}")
+    print(f"seed: {game_manager.seed}")
+    print(f"ticks: {ticks}")
+    print(f"ticks/s: {ticks / elapsed if elapsed > 0 else float('inf'):.0f}")
+    if args.profile:
+        game_manager.profiler.dump()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,321 @@
+"""
+Sauvegarde binaire compacte de l'état complet d'un GameManager.
+
+Format (version 3, little-endian) :
+
+    en-tête     b'ATCSNAP\\0', version (uint32), taille des métadonnées (uint32)
+    métadonnées JSON UTF-8 : compteurs, minuteurs, score, difficulté,
+                générateur aléatoire, collisions animées, disposition des colonnes
+    colonnes    une par champ d'avion, alignées sur 64 octets
+
+Les colonnes sont des tableaux NumPy bruts : un fichier se projette en
+mémoire (read_columns) et se recharge avec une copie par colonne, sans
+analyse champ par champ. Nécessite NumPy.
+
+Versions :
+    1   format initial
+    2   colonnes prev_x, prev_y (position au tick précédent)
+    3   métadonnée pending_spawns (apparitions différées)
+
+Un fichier plus ancien se recharge avec les valeurs par défaut des champs
+qu'il n'a pas ; un fichier plus récent que VERSION est refusé.
+
+Exemple :
+    from models import savegame
+    savegame.save(game_manager, 'partie.sav')
+    game_manager = savegame.load('partie.sav')
+"""
+import gc
+import json
+import random
+import struct
+
+import numpy as np
+
+from models.airplane import Airplane, AirplaneState
+from models.conflicts import ConflictTable
+from models.effects import CollisionRing
+from models.spawn import SpawnPlanner
+
+MAGIC = b'ATCSNAP\x00'
+VERSION = 3
+# Première version contenant chaque champ ajouté après coup
+ADDED_IN = {
+    'prev_x': 2,
+    'prev_y': 2,
+    'pending_spawns': 3,
+}
+HEADER = struct.Struct('<8sII')
+ALIGNMENT = 64
+
+STATES = tuple(AirplaneState)
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+# Colonnes numériques, dans l'ordre du fichier ; 'name' est ajoutée avec
+# une largeur calculée à la sauvegarde
+COLUMNS = (
+    ('id', '<i8'),
+    ('x', '<f8'),
+    ('y', '<f8'),
+    ('level', 'i1'),
+    ('speed', '<f8'),
+    ('heading', '<f8'),
+    ('fuel', '<f8'),
+    ('state', 'i1'),
+    ('has_emergency', '?'),
+    ('landing_target_x', '<f8'),  # NaN pour None
+    ('landing_target_y', '<f8'),
+    ('prev_x', '<f8'),
+    ('prev_y', '<f8'),
+)
+
+# Attributs simples de GameManager recopiés tels quels
+SCALARS = (
+    'radar_width', 'radar_height', 'engine', 'seed', 'score', 'best_score', 'lives',
+    'planes_landed', 'collisions_avoided', 'game_time', 'tick', 'difficulty_level',
+    'spawn_timer', 'spawn_interval', 'game_over', 'landing_zone_x', 'landing_zone_y',
+    'landing_zone_radius', '_next_airplane_id', 'pending_spawns',
+)
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _aligned(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _airplane_columns(game_manager):
+    airplanes = game_manager.airplanes
+    fleet = game_manager.fleet
+    if fleet is not None:
+        # Lignes de la flotte dans l'ordre de game_manager.airplanes
+        rows = np.fromiter((airplane._row for airplane in airplanes), np.int64, len(airplanes))
+        columns = {name: fleet.column(name)[rows] for name in fleet.COLUMNS}
+    else:
+        columns = {name: [getattr(airplane, name) for airplane in airplanes]
+                   for name, _ in COLUMNS if name != 'id'}
+        columns['state'] = [STATE_CODES[state] for state in columns['state']]
+        for name in ('landing_target_x', 'landing_target_y'):
+            columns[name] = [np.nan if value is None else value for value in columns[name]]
+    columns['id'] = [airplane.id for airplane in airplanes]
+
+    names = [airplane.name.encode('utf-8') for airplane in airplanes]
+    width = max(map(len, names), default=1)
+    arrays = {name: np.asarray(columns[name], dtype=dtype) for name, dtype in COLUMNS}
+    arrays['name'] = np.asarray(names, dtype=f'S{width}')
+    return arrays
+
+
+def _ring_state(ring):
+    return {
+        'capacity': ring.capacity,
+        'duration': ring.duration,
+        'x': ring._x,
+        'y': ring._y,
+        'expires': ring._expires,
+        'next': ring._next,
+    }
+
+
+def save(game_manager, path):
+    """Écrit l'état complet de game_manager dans path"""
+    arrays = _airplane_columns(game_manager)
+    count = len(game_manager.airplanes)
+    version, internal, gauss_next = game_manager.rng.getstate()
+
+    layout = []
+    meta = {
+        **{name: getattr(game_manager, name) for name in SCALARS},
+        'count': count,
+        'states': [state.name for state in STATES],
+        'selected_id': game_manager.selected_id,
+        'rng': [version, list(internal), gauss_next],
+        'collisions': _ring_state(game_manager.collision_positions),
+        'near_pairs': sorted(game_manager.conflicts.near_pairs),
+        'command_log': [[tick, airplane_id, command, list(args)]
+                        for tick, airplane_id, command, args in game_manager.command_log],
+        'columns': layout,
+    }
+
+    # Les décalages dépendent de la taille des métadonnées, qui dépend des
+    # décalages : on réserve large puis on complète par des espaces
+    names = [name for name, _ in COLUMNS] + ['name']
+    for name in names:
+        layout.append([name, arrays[name].dtype.str, 0])
+    reserve = len(json.dumps(meta).encode('utf-8')) + 24 * len(names)
+    offset = _aligned(HEADER.size + reserve)
+    for entry in layout:
+        entry[2] = offset
+        offset = _aligned(offset + arrays[entry[0]].nbytes)
+
+    encoded = json.dumps(meta).encode('utf-8')
+    encoded += b' ' * (reserve - len(encoded))
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+        file.write(encoded)
+        for name, _, start in layout:
+            file.seek(start)
+            file.write(arrays[name].tobytes())
+        file.truncate(offset)
+
+
+def read_meta(path):
+    """Métadonnées seules (score, meilleur score...), sans lire les colonnes"""
+    with open(path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise SnapshotError(f"Fichier tronqué: {path}")
+        magic, version, meta_size = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise SnapshotError(f"Ce n'est pas une sauvegarde: {path}")
+        if not 1 <= version <= VERSION:
+            raise SnapshotError(f"Version de sauvegarde non supportée: {version}")
+        meta = json.loads(file.read(meta_size))
+    meta['version'] = version
+    return meta
+
+
+def read_columns(path, meta=None):
+    """
+    Colonnes des avions projetées en mémoire, en lecture seule.
+
+    Returns:
+        (meta, {nom: tableau NumPy}) ; les tableaux lisent directement le
+        fichier, rien n'est chargé avant d'y accéder
+    """
+    meta = meta or read_meta(path)
+    count = meta['count']
+    if count == 0:
+        return meta, {name: np.empty(0, dtype=dtype) for name, dtype, _ in meta['columns']}
+    mapped = np.memmap(path, dtype=np.uint8, mode='r')
+    columns = {}
+    for name, dtype, offset in meta['columns']:
+        dtype = np.dtype(dtype)
+        end = offset + dtype.itemsize * count
+        if end > len(mapped):
+            raise SnapshotError(f"Fichier tronqué: {path}")
+        columns[name] = mapped[offset:end].view(dtype)
+    return meta, columns
+
+
+def _make_airplanes(ids, names):
+    """Avions créés sans passer par __init__ : seuls id et nom"""
+    new = Airplane.__new__
+    airplanes = [new(Airplane) for _ in ids]
+    for airplane, airplane_id, name in zip(airplanes, ids, names):
+        state = airplane.__dict__
+        state['_fleet'] = None
+        state['_row'] = None
+        state['id'] = airplane_id
+        state['name'] = name
+    return airplanes
+
+
+def load(path, game_manager=None, events=None):
+    """
+    Recharge une sauvegarde.
+
+    Args:
+        game_manager: GameManager à écraser (l'affichage garde ainsi sa
+            référence) ; sinon un nouveau est créé avec le moteur sauvegardé
+        events: EventLog du nouveau GameManager
+
+    Returns:
+        Le GameManager restauré
+    """
+    # Des centaines de milliers d'objets sont créés d'un coup : le ramasse-
+    # miettes se déclencherait plusieurs fois pour rien
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _load(path, game_manager, events)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _load(path, game_manager, events):
+    meta, columns = read_columns(path)
+    version = meta['version']
+    if version < ADDED_IN['prev_x']:
+        # Antérieure à la détection balayée : aucun déplacement au premier tick
+        columns['prev_x'] = columns['x']
+        columns['prev_y'] = columns['y']
+    if game_manager is None:
+        from models.game_manager import GameManager
+        game_manager = GameManager(meta['radar_width'], meta['radar_height'],
+                                   engine=meta['engine'], events=events, seed=meta['seed'])
+
+    # Les codes d'état sont relus par nom : l'ordre de l'enum peut changer
+    state_map = np.array([STATE_CODES[AirplaneState[name]] for name in meta['states']],
+                         dtype=np.int8)
+    states = state_map[columns['state']]
+    ids = columns['id'].tolist()
+    airplanes = _make_airplanes(ids, np.char.decode(columns['name'], 'utf-8').tolist())
+
+    # Les ordres en attente visaient la partie remplacée
+    game_manager.pending_commands = []
+    game_manager.command_results = []
+    game_manager.airplanes.clear()
+    game_manager.airplanes_by_id.clear()
+    game_manager.grid.clear()
+    if game_manager.fleet is not None:
+        game_manager.fleet.clear()
+
+    for name in SCALARS:
+        # Seul pending_spawns manque aux anciennes versions : rien en attente
+        setattr(game_manager, name, meta[name] if version >= ADDED_IN.get(name, 1) else 0)
+    # Les emplacements d'entrée se déduisent de la graine et des dimensions
+    game_manager.spawn_planner = SpawnPlanner(game_manager.radar_width,
+                                              game_manager.radar_height, game_manager.seed)
+    if game_manager.engine == 'fleet' and game_manager.fleet is None:
+        from models.fleet import Fleet
+        game_manager.fleet = Fleet()
+    elif game_manager.engine == 'objects':
+        game_manager.fleet = None
+
+    if game_manager.fleet is not None:
+        game_manager.fleet.extend(airplanes, {**columns, 'state': states})
+    else:
+        names = [name for name, _ in COLUMNS if name != 'id']
+        values = {name: columns[name].tolist() for name in names}
+        values['state'] = [STATES[code] for code in states.tolist()]
+        for name in ('landing_target_x', 'landing_target_y'):
+            values[name] = [None if value != value else value for value in values[name]]
+        for airplane, row in zip(airplanes, zip(*values.values())):
+            airplane.__dict__.update(zip(names, row))
+
+    game_manager.airplanes.extend(airplanes)
+    game_manager.airplanes_by_id.update(zip(ids, airplanes))
+    game_manager._next_airplane_id = max([meta['_next_airplane_id'], *ids])
+
+    version, internal, gauss_next = meta['rng']
+    game_manager.rng = random.Random()
+    game_manager.rng.setstate((version, tuple(internal), gauss_next))
+    game_manager.command_log = [(tick, airplane_id, command, tuple(args))
+                                for tick, airplane_id, command, args in meta['command_log']]
+
+    ring_state = meta['collisions']
+    ring = CollisionRing(ring_state['capacity'], ring_state['duration'])
+    ring._x = ring_state['x']
+    ring._y = ring_state['y']
+    ring._expires = ring_state['expires']
+    ring._next = ring_state['next']
+    game_manager.collision_positions = ring
+
+    game_manager.selected_id = (meta['selected_id']
+                                if meta['selected_id'] in game_manager.airplanes_by_id else None)
+
+    if game_manager.fleet is not None:
+        game_manager.grid.rebuild_fleet(game_manager.fleet)
+    else:
+        game_manager.grid.sync(airplanes)
+    near_pairs = frozenset(tuple(pair) for pair in meta['near_pairs'])
+    game_manager.predicted_conflicts = []
+    game_manager.conflicts = ConflictTable(
+        near_pairs, (), frozenset(airplane_id for pair in near_pairs for airplane_id in pair))
+    game_manager.restored()
+    return game_manager
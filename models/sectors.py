@@ -0,0 +1,612 @@
+"""
+Espace aérien découpé en secteurs, chacun simulé dans son propre processus.
+
+Un SectorCoordinator se comporte comme un GameManager (même interface pour
+SimulationLoop, RadarScene, les contrôleurs et la sauvegarde) mais ne fait
+plus avancer les avions lui-même : chaque secteur de la grille SectorLayout
+est confié à un SectorGameManager qui tourne dans un processus séparé. Un
+tick se fait en deux échanges avec tous les secteurs en parallèle :
+
+1. advance : chaque secteur applique les ordres reçus, fait avancer ses
+   avions, traite carburant, approches et sorties, puis rend les avions
+   qui ont quitté son rectangle (transmis au secteur d'arrivée) et ceux
+   proches d'une frontière (copiés en « fantômes » chez les voisins) ;
+2. resolve : chaque secteur reçoit ses arrivées et ses fantômes, calcule
+   ses conflits et rend l'état de ses avions.
+
+Les règles de score, de vies, d'apparition et de sélection restent celles
+de GameManager, appliquées par le coordinateur sur une copie fusionnée de
+la flotte. Seule différence avec un GameManager unique : un avion détruit
+dans une collision disparaît du radar immédiatement, mais de son secteur
+au début du tick suivant.
+
+Exemple :
+    python -m models.run --sectors 4 --duration 3600
+"""
+import math
+import multiprocessing
+import os
+import traceback
+
+from models.airplane import Airplane
+from models.conflicts import ConflictTable
+from models.events import DEBUG, INFO, WARNING, EventLog
+from models.game_manager import GameManager
+
+# Attributs transmis entre processus pour un avion, dans cet ordre
+STATE_FIELDS = ('id', 'name', 'x', 'y', 'prev_x', 'prev_y', 'level', 'speed', 'heading',
+                'fuel', 'state', 'has_emergency', 'landing_target_x', 'landing_target_y')
+
+
+def airplane_state(airplane):
+    """Tuple des STATE_FIELDS d'un avion, léger à sérialiser"""
+    return (airplane.id, airplane.name, airplane.x, airplane.y, airplane.prev_x,
+            airplane.prev_y, airplane.level, airplane.speed, airplane.heading, airplane.fuel,
+            airplane.state, airplane.has_emergency, airplane.landing_target_x,
+            airplane.landing_target_y)
+
+
+def airplane_from_state(state):
+    """Avion hors flotte reconstruit depuis airplane_state (sans repasser par __init__)"""
+    airplane = Airplane.__new__(Airplane)
+    airplane._fleet = None
+    airplane._row = None
+    airplane.__dict__.update(zip(STATE_FIELDS, state))
+    return airplane
+
+
+def apply_state(airplane, state):
+    """Recopie airplane_state sur un avion hors flotte"""
+    airplane.__dict__.update(zip(STATE_FIELDS[2:], state[2:]))
+
+
+class SectorLayout:
+    """
+    Grille de columns x rows secteurs rectangulaires sur l'espace aérien.
+
+    Les secteurs du bord s'étendent à l'infini vers l'extérieur : un avion
+    sorti du radar (avant d'être renvoyé vers le centre) a toujours un
+    secteur.
+    """
+
+    def __init__(self, width, height, columns=2, rows=1):
+        if columns < 1 or rows < 1:
+            raise ValueError(f"Découpage invalide: {columns}x{rows}")
+        self.width = width
+        self.height = height
+        self.columns = columns
+        self.rows = rows
+        self.cell_width = width / columns
+        self.cell_height = height / rows
+
+    @classmethod
+    def for_count(cls, count, width, height):
+        """Découpage en count secteurs aussi proches que possible du carré"""
+        best = None
+        for columns in range(1, count + 1):
+            if count % columns:
+                continue
+            rows = count // columns
+            shape = abs(math.log((width / columns) / (height / rows)))
+            if best is None or shape < best[0]:
+                best = (shape, columns, rows)
+        return cls(width, height, best[1], best[2])
+
+    def __len__(self):
+        return self.columns * self.rows
+
+    def sector_at(self, x, y):
+        column = min(self.columns - 1, max(0, math.floor(x / self.cell_width)))
+        row = min(self.rows - 1, max(0, math.floor(y / self.cell_height)))
+        return row * self.columns + column
+
+    def bounds(self, index):
+        """(x0, y0, x1, y1) du secteur, infinis sur les bords extérieurs"""
+        row, column = divmod(index, self.columns)
+        x0 = column * self.cell_width if column > 0 else -math.inf
+        x1 = (column + 1) * self.cell_width if column < self.columns - 1 else math.inf
+        y0 = row * self.cell_height if row > 0 else -math.inf
+        y1 = (row + 1) * self.cell_height if row < self.rows - 1 else math.inf
+        return x0, y0, x1, y1
+
+    def sectors_near(self, x, y, distance):
+        """Secteurs à moins de distance du point, le sien compris"""
+        first_column = min(self.columns - 1, max(0, math.floor((x - distance) / self.cell_width)))
+        last_column = min(self.columns - 1, max(0, math.floor((x + distance) / self.cell_width)))
+        first_row = min(self.rows - 1, max(0, math.floor((y - distance) / self.cell_height)))
+        last_row = min(self.rows - 1, max(0, math.floor((y + distance) / self.cell_height)))
+        limit = distance * distance
+        sectors = []
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                index = row * self.columns + column
+                x0, y0, x1, y1 = self.bounds(index)
+                dx = max(x0 - x, 0.0, x - x1)
+                dy = max(y0 - y, 0.0, y - y1)
+                if dx * dx + dy * dy < limit:
+                    sectors.append(index)
+        return sectors
+
+
+class _EventCollector:
+    """Sink qui garde les événements d'un secteur jusqu'au prochain échange"""
+
+    def __init__(self, level):
+        self.level = level
+        self.events = []
+
+    def write(self, event):
+        self.events.append(event)
+
+    def take(self):
+        events, self.events = self.events, []
+        return events
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SectorGameManager(GameManager):
+    """
+    Un secteur, simulé dans le processus d'un worker.
+
+    Il ne fait pas apparaître d'avions et ne compte ni points ni vies :
+    atterrissages, crashs et collisions sont renvoyés au coordinateur
+    (outcomes), qui applique les règles de GameManager à la flotte
+    fusionnée. Les fantômes, copies des avions voisins proches de la
+    frontière, sont dans l'index spatial mais pas dans airplanes.
+    """
+
+    def __init__(self, layout, index, engine='objects', level=INFO):
+        self.layout = layout
+        self.index = index
+        self.bounds = layout.bounds(index)
+        self.ghosts = []
+        self.outcomes = []
+        self._collector = _EventCollector(level)
+        super().__init__(layout.width, layout.height, engine=engine, seed=0,
+                         events=EventLog(capacity=1, buffer_level=level, sinks=[self._collector]))
+
+    def spawn_airplane(self):
+        return None
+
+    def _set_event_level(self, level):
+        if level != self._collector.level:
+            self._collector.level = level
+            self.events = EventLog(capacity=1, buffer_level=level, sinks=[self._collector])
+
+    def _take_outcomes(self):
+        outcomes, self.outcomes = self.outcomes, []
+        return outcomes
+
+    def halo(self):
+        """
+        Largeur de la bande copiée chez les voisins : tout avion qui peut
+        former une paire proche ou entrer en collision avec un avion du
+        secteur pendant ce pas, ou qui vient de quitter une telle paire.
+
+        Une paire proche (moins de SAFE_DISTANCE) dont les deux avions
+        s'écartent de step_motion peut finir à SAFE_DISTANCE + 2 *
+        step_motion : elle doit rester visible chez le voisin jusqu'à être
+        comptée comme évitée. Un step_motion de plus couvre le déplacement
+        entre l'export et le pas suivant.
+        """
+        return Airplane.SAFE_DISTANCE + 3 * self.step_motion
+
+    def advance(self, dt, tick, game_time, arrivals, commands, removed, level):
+        """
+        Première moitié du tick : ordres, déplacements, approches, sorties.
+
+        Args:
+            arrivals: airplane_state des avions qui entrent dans le secteur
+            commands: (id, commande, args) déjà journalisés par le coordinateur
+            removed: ids des avions détruits par une collision au tick précédent
+            level: niveau d'événements écouté par le coordinateur
+
+        Returns:
+            (sorties {secteur: [état]}, fantômes {secteur: [état]},
+             outcomes, événements)
+        """
+        self._set_event_level(level)
+        for airplane_id in removed:
+            airplane = self.airplanes_by_id.get(airplane_id)
+            if airplane is not None:
+                self.remove_airplane(airplane)
+        for state in arrivals:
+            self.add_airplane(airplane_from_state(state))
+        for airplane_id, command, args in commands:
+            airplane = self.airplanes_by_id.get(airplane_id)
+            if airplane is not None:
+                getattr(self, f'_command_{command}')(airplane, *args)
+
+        self.tick = tick
+        self.game_time = game_time
+        self.step_motion = Airplane.MAX_SPEED * dt * 0.1
+        if self.fleet is not None:
+            self._update_fleet(dt)
+        else:
+            self._update_objects(dt)
+        self._sync_grid()
+
+        handoffs, ghosts = self._exports()
+        return handoffs, ghosts, self._take_outcomes(), self._collector.take()
+
+    def _exports(self):
+        """Retire les avions sortis du secteur et liste ceux à copier chez les voisins"""
+        layout = self.layout
+        halo = self.halo()
+        x0, y0, x1, y1 = self.bounds
+        inner_x0, inner_x1 = x0 + halo, x1 - halo
+        inner_y0, inner_y1 = y0 + halo, y1 - halo
+        handoffs = {}
+        ghosts = {}
+        for airplane in self.airplanes[:]:
+            x = airplane.x
+            y = airplane.y
+            if inner_x0 <= x <= inner_x1 and inner_y0 <= y <= inner_y1:
+                continue
+            owner = layout.sector_at(x, y)
+            state = airplane_state(airplane)
+            if owner != self.index:
+                self.remove_airplane(airplane)
+                handoffs.setdefault(owner, []).append(state)
+            for sector in layout.sectors_near(x, y, halo):
+                if sector != owner:
+                    ghosts.setdefault(sector, []).append(state)
+        return handoffs, ghosts
+
+    def resolve(self, arrivals, ghosts):
+        """
+        Seconde moitié du tick : arrivées, fantômes, conflits.
+
+        Returns:
+            (états des avions du secteur, ids en zone de danger, outcomes,
+             paires proches dont un avion est au secteur, événements)
+        """
+        for ghost in self.ghosts:
+            self.grid.remove(ghost)
+        for state in arrivals:
+            self.add_airplane(airplane_from_state(state))
+        self.ghosts = [airplane_from_state(state) for state in ghosts]
+        for ghost in self.ghosts:
+            self.grid.insert(ghost)
+
+        self._check_collisions()
+
+        own = self.airplanes_by_id
+        return ([airplane_state(airplane) for airplane in self.airplanes],
+                [airplane_id for airplane_id in self.conflicts.danger_ids if airplane_id in own],
+                self._take_outcomes(),
+                [pair for pair in self.conflicts.near_pairs if pair[0] in own or pair[1] in own],
+                self._collector.take())
+
+    def _check_collisions(self):
+        # Les collisions évitées sont comptées par le coordinateur, sur les
+        # paires proches de tous les secteurs : une paire qui change de
+        # secteur pendant qu'elle se sépare n'est vue en entier par aucun
+        self.conflicts = ConflictTable.build(self.grid, self.step_motion)
+        own = self.airplanes_by_id
+
+        # Une paire à cheval sur deux secteurs est vue des deux côtés : seul
+        # le secteur qui possède le plus petit id la transmet. Le
+        # coordinateur choisit parmi celles de tous les secteurs
+        for airplane1, airplane2 in self.conflicts.collision_pairs:
+            id1, id2 = sorted((airplane1.id, airplane2.id))
+            if id1 in own:
+                self.outcomes.append(('collision', id1, id2))
+
+    def handle_landing(self, airplane):
+        self.remove_airplane(airplane)
+        self.outcomes.append(('landing', airplane_state(airplane)))
+
+    def handle_crash(self, airplane):
+        self.remove_airplane(airplane)
+        self.outcomes.append(('crash', airplane_state(airplane)))
+
+    def reset(self):
+        super().reset()
+        self.ghosts = []
+        self.outcomes = []
+
+
+def _sector_main(connection, layout, index, engine):
+    """Boucle d'un worker : exécute les appels reçus sur son secteur"""
+    sector = SectorGameManager(layout, index, engine)
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+        method, args = message
+        try:
+            reply = (True, getattr(sector, method)(*args))
+        except Exception:
+            reply = (False, traceback.format_exc())
+        connection.send(reply)
+    connection.close()
+
+
+class _LocalSector:
+    """Secteur simulé dans le processus courant (mise au point, machine à un cœur)"""
+
+    def __init__(self, layout, index, engine):
+        self.index = index
+        self.sector = SectorGameManager(layout, index, engine)
+        self._reply = None
+
+    def send(self, method, *args):
+        self._reply = getattr(self.sector, method)(*args)
+
+    def receive(self):
+        reply, self._reply = self._reply, None
+        return reply
+
+    def close(self):
+        pass
+
+
+class _ProcessSector:
+    """Secteur simulé dans un processus worker, piloté par un Pipe"""
+
+    def __init__(self, context, layout, index, engine):
+        self.index = index
+        self._connection, child = context.Pipe()
+        self.process = context.Process(target=_sector_main, args=(child, layout, index, engine),
+                                       name=f"sector-{index}", daemon=True)
+        self.process.start()
+        child.close()
+
+    def send(self, method, *args):
+        self._connection.send((method, args))
+
+    def receive(self):
+        ok, reply = self._connection.recv()
+        if not ok:
+            raise RuntimeError(f"Erreur dans le secteur {self.index}:\n{reply}")
+        return reply
+
+    def close(self):
+        try:
+            self._connection.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+        self._connection.close()
+
+
+class SectorCoordinator(GameManager):
+    """
+    GameManager dont la flotte est simulée par secteurs en parallèle.
+
+    airplanes contient une copie de chaque avion, remise à jour à chaque
+    tick depuis les secteurs : l'affichage, la sélection, la sonde de
+    conflits et les apparitions la lisent comme la flotte d'un GameManager
+    ordinaire. Les ordres (apply_commands) sont appliqués à la copie et
+    transmis au secteur propriétaire de l'avion.
+
+    Appeler close() (ou utiliser le coordinateur comme gestionnaire de
+    contexte) pour arrêter les processus.
+    """
+
+    def __init__(self, radar_width=800, radar_height=600, sectors=None, engine='objects',
+                 events=None, seed=None, conflict_probe=None, profiler=None, history=None,
+                 processes=True):
+        """
+        Args:
+            sectors: Nombre de secteurs (un processus chacun) ; par défaut,
+                le nombre de cœurs
+            engine: Moteur de chaque secteur ('objects' ou 'fleet')
+            processes: False pour simuler les secteurs dans ce processus
+                (mêmes résultats, sans parallélisme)
+        """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Moteur inconnu: {engine}")
+        self.sector_engine = engine
+        self.layout = SectorLayout.for_count(sectors or os.cpu_count() or 1,
+                                             radar_width, radar_height)
+        self.owners = {}  # id -> secteur propriétaire
+        self.sector_planes = (0,) * len(self.layout)
+        self._outboxes = self._new_outboxes()
+        if processes:
+            # spawn plutôt que fork : le processus parent peut avoir des
+            # threads (simulation, Qt) qu'un fork copierait dans un état incohérent
+            context = multiprocessing.get_context('spawn')
+            self.sectors = [_ProcessSector(context, self.layout, index, engine)
+                            for index in range(len(self.layout))]
+        else:
+            self.sectors = [_LocalSector(self.layout, index, engine)
+                            for index in range(len(self.layout))]
+        super().__init__(radar_width, radar_height, events=events, seed=seed,
+                         conflict_probe=conflict_probe, profiler=profiler, history=history)
+
+    def _new_outboxes(self):
+        """Par secteur : arrivées {id: état}, ordres et ids détruits à envoyer au prochain tick"""
+        return [({}, [], []) for _ in range(len(self.layout))]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for sector in self.sectors:
+            sector.close()
+        self.sectors = []
+
+    def _event_level(self):
+        """Niveau le plus bas écouté par self.events, transmis aux secteurs"""
+        for level in (DEBUG, INFO, WARNING):
+            if self.events.enabled(level):
+                return level
+        return WARNING + 10
+
+    def _forward_events(self, events):
+        for event in events:
+            self.events.emit(event.tick, event.time, event.type, event.message, event.level,
+                             **event.data)
+
+    def add_airplane(self, airplane):
+        super().add_airplane(airplane)
+        self._route(airplane)
+
+    def _route(self, airplane):
+        """Confie l'avion au secteur sous sa position, au prochain tick"""
+        owner = self.layout.sector_at(airplane.x, airplane.y)
+        self.owners[airplane.id] = owner
+        self._outboxes[owner][0][airplane.id] = airplane_state(airplane)
+
+    def remove_airplane(self, airplane):
+        if not super().remove_airplane(airplane):
+            return False
+        owner = self.owners.pop(airplane.id)
+        arrivals, _, removed = self._outboxes[owner]
+        # Un avion pas encore transmis à son secteur n'a pas à y être retiré
+        if arrivals.pop(airplane.id, None) is None:
+            removed.append(airplane.id)
+        return True
+
+    def _execute(self, airplane_id, command, args):
+        result = super()._execute(airplane_id, command, args)
+        if result.applied:
+            self._outboxes[self.owners[airplane_id]][1].append((airplane_id, command, args))
+        return result
+
+    def update(self, dt):
+        if self.game_over:
+            return
+
+        profiler = self.profiler
+        start = mark = profiler.start()
+
+        if self.pending_commands:
+            self._apply_pending_commands()
+            mark = profiler.lap('update.commands', mark)
+
+        self._update_schedule(dt)
+        mark = profiler.lap('update.spawn', mark)
+
+        handoffs, ghosts = self._advance_sectors(dt)
+        mark = profiler.lap('update.movement', mark)
+        self._resolve_sectors(handoffs, ghosts)
+        mark = profiler.lap('update.collisions', mark)
+
+        self.grid.sync(self.airplanes)
+        mark = profiler.lap('update.grid', mark)
+
+        if self.conflict_probe is not None:
+            self.predicted_conflicts = self.conflict_probe.predict(self, dt)
+            mark = profiler.lap('update.probe', mark)
+
+        if self.history is not None:
+            self.history.record(self)
+            mark = profiler.lap('update.history', mark)
+
+        if self.lives <= 0:
+            self.game_over = True
+        profiler.lap('update', start)
+
+    def _advance_sectors(self, dt):
+        """Premier échange ; applique atterrissages et crashs, route sorties et fantômes"""
+        level = self._event_level()
+        outboxes, self._outboxes = self._outboxes, self._new_outboxes()
+        for sector, (arrivals, commands, removed) in zip(self.sectors, outboxes):
+            sector.send('advance', dt, self.tick, self.game_time, list(arrivals.values()),
+                        commands, removed, level)
+
+        handoffs = [[] for _ in self.sectors]
+        ghosts = [[] for _ in self.sectors]
+        airplanes_by_id = self.airplanes_by_id
+        for sector in self.sectors:
+            sector_handoffs, sector_ghosts, outcomes, events = sector.receive()
+            self._forward_events(events)
+            for owner, states in sector_handoffs.items():
+                handoffs[owner].extend(states)
+                for state in states:
+                    self.owners[state[0]] = owner
+            for neighbour, states in sector_ghosts.items():
+                ghosts[neighbour].extend(states)
+            for outcome, state in outcomes:
+                airplane = airplanes_by_id.get(state[0])
+                if airplane is None:
+                    continue
+                apply_state(airplane, state)
+                if outcome == 'landing':
+                    self.handle_landing(airplane)
+                else:
+                    self.handle_crash(airplane)
+        return handoffs, ghosts
+
+    def _resolve_sectors(self, handoffs, ghosts):
+        """
+        Second échange ; recopie la flotte, fusionne zones de danger, paires
+        proches et collisions, et compte les collisions évitées comme
+        GameManager._check_collisions
+        """
+        for sector in self.sectors:
+            sector.send('resolve', handoffs[sector.index], ghosts[sector.index])
+
+        airplanes_by_id = self.airplanes_by_id
+        danger_ids = set()
+        near_pairs = set()
+        collisions = []
+        for sector in self.sectors:
+            states, danger, outcomes, sector_pairs, events = sector.receive()
+            self._forward_events(events)
+            for state in states:
+                airplane = airplanes_by_id.get(state[0])
+                if airplane is not None:
+                    apply_state(airplane, state)
+            danger_ids.update(danger)
+            collisions.extend(outcomes)
+            near_pairs.update(map(tuple, sector_pairs))
+        previous = self.conflicts
+        self.conflicts = ConflictTable(frozenset(near_pairs), (), frozenset(danger_ids))
+
+        # Une seule collision par tick, la paire aux plus petits ids, comme
+        # GameManager._check_collisions pour un seul gestionnaire. Les
+        # autres paires, de tous les secteurs, restent en collision et sont
+        # traitées aux ticks suivants
+        for _, id1, id2 in sorted(collisions)[:1]:
+            self.handle_collision(airplanes_by_id[id1], airplanes_by_id[id2])
+
+        for id1, id2 in self.conflicts.ended_pairs(previous):
+            if id1 in airplanes_by_id and id2 in airplanes_by_id:
+                self.collisions_avoided += 1
+
+        counts = [0] * len(self.sectors)
+        for owner in self.owners.values():
+            counts[owner] += 1
+        self.sector_planes = tuple(counts)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats['sector_planes'] = self.sector_planes
+        return stats
+
+    def _reset_sectors(self):
+        for sector in self.sectors:
+            sector.send('reset')
+        for sector in self.sectors:
+            sector.receive()
+        self.owners.clear()
+        self._outboxes = self._new_outboxes()
+        self.sector_planes = (0,) * len(self.layout)
+
+    def reset(self):
+        self._reset_sectors()
+        super().reset()
+
+    def restored(self):
+        """Après un chargement : redistribue toute la flotte entre les secteurs"""
+        super().restored()
+        self._reset_sectors()
+        for airplane in self.airplanes:
+            self._route(airplane)
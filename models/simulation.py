@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import namedtuple
+
+from models.airplane import Airplane, AirplaneState
+
+
+class AirplaneSnapshot(namedtuple('AirplaneSnapshot', [
+        'id', 'name', 'x', 'y', 'level', 'speed', 'heading', 'fuel',
+        'state', 'has_emergency', 'in_danger_zone'])):
+    """Copie figée d'un avion, lue par l'affichage pendant que la simulation avance"""
+
+    __slots__ = ()
+
+    def is_in_danger(self):
+        return (self.fuel <= Airplane.CRITICAL_FUEL_LEVEL or
+                self.state == AirplaneState.EMERGENCY)
+
+
+FrameSnapshot = namedtuple('FrameSnapshot', [
+    'tick',            # nombre de GameManager.update effectués
+    'time',            # temps simulé (game_time)
+    'wall_time',       # time.monotonic() à la publication
+    'airplanes',       # tuple d'AirplaneSnapshot
+    'selected',        # AirplaneSnapshot sélectionné ou None
+    'explosions',      # tuple de (x, y, timer)
+    'conflicts',       # tuple de PredictedConflict, par instant croissant
+    'stats',           # dict de GameManager.get_stats()
+    'game_over',
+])
+
+
+def snapshot_airplane(game_manager, airplane):
+    """AirplaneSnapshot d'un seul avion (None reste None)"""
+    if airplane is None:
+        return None
+    return AirplaneSnapshot(
+        airplane.id, airplane.name, airplane.x, airplane.y, airplane.level,
+        airplane.speed, airplane.heading, airplane.fuel, airplane.state,
+        airplane.has_emergency, game_manager.conflicts.is_in_danger_zone(airplane.id),
+    )
+
+
+def take_snapshot(game_manager, wall_time=None):
+    """Fige l'état visible du jeu ; à appeler quand la simulation ne tourne pas"""
+    is_in_danger_zone = game_manager.conflicts.is_in_danger_zone
+    airplanes = [
+        AirplaneSnapshot(
+            airplane.id, airplane.name, airplane.x, airplane.y, airplane.level,
+            airplane.speed, airplane.heading, airplane.fuel, airplane.state,
+            airplane.has_emergency, is_in_danger_zone(airplane.id),
+        )
+        for airplane in game_manager.airplanes
+    ]
+    selected = snapshot_airplane(game_manager, game_manager.selected_airplane)
+
+    return FrameSnapshot(
+        tick=game_manager.tick,
+        time=game_manager.game_time,
+        wall_time=time.monotonic() if wall_time is None else wall_time,
+        airplanes=tuple(airplanes),
+        selected=selected,
+        explosions=tuple(game_manager.collision_positions.active(game_manager.game_time)),
+        conflicts=tuple(game_manager.predicted_conflicts),
+        stats=game_manager.get_stats(),
+        game_over=game_manager.game_over,
+    )
+
+
+class SimulationLoop:
+    """
+    Fait tourner GameManager à pas fixe, indépendamment de l'affichage.
+
+    Le temps réel écoulé est accumulé et consommé par pas de `step`
+    secondes ; si la simulation a pris du retard, plusieurs pas sont
+    enchaînés (au plus max_substeps par appel, le surplus est abandonné).
+    Après chaque avance, un FrameSnapshot immuable est publié : l'affichage
+    lit les deux derniers (double buffer) et interpole entre eux.
+
+    Toute modification du jeu depuis un autre thread (commandes, sélection,
+    reset) doit se faire sous `lock`.
+
+    Les fonctions de `listeners` reçoivent chaque snapshot publié, dans le
+    thread de la simulation : elles ne doivent pas bloquer (voir
+    models.telemetry).
+    """
+
+    def __init__(self, game_manager, step=0.05, max_substeps=5):
+        self.game_manager = game_manager
+        self.step = step
+        self.max_substeps = max_substeps
+        self.lock = threading.RLock()
+
+        self.accumulator = 0.0
+        self.catchup_steps = 0   # pas supplémentaires enchaînés pour rattraper
+        self.dropped_steps = 0   # pas abandonnés au-delà de max_substeps
+        self.steps = 0           # pas exécutés depuis le départ
+        self.update_time = 0.0   # secondes passées dans GameManager.update
+
+        self._snapshots = (None, None)  # (précédent, courant)
+        self.listeners = []
+        self._thread = None
+        self._stop_event = threading.Event()
+
+    def advance(self, elapsed):
+        """Ajoute elapsed secondes réelles et exécute les pas fixes dus"""
+        self.accumulator += elapsed
+        steps = 0
+        with self.lock:
+            start = time.perf_counter()
+            while self.accumulator >= self.step and steps < self.max_substeps:
+                self.game_manager.update(self.step)
+                self.accumulator -= self.step
+                steps += 1
+            self.update_time += time.perf_counter() - start
+            self.steps += steps
+
+            if self.accumulator >= self.step:
+                dropped = int(self.accumulator / self.step)
+                self.dropped_steps += dropped
+                self.accumulator -= dropped * self.step
+
+            if steps:
+                self.catchup_steps += steps - 1
+                self.publish()
+        return steps
+
+    def publish(self):
+        """Publie l'état courant ; le snapshot courant devient le précédent"""
+        with self.lock:
+            snapshot = take_snapshot(self.game_manager)
+            self._snapshots = (self._snapshots[1], snapshot)
+            for listener in self.listeners:
+                listener(snapshot)
+        return snapshot
+
+    def publish_selection(self, selected):
+        """
+        Reporte une nouvelle sélection sur les snapshots déjà publiés, sans
+        refiger toute la flotte : l'affichage la voit dès sa prochaine image.
+
+        Args:
+            selected: AirplaneSnapshot sélectionné ou None
+        """
+        with self.lock:
+            self._snapshots = tuple(None if snapshot is None else snapshot._replace(selected=selected)
+                                    for snapshot in self._snapshots)
+
+    def latest(self):
+        return self._snapshots[1]
+
+    def previous(self):
+        return self._snapshots[0]
+
+    def interpolation_alpha(self, now=None):
+        """Position entre le snapshot précédent (0) et le courant (1)"""
+        latest = self.latest()
+        if latest is None:
+            return 1.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, min(1.0, (now - latest.wall_time) / self.step))
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop_event.clear()
+        self.publish()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        last = time.monotonic()
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            self.advance(now - last)
+            last = now
+            self._stop_event.wait(max(0.0, self.step - self.accumulator))
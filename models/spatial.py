@@ -0,0 +1,191 @@
+import math
+
+from models.airplane import Airplane
+
+
+class SpatialGrid:
+    """
+    Index spatial uniforme par niveau de vol.
+
+    Les avions sont rangés dans des cellules carrées indexées par
+    (level, cell_x, cell_y). Une recherche de voisins ne parcourt que les
+    cellules adjacentes au lieu de toute la flotte, ce qui rend la détection
+    de collision et de proximité à peu près linéaire en nombre d'avions.
+    """
+
+    def __init__(self, cell_size=None):
+        # Une cellule couvre la plus grande distance testée : les voisins
+        # proches sont alors toujours dans les 3x3 cellules autour de l'avion
+        self.cell_size = cell_size or max(Airplane.COLLISION_DISTANCE,
+                                          Airplane.SAFE_DISTANCE)
+        self._cells = {}  # (level, cell_x, cell_y) -> {id: avion}
+        self._keys = {}  # id -> (level, cell_x, cell_y)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, airplane_id):
+        return airplane_id in self._keys
+
+    def key_for(self, level, x, y):
+        size = self.cell_size
+        return (level, math.floor(x / size), math.floor(y / size))
+
+    def insert(self, airplane):
+        key = self.key_for(airplane.level, airplane.x, airplane.y)
+        self._cells.setdefault(key, {})[airplane.id] = airplane
+        self._keys[airplane.id] = key
+
+    def remove(self, airplane):
+        key = self._keys.pop(airplane.id, None)
+        if key is None:
+            return
+        cell = self._cells[key]
+        del cell[airplane.id]
+        if not cell:
+            del self._cells[key]
+
+    def _move(self, airplane, key):
+        self.remove(airplane)
+        self._cells.setdefault(key, {})[airplane.id] = airplane
+        self._keys[airplane.id] = key
+
+    def update(self, airplane):
+        """Replace l'avion si sa cellule a changé ; retourne True s'il a bougé"""
+        key = self.key_for(airplane.level, airplane.x, airplane.y)
+        if self._keys.get(airplane.id) == key:
+            return False
+        self._move(airplane, key)
+        return True
+
+    def sync(self, airplanes):
+        """Met à jour l'index après un tick (déplacements et changements de niveau)"""
+        for airplane in airplanes:
+            self.update(airplane)
+
+    def sync_fleet(self, fleet):
+        """
+        Variante vectorisée de sync() pour models.fleet.Fleet : les cellules
+        sont calculées en bloc et seuls les avions qui changent de cellule
+        sont déplacés dans l'index.
+        """
+        import numpy as np
+
+        level, cell_x, cell_y, packed = self._fleet_cells(fleet)
+        previous = fleet.column('cell')
+        changed = np.flatnonzero(packed != previous)
+        previous[changed] = packed[changed]
+
+        airplanes = fleet.airplanes
+        for row, lvl, cx, cy in zip(changed.tolist(), level[changed].tolist(),
+                                    cell_x[changed].tolist(), cell_y[changed].tolist()):
+            self._move(airplanes[row], (lvl, cx, cy))
+
+    def rebuild_fleet(self, fleet):
+        """
+        Reconstruit tout l'index d'un bloc pour une flotte (après un
+        chargement) : cellules calculées en bloc, une insertion par avion.
+        """
+        self.clear()
+        level, cell_x, cell_y, packed = self._fleet_cells(fleet)
+        fleet.column('cell')[:] = packed
+
+        cells = self._cells
+        keys = list(zip(level.tolist(), cell_x.tolist(), cell_y.tolist()))
+        ids = [airplane.id for airplane in fleet.airplanes]
+        for airplane_id, airplane, key in zip(ids, fleet.airplanes, keys):
+            cell = cells.get(key)
+            if cell is None:
+                cells[key] = cell = {}
+            cell[airplane_id] = airplane
+        self._keys = dict(zip(ids, keys))
+
+    def _fleet_cells(self, fleet):
+        import numpy as np
+
+        level = fleet.column('level').astype(np.int64)
+        cell_x = np.floor(fleet.column('x') / self.cell_size).astype(np.int64)
+        cell_y = np.floor(fleet.column('y') / self.cell_size).astype(np.int64)
+        packed = (level << 42) | ((cell_x & 0x1FFFFF) << 21) | (cell_y & 0x1FFFFF)
+        return level, cell_x, cell_y, packed
+
+    def clear(self):
+        self._cells.clear()
+        self._keys.clear()
+
+    def query(self, level, x, y, radius):
+        """Avions candidats du niveau dans les cellules couvrant le rayon"""
+        size = self.cell_size
+        min_x = math.floor((x - radius) / size)
+        max_x = math.floor((x + radius) / size)
+        min_y = math.floor((y - radius) / size)
+        max_y = math.floor((y + radius) / size)
+        cells = self._cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = cells.get((level, cell_x, cell_y))
+                if cell:
+                    yield from cell.values()
+
+    def neighbours(self, airplane, radius):
+        """Autres avions du même niveau à moins de radius"""
+        limit = radius * radius
+        x = airplane.x
+        y = airplane.y
+        for other in self.query(airplane.level, x, y, radius):
+            if other is airplane:
+                continue
+            dx = other.x - x
+            dy = other.y - y
+            if dx * dx + dy * dy < limit:
+                yield other
+
+    def has_neighbour(self, airplane, radius):
+        return next(self.neighbours(airplane, radius), None) is not None
+
+    def pairs_within(self, distance):
+        """Toutes les paires d'avions d'un même niveau à moins de distance"""
+        return [(a1, a2) for a1, a2, _ in self.pairs_with_distance(distance)]
+
+    def pairs_with_distance(self, distance):
+        """
+        Triplets (avion1, avion2, distance²) pour chaque paire d'un même
+        niveau à moins de distance.
+
+        Chaque paire n'est testée qu'une fois : une cellule est comparée à
+        elle-même puis à la moitié « avant » de son voisinage.
+        """
+        reach = math.ceil(distance / self.cell_size)
+        offsets = [(dx, dy)
+                   for dx in range(0, reach + 1)
+                   for dy in range(-reach, reach + 1)
+                   if dx > 0 or dy > 0]
+        limit = distance * distance
+        cells = self._cells
+        pairs = []
+
+        for (level, cell_x, cell_y), cell in cells.items():
+            members = [(a, a.x, a.y) for a in cell.values()]
+            for i, (a1, x1, y1) in enumerate(members):
+                for a2, x2, y2 in members[i + 1:]:
+                    dx = x1 - x2
+                    dy = y1 - y2
+                    squared = dx * dx + dy * dy
+                    if squared < limit:
+                        pairs.append((a1, a2, squared))
+
+            for dx_cell, dy_cell in offsets:
+                other = cells.get((level, cell_x + dx_cell, cell_y + dy_cell))
+                if not other:
+                    continue
+                for a2 in other.values():
+                    x2 = a2.x
+                    y2 = a2.y
+                    for a1, x1, y1 in members:
+                        dx = x1 - x2
+                        dy = y1 - y2
+                        squared = dx * dx + dy * dy
+                        if squared < limit:
+                            pairs.append((a1, a2, squared))
+
+        return pairs
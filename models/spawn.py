@@ -0,0 +1,118 @@
+import math
+import random
+
+from models.airplane import Airplane
+
+
+class SpawnPlanner:
+    """
+    Points d'entrée dans l'espace aérien, répartis en bruit bleu sur les
+    quatre bords.
+
+    Les emplacements sont tirés une fois par partie (échantillonnage de
+    Poisson sur le périmètre : deux emplacements sont toujours à au moins
+    SLOT_SPACING l'un de l'autre). Pour faire apparaître un avion, on
+    parcourt ces emplacements à partir d'un point au hasard et on garde le
+    premier dégagé, testé sur l'index spatial du niveau : le coût ne dépend
+    pas de la taille de la flotte.
+    """
+
+    MARGIN = 100          # distance des bords d'entrée au bord du radar
+    CLEARANCE = 150       # distance minimale à un avion du même niveau
+    SLOT_SPACING = 40     # distance minimale entre deux emplacements
+
+    def __init__(self, width, height, seed=None):
+        """
+        Args:
+            seed: Graine du tirage des emplacements (celle de la partie),
+                pour retrouver les mêmes après un chargement
+        """
+        self.width = width
+        self.height = height
+        self.slots = self._sample_slots(random.Random(seed))
+
+    def _edges(self):
+        """
+        Bords d'entrée parcourus en boucle dans le sens horaire :
+        (x0, y0, x1, y1, cap minimal, cap maximal)
+        """
+        margin = self.MARGIN
+        right = self.width - margin
+        bottom = self.height - margin
+        return (
+            (margin, margin, right, margin, 135, 225),   # haut, vers le sud
+            (right, margin, right, bottom, 225, 315),    # droite, vers l'ouest
+            (right, bottom, margin, bottom, 315, 405),   # bas, vers le nord
+            (margin, bottom, margin, margin, 45, 135),   # gauche, vers l'est
+        )
+
+    def _sample_slots(self, rng):
+        """
+        Échantillonnage de Poisson le long du périmètre : on avance d'un
+        écart aléatoire entre SLOT_SPACING et deux fois SLOT_SPACING, et on
+        écarte un point trop proche du précédent (ou du premier) dans les
+        coins.
+
+        Returns:
+            Liste de (x, y, cap minimal, cap maximal)
+        """
+        edges = [(edge, math.hypot(edge[2] - edge[0], edge[3] - edge[1]))
+                 for edge in self._edges()]
+        perimeter = sum(length for _, length in edges)
+        if perimeter <= 0:
+            return [(self.MARGIN, self.MARGIN, 0, 360)]
+
+        spacing = self.SLOT_SPACING
+        limit = spacing * spacing
+        slots = []
+        position = rng.uniform(0, spacing)
+        while position < perimeter:
+            remaining = position
+            for (x0, y0, x1, y1, heading_min, heading_max), length in edges:
+                if remaining <= length:
+                    break
+                remaining -= length
+            t = remaining / length if length else 0
+            x = x0 + (x1 - x0) * t
+            y = y0 + (y1 - y0) * t
+            neighbours = slots[-1:] + slots[:1]
+            if all((x - other[0]) ** 2 + (y - other[1]) ** 2 >= limit for other in neighbours):
+                slots.append((x, y, heading_min, heading_max))
+            position += spacing * (1 + rng.random())
+        return slots
+
+    def is_free(self, grid, level, x, y):
+        """Aucun avion du niveau à moins de CLEARANCE (requête sur l'index spatial)"""
+        limit = self.CLEARANCE * self.CLEARANCE
+        for other in grid.query(level, x, y, self.CLEARANCE):
+            dx = other.x - x
+            dy = other.y - y
+            if dx * dx + dy * dy < limit:
+                return False
+        return True
+
+    def find_slot(self, grid, level, rng):
+        """Premier emplacement dégagé à partir d'un point au hasard, ou None"""
+        slots = self.slots
+        start = rng.randrange(len(slots))
+        for offset in range(len(slots)):
+            slot = slots[(start + offset) % len(slots)]
+            if self.is_free(grid, level, slot[0], slot[1]):
+                return slot
+        return None
+
+    def plan(self, grid, rng):
+        """
+        Choisit un niveau au hasard, puis les autres s'il est saturé.
+
+        Returns:
+            (niveau, x, y, cap) ou None si aucun emplacement n'est dégagé
+        """
+        levels = list(range(Airplane.MIN_LEVEL, Airplane.MAX_LEVEL + 1))
+        rng.shuffle(levels)
+        for level in levels:
+            slot = self.find_slot(grid, level, rng)
+            if slot is not None:
+                x, y, heading_min, heading_max = slot
+                return level, x, y, rng.uniform(heading_min, heading_max) % 360
+        return None
@@ -0,0 +1,407 @@
+"""
+Diffusion de l'état de la simulation à des abonnés locaux (second écran,
+enregistreur, analyse), sur une socket TCP locale ou Unix.
+
+Le protocole est du JSON lines, un message par frame publiée :
+
+- keyframe : état complet (seq, tick, time, airplanes, stats, game_over) ;
+- delta : seq, base (seq de la frame précédente), tick, time, avions
+  apparus (spawned), retirés (removed), et pour les autres seulement les
+  champs qui ont changé (changed) ; stats et game_over s'ils ont changé.
+
+Un abonné reçoit une keyframe à la connexion puis les deltas ; toutes les
+keyframe_interval frames, tous reçoivent une keyframe. Un abonné qui ne lit
+pas assez vite (plus de buffer_limit octets en attente d'envoi) saute les
+frames suivantes et reprend par une keyframe quand il a rattrapé son
+retard : la simulation n'attend jamais un client.
+
+Le serveur tourne dans sa propre boucle asyncio (start/stop) ou dans une
+boucle existante (serve/aclose). Exemple :
+
+    python main.py --telemetry unix:/tmp/controle.sock
+    python -m models.telemetry unix:/tmp/controle.sock
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import threading
+
+# Champs d'un avion dans les messages, dans l'ordre des enregistrements
+FIELDS = ('name', 'x', 'y', 'level', 'speed', 'heading', 'fuel', 'state',
+          'has_emergency', 'in_danger_zone')
+
+
+def airplane_record(airplane):
+    """
+    Tuple des FIELDS d'un AirplaneSnapshot, arrondi au dixième : un avion
+    immobile ou un champ qui ne bouge qu'en dessous de la précision
+    affichée ne produit pas de delta.
+    """
+    return (airplane.name, round(airplane.x, 1), round(airplane.y, 1), airplane.level,
+            round(airplane.speed), round(airplane.heading, 1), round(airplane.fuel, 1),
+            airplane.state.value, airplane.has_emergency, airplane.in_danger_zone)
+
+
+def frame_state(snapshot):
+    """{id: airplane_record} d'un FrameSnapshot"""
+    return {airplane.id: airplane_record(airplane) for airplane in snapshot.airplanes}
+
+
+def diff_states(previous, current):
+    """
+    Returns:
+        (spawned, removed, changed) : [[id, *record]], [id],
+        [[id, {champ: valeur}]]
+    """
+    spawned = []
+    changed = []
+    for airplane_id, record in current.items():
+        old = previous.get(airplane_id)
+        if old is None:
+            spawned.append([airplane_id, *record])
+        elif old != record:
+            changed.append([airplane_id, {FIELDS[index]: value
+                                          for index, (before, value) in enumerate(zip(old, record))
+                                          if before != value}])
+    removed = [airplane_id for airplane_id in previous if airplane_id not in current]
+    return spawned, removed, changed
+
+
+def encode(message):
+    return (json.dumps(message, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def parse_address(address):
+    """
+    'unix:/chemin' -> ('unix', chemin) ; 'hôte:port' ou 'port' -> ('tcp', hôte, port),
+    sur 127.0.0.1 par défaut : le serveur n'écoute que localement.
+    """
+    if address.startswith('unix:'):
+        return ('unix', address[len('unix:'):])
+    host, _, port = address.rpartition(':')
+    return ('tcp', host or '127.0.0.1', int(port))
+
+
+class _Subscriber:
+    """Un client connecté et ce qu'il a reçu"""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.task = asyncio.current_task()
+        self.synced = False  # a reçu toutes les frames depuis sa dernière keyframe
+        self.sent = 0
+        self.dropped = 0
+
+
+class TelemetryServer:
+    """
+    Diffuse les FrameSnapshot publiés par la simulation à tous les abonnés.
+
+    publish() peut être appelé depuis n'importe quel thread et ne bloque
+    pas : seul le dernier snapshot est gardé jusqu'à ce que la boucle
+    asyncio le traite. Si elle a pris du retard, les frames intermédiaires
+    sont fusionnées dans le delta suivant.
+    """
+
+    KEYFRAME_INTERVAL = 100
+    BUFFER_LIMIT = 256 * 1024  # octets en attente d'envoi par client
+
+    def __init__(self, address=None, keyframe_interval=None, buffer_limit=None):
+        """
+        Args:
+            address: Voir parse_address ; None pour n'accepter que des
+                clients locaux (local_socket)
+        """
+        self.address = address
+        self.keyframe_interval = keyframe_interval or self.KEYFRAME_INTERVAL
+        self.buffer_limit = buffer_limit if buffer_limit is not None else self.BUFFER_LIMIT
+        self.subscribers = []
+        self.seq = 0
+        self.state = {}
+        self.header = None  # dernier (tick, time, stats, game_over) diffusé
+        self.bytes_sent = 0
+        self._keyframe = None  # keyframe encodée de la frame courante
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._stopping = None
+        self._lock = threading.Lock()
+        self._pending = None
+        self._scheduled = False
+
+    async def serve(self):
+        """Commence à écouter dans la boucle asyncio courante"""
+        self._loop = asyncio.get_running_loop()
+        if self.address is None:
+            return
+        kind, *where = parse_address(self.address)
+        if kind == 'unix':
+            self._server = await asyncio.start_unix_server(self._handle, path=where[0])
+        else:
+            self._server = await asyncio.start_server(self._handle, *where)
+
+    async def aclose(self):
+        with self._lock:
+            self._loop = None
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            kind, *where = parse_address(self.address)
+            if kind == 'unix' and os.path.exists(where[0]):
+                os.unlink(where[0])
+        subscribers, self.subscribers = self.subscribers, []
+        for subscriber in subscribers:
+            # close() attendrait que le tampon d'envoi se vide, ce qui
+            # n'arrive jamais avec un abonné qui ne lit plus
+            subscriber.writer.transport.abort()
+        # Les lectures en cours se terminent sur la fermeture des connexions
+        await asyncio.gather(*(subscriber.task for subscriber in subscribers),
+                             return_exceptions=True)
+
+    def start(self):
+        """Fait tourner le serveur dans un thread avec sa propre boucle asyncio"""
+        ready = threading.Event()
+        errors = []
+
+        async def run():
+            self._stopping = asyncio.Event()
+            try:
+                await self.serve()
+            except OSError as error:
+                errors.append(error)
+                ready.set()
+                return
+            ready.set()
+            await self._stopping.wait()
+            await self.aclose()
+
+        self._thread = threading.Thread(target=asyncio.run, args=(run(),), name="telemetry",
+                                        daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            self._thread.join()
+            self._thread = None
+            raise errors[0]
+
+    def stop(self):
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._stopping.set)
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def local_socket(self):
+        """
+        Socket d'un nouvel abonné relié au serveur sans passer par le réseau
+        (socketpair) ; à ouvrir avec TelemetryClient.connect(sock=...).
+        """
+        client, server = socket.socketpair()
+        self._loop.call_soon_threadsafe(self._accept, server)
+        return client
+
+    def _accept(self, sock):
+        async def accept():
+            reader, writer = await asyncio.open_connection(sock=sock)
+            await self._handle(reader, writer)
+        self._loop.create_task(accept())
+
+    async def _handle(self, reader, writer):
+        subscriber = _Subscriber(writer)
+        self.subscribers.append(subscriber)
+        if self.header is not None:
+            self._send(subscriber, self._encoded_keyframe())
+            subscriber.synced = True
+        try:
+            # Rien n'est attendu des clients : la lecture ne sert qu'à voir la déconnexion
+            while await reader.read(4096):
+                pass
+        except ConnectionError:
+            pass
+        finally:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+            writer.close()
+
+    def publish(self, snapshot):
+        """Transmet un FrameSnapshot au serveur ; ne bloque jamais"""
+        with self._lock:
+            loop = self._loop
+            if loop is None:
+                return
+            self._pending = snapshot
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            # Boucle déjà fermée : le serveur s'arrête
+            pass
+
+    def _flush(self):
+        with self._lock:
+            snapshot = self._pending
+            self._pending = None
+            self._scheduled = False
+        if snapshot is not None:
+            self.broadcast(snapshot)
+
+    def broadcast(self, snapshot):
+        """Diffuse une frame (dans la boucle du serveur)"""
+        state = frame_state(snapshot)
+        header = (snapshot.tick, snapshot.time, snapshot.stats, snapshot.game_over)
+        previous_state, previous_header = self.state, self.header
+        self.seq += 1
+        self.state, self.header = state, header
+        self._keyframe = None
+
+        keyframe_due = previous_header is None or self.seq % self.keyframe_interval == 0
+        delta = None
+        for subscriber in self.subscribers[:]:
+            if subscriber.writer.is_closing():
+                self.subscribers.remove(subscriber)
+                continue
+            if subscriber.writer.transport.get_write_buffer_size() > self.buffer_limit:
+                subscriber.synced = False
+                subscriber.dropped += 1
+                continue
+            if subscriber.synced and not keyframe_due:
+                if delta is None:
+                    delta = self._encode_delta(previous_state, previous_header)
+                self._send(subscriber, delta)
+            else:
+                self._send(subscriber, self._encoded_keyframe())
+                subscriber.synced = True
+
+    def _send(self, subscriber, data):
+        subscriber.writer.write(data)
+        subscriber.sent += 1
+        self.bytes_sent += len(data)
+
+    def _encoded_keyframe(self):
+        if self._keyframe is None:
+            tick, time, stats, game_over = self.header
+            self._keyframe = encode({
+                'type': 'keyframe', 'seq': self.seq, 'tick': tick, 'time': time,
+                'airplanes': [[airplane_id, *record] for airplane_id, record in self.state.items()],
+                'stats': stats, 'game_over': game_over,
+            })
+        return self._keyframe
+
+    def _encode_delta(self, previous_state, previous_header):
+        tick, time, stats, game_over = self.header
+        spawned, removed, changed = diff_states(previous_state, self.state)
+        message = {'type': 'delta', 'seq': self.seq, 'base': self.seq - 1, 'tick': tick,
+                   'time': time, 'spawned': spawned, 'removed': removed, 'changed': changed}
+        if stats != previous_header[2]:
+            message['stats'] = stats
+        if game_over != previous_header[3]:
+            message['game_over'] = game_over
+        return encode(message)
+
+
+class TelemetryClient:
+    """
+    Abonné asyncio : lit les messages du serveur et reconstitue l'état.
+
+    airplanes : {id: {champ: valeur}} à jour de la dernière frame reçue.
+    """
+
+    READ_LIMIT = 64 * 1024 * 1024  # une keyframe tient sur une seule ligne
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.seq = None
+        self.tick = None
+        self.time = None
+        self.airplanes = {}
+        self.stats = {}
+        self.game_over = False
+        self.keyframes = 0
+        self.deltas = 0
+
+    @classmethod
+    async def connect(cls, address=None, sock=None):
+        """Connexion à une adresse (voir parse_address) ou à une socket de local_socket()"""
+        if sock is not None:
+            reader, writer = await asyncio.open_connection(sock=sock, limit=cls.READ_LIMIT)
+        else:
+            kind, *where = parse_address(address)
+            if kind == 'unix':
+                reader, writer = await asyncio.open_unix_connection(where[0],
+                                                                    limit=cls.READ_LIMIT)
+            else:
+                reader, writer = await asyncio.open_connection(*where, limit=cls.READ_LIMIT)
+        return cls(reader, writer)
+
+    async def receive(self):
+        """Message suivant, appliqué à l'état ; None à la fermeture du serveur"""
+        line = await self.reader.readline()
+        if not line:
+            return None
+        message = json.loads(line)
+        self.apply(message)
+        return message
+
+    def apply(self, message):
+        """
+        Raises:
+            ValueError: delta qui ne suit pas la dernière frame reçue
+        """
+        if message['type'] == 'keyframe':
+            self.airplanes = {record[0]: dict(zip(FIELDS, record[1:]))
+                              for record in message['airplanes']}
+            self.stats = message['stats']
+            self.game_over = message['game_over']
+            self.keyframes += 1
+        else:
+            if message['base'] != self.seq:
+                raise ValueError(f"Delta {message['seq']} reçu après la frame {self.seq}")
+            airplanes = self.airplanes
+            for airplane_id in message['removed']:
+                del airplanes[airplane_id]
+            for record in message['spawned']:
+                airplanes[record[0]] = dict(zip(FIELDS, record[1:]))
+            for airplane_id, fields in message['changed']:
+                airplanes[airplane_id].update(fields)
+            self.stats = message.get('stats', self.stats)
+            self.game_over = message.get('game_over', self.game_over)
+            self.deltas += 1
+        self.seq = message['seq']
+        self.tick = message['tick']
+        self.time = message['time']
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _watch(address):
+    client = await TelemetryClient.connect(address)
+    while True:
+        message = await client.receive()
+        if message is None:
+            break
+        print(f"{message['type']:8} seq {client.seq:6d}  tick {client.tick:7d}  "
+              f"avions {len(client.airplanes):5d}  score {client.stats.get('score', 0)}")
+    await client.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spectateur de la télémétrie")
+    parser.add_argument('address', help="unix:/chemin, hôte:port ou port")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_watch(args.address))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+import math
+import random
+import unittest
+
+import numpy as np
+
+from models.airplane import Airplane, AirplaneState
+from models.conflict_probe import ConflictProbe
+from models.events import EventLog
+from models.game_manager import GameManager
+
+DT = 0.05
+
+
+def _game(seed, engine, count=150, size=600, landing=0.3):
+    """Flotte dense tirée au hasard, une part des avions du niveau 1 en approche"""
+    rng = random.Random(seed)
+    game_manager = GameManager(size, size, engine=engine, events=EventLog(), seed=seed)
+    for airplane in game_manager.airplanes[:]:
+        game_manager.remove_airplane(airplane)
+    for index in range(count):
+        airplane = Airplane(x=rng.uniform(0, size), y=rng.uniform(0, size), level=index % 3 + 1,
+                            speed=rng.randint(200, 400), heading=rng.uniform(0, 360),
+                            fuel=rng.randint(40, 100), airplane_id=index + 1)
+        if airplane.level == 1 and rng.random() < landing:
+            airplane.state = AirplaneState.LANDING
+            airplane.landing_target_x = game_manager.landing_zone_x
+            airplane.landing_target_y = game_manager.landing_zone_y
+        elif rng.random() < 0.05:
+            airplane.state = AirplaneState.HOLDING
+        game_manager.add_airplane(airplane)
+    return game_manager
+
+
+def _brute_force(game_manager, horizon):
+    """
+    Distance minimale de chaque paire d'un même niveau, en simulant chaque
+    avion tick par tick avec Airplane.update ; un avion en approche s'arrête
+    en entrant dans la zone.
+
+    Returns:
+        {(id1, id2): distance minimale sur les ticks}
+    """
+    ticks = int(math.ceil(horizon / DT))
+    radius_squared = game_manager.landing_zone_radius ** 2
+    tracks = []
+    for original in game_manager.airplanes:
+        # Copie détachée de la flotte : update() avance l'avion lui-même
+        airplane = Airplane(x=original.x, y=original.y, level=original.level,
+                            speed=original.speed, heading=original.heading,
+                            fuel=original.fuel, airplane_id=original.id)
+        airplane.state = original.state
+        airplane.landing_target_x = original.landing_target_x
+        airplane.landing_target_y = original.landing_target_y
+        approach = airplane.state == AirplaneState.LANDING and airplane.level == 1
+        points = [(airplane.x, airplane.y)]
+        for _ in range(ticks):
+            airplane.update(DT)
+            if airplane.state == AirplaneState.LANDED:
+                break
+            points.append((airplane.x, airplane.y))
+            if approach and ((airplane.x - game_manager.landing_zone_x) ** 2 +
+                             (airplane.y - game_manager.landing_zone_y) ** 2 <= radius_squared):
+                break
+        track = np.full((ticks + 1, 2), np.nan)
+        track[:len(points)] = points
+        tracks.append(track)
+
+    tracks = np.array(tracks)
+    ids = [airplane.id for airplane in game_manager.airplanes]
+    levels = np.array([airplane.level for airplane in game_manager.airplanes])
+    result = {}
+    for i in range(len(ids)):
+        others = np.flatnonzero(levels[i + 1:] == levels[i]) + i + 1
+        gap = np.hypot(*(tracks[others] - tracks[i]).transpose(2, 0, 1))
+        gap = np.where(np.isnan(gap), np.inf, gap).min(axis=1)
+        for j, distance in zip(others.tolist(), gap.tolist()):
+            if distance < math.inf:
+                result[tuple(sorted((ids[i], ids[j])))] = distance
+    return result
+
+
+class ProbeTest(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+        probe = ConflictProbe(max_conflicts=10 ** 6)
+        separation = probe.separation
+        # Entre deux ticks, la distance continue peut descendre sous la
+        # distance échantillonnée d'au plus un demi-tick de déplacement relatif
+        tolerance = 2 * Airplane.MAX_SPEED * 0.1 * DT / 2
+        # 600 avions : au-delà de WINDOWED_FLEET, l'horizon est découpé en fenêtres
+        cases = [(seed, 150, 600) for seed in range(4)] + [(4, 600, 1200)]
+        for seed, count, size in cases:
+            for engine in ('objects', 'fleet'):
+                with self.subTest(seed=seed, engine=engine, count=count):
+                    game_manager = _game(seed, engine, count, size)
+                    expected = _brute_force(game_manager, probe.horizon)
+                    conflicts = probe.predict(game_manager, DT)
+                    found = {tuple(sorted(conflict.airplane_ids)): conflict
+                             for conflict in conflicts}
+
+                    self.assertEqual(len(found), len(conflicts))
+                    self.assertEqual([conflict.time for conflict in conflicts],
+                                     sorted(conflict.time for conflict in conflicts))
+                    for pair, distance in expected.items():
+                        if distance < separation - tolerance:
+                            self.assertIn(pair, found)
+                    for pair, conflict in found.items():
+                        self.assertLess(conflict.distance, separation)
+                        self.assertLess(abs(conflict.distance - expected[pair]), tolerance + 1e-6)
+
+    def test_turning_aircraft_are_predicted(self):
+        # Les approches en virage ne sont pas ignorées par l'élagage
+        probe = ConflictProbe(max_conflicts=10 ** 6)
+        game_manager = _game(7, 'fleet', landing=1.0)
+        turning = {airplane.id for airplane in game_manager.airplanes
+                   if airplane.state == AirplaneState.LANDING}
+        conflicts = probe.predict(game_manager, DT)
+        self.assertTrue(any(turning & set(conflict.airplane_ids) for conflict in conflicts))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import math
+import unittest
+
+from models.airplane import Airplane, AirplaneState
+from models.events import EventLog
+from models.game_manager import GameManager
+
+
+class EngineParityTest(unittest.TestCase):
+
+    def _run(self, engine):
+        game_manager = GameManager(engine=engine, events=EventLog(), seed=5)
+        for _ in range(30):
+            game_manager.spawn_airplane()
+        # Des retraits désalignent les lignes de la flotte et la liste des avions
+        for airplane in game_manager.airplanes[2:12:3]:
+            game_manager.handle_landing(airplane)
+        game_manager.score = 0
+        for index, airplane in enumerate(game_manager.airplanes):
+            if index % 2 == 0:
+                airplane.fuel = 0.0001
+            else:
+                airplane.x, airplane.y = game_manager.landing_zone_x, game_manager.landing_zone_y
+                airplane.level = 1
+                airplane.speed = 0
+                airplane.state = AirplaneState.LANDING
+        game_manager.update(0.05)
+        return game_manager.score, game_manager.lives, game_manager.planes_landed
+
+    def test_crashes_and_landings_in_the_same_order(self):
+        # Le score est borné à 0 : crashs et atterrissages doivent être
+        # appliqués dans le même ordre par les deux moteurs
+        self.assertEqual(self._run('objects'), self._run('fleet'))
+
+
+def _empty_game(engine):
+    """Partie sans avion et sans apparition"""
+    game_manager = GameManager(engine=engine, events=EventLog(), seed=1)
+    for airplane in game_manager.airplanes[:]:
+        game_manager.remove_airplane(airplane)
+    game_manager.spawn_interval = math.inf
+    return game_manager
+
+
+class SweptCollisionTest(unittest.TestCase):
+
+    def _step(self, engine, second_y):
+        game_manager = _empty_game(engine)
+        lives = game_manager.lives
+        # Face à face à 100 px : en un pas de 2 s, chacun avance de 80 px et
+        # ils finissent à 60 px l'un de l'autre, après s'être croisés
+        game_manager.add_airplane(Airplane(x=300, y=300, level=2, speed=400, heading=90,
+                                           airplane_id=1))
+        game_manager.add_airplane(Airplane(x=400, y=second_y, level=2, speed=400, heading=270,
+                                           airplane_id=2))
+        game_manager.update(2.0)
+        return lives - game_manager.lives, len(game_manager.airplanes)
+
+    def test_crossing_within_one_step_is_a_collision(self):
+        for engine in ('objects', 'fleet'):
+            with self.subTest(engine=engine):
+                self.assertEqual(self._step(engine, 300), (1, 0))
+
+    def test_passing_at_a_distance_is_not(self):
+        for engine in ('objects', 'fleet'):
+            with self.subTest(engine=engine):
+                self.assertEqual(self._step(engine, 340), (0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
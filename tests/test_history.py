@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from models.airplane import Airplane
+from models.events import EventLog
+from models.game_manager import GameManager
+from models.history import TrajectoryHistory, load_columns
+
+
+class TrajectoryHistoryTest(unittest.TestCase):
+
+    def test_memory_is_fixed_over_a_long_game(self):
+        history = TrajectoryHistory(tracks=32, length=16, interval=1)
+        game_manager = GameManager(events=EventLog(), seed=3, history=history)
+        memory = history.memory
+        shapes = {name: column.shape for name, column in history._data.items()}
+        seen = set()
+        for _ in range(3000):
+            game_manager.update(0.05)
+            game_manager.lives = 3
+            seen.update(airplane.id for airplane in game_manager.airplanes)
+
+        self.assertGreater(len(seen), history.tracks)  # des pistes ont été réutilisées
+        self.assertEqual(history.memory, memory)
+        self.assertEqual({name: column.shape for name, column in history._data.items()}, shapes)
+        self.assertLessEqual(len(set(history.columns()['airplane_id'].tolist())), history.tracks)
+
+    def test_retired_tracks_are_recycled_oldest_first(self):
+        history = TrajectoryHistory(tracks=2, length=4)
+        airplanes = [Airplane(x=index, y=index, airplane_id=index) for index in range(1, 5)]
+        for tick, airplane in enumerate(airplanes, 1):
+            history.retire(airplane, tick)
+            kept = sorted(set(history.columns()['airplane_id'].tolist()))
+            self.assertEqual(kept, [airplane.id for airplane in airplanes[max(0, tick - 2):tick]])
+
+        columns = history.columns()
+        self.assertEqual(columns['retired_tick'].tolist(), [3, 4])
+
+    def test_columns_round_trip_through_export(self):
+        history = TrajectoryHistory(tracks=64, length=8, interval=2)
+        game_manager = GameManager(events=EventLog(), seed=4, history=history)
+        for _ in range(200):
+            game_manager.update(0.05)
+        columns = history.columns()
+        self.assertGreater(len(columns['x']), 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'trajectoires.npz')
+            history.export(path)
+            loaded = load_columns(path)
+
+        self.assertEqual(set(loaded), set(columns))
+        for name, column in columns.items():
+            self.assertEqual(loaded[name].dtype, column.dtype)
+            np.testing.assert_array_equal(loaded[name], column)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from models import savegame
+from models.events import EventLog
+from models.game_manager import GameManager
+
+
+class LoadTest(unittest.TestCase):
+
+    def test_load_drops_pending_commands(self):
+        game_manager = GameManager(events=EventLog(), seed=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'partie.sav')
+            savegame.save(game_manager, path)
+            airplane = game_manager.airplanes[0]
+            game_manager.queue_commands([(airplane.id, 'hold', ())])
+
+            savegame.load(path, game_manager)
+
+        self.assertEqual(game_manager.pending_commands, [])
+        self.assertEqual(game_manager.command_results, [])
+        game_manager.update(0.05)
+        self.assertEqual(game_manager.command_results, [])
+        self.assertEqual(game_manager.command_log, [])
+
+
+class VersionTest(unittest.TestCase):
+
+    def _saved_as(self, directory, version, game_manager):
+        """Sauvegarde game_manager en réécrivant la version de l'en-tête"""
+        path = os.path.join(directory, 'partie.sav')
+        savegame.save(game_manager, path)
+        with open(path, 'r+b') as file:
+            magic, _, meta_size = savegame.HEADER.unpack(file.read(savegame.HEADER.size))
+            file.seek(0)
+            file.write(savegame.HEADER.pack(magic, version, meta_size))
+        return path
+
+    def test_newer_version_is_rejected(self):
+        game_manager = GameManager(events=EventLog(), seed=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = self._saved_as(directory, savegame.VERSION + 1, game_manager)
+            with self.assertRaises(savegame.SnapshotError):
+                savegame.read_meta(path)
+
+    def test_version_1_ignores_later_fields(self):
+        game_manager = GameManager(events=EventLog(), seed=1)
+        game_manager.update(0.05)
+        game_manager.pending_spawns = 2
+        with tempfile.TemporaryDirectory() as directory:
+            path = self._saved_as(directory, 1, game_manager)
+            restored = savegame.load(path, events=EventLog())
+
+        self.assertEqual(restored.pending_spawns, 0)
+        for airplane in restored.airplanes:
+            self.assertEqual((airplane.prev_x, airplane.prev_y), (airplane.x, airplane.y))
+
+
+if __name__ == '__main__':
+    unittest.main()
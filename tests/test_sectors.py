@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from models.airplane import Airplane
+from models.controllers import AutoLandController
+from models.events import EventLog
+from models.game_manager import GameManager
+from models.replay import state_digest
+from models.sectors import SectorCoordinator
+
+LIVES = 10 ** 6
+
+
+def _play(game_manager, ticks=400):
+    """
+    Partie dense et reproductible : collisions, collisions évitées,
+    atterrissages et passages de frontière dès les premières secondes.
+
+    Returns:
+        (statistiques sans la répartition par secteur, empreinte de l'état)
+    """
+    for airplane in game_manager.airplanes[:]:
+        game_manager.remove_airplane(airplane)
+    rng = random.Random(5)
+    for index in range(300):
+        game_manager.add_airplane(Airplane(
+            x=rng.uniform(0, game_manager.radar_width),
+            y=rng.uniform(0, game_manager.radar_height),
+            level=index % 3 + 1, speed=rng.randint(200, 400), heading=rng.uniform(0, 360),
+            fuel=rng.randint(60, 100), airplane_id=1000 + index))
+    game_manager.lives = LIVES
+
+    controller = AutoLandController()
+    for _ in range(ticks):
+        controller.update(game_manager, 0.05)
+        game_manager.update(0.05)
+    stats = game_manager.get_stats()
+    stats.pop('sector_planes', None)
+    return stats, state_digest(game_manager)
+
+
+class CoordinatorTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.expected = _play(GameManager(1600, 1200, events=EventLog(), seed=3))
+
+    def test_reference_game_exercises_the_rules(self):
+        stats, _ = self.expected
+        self.assertLess(stats['lives'], LIVES)
+        self.assertGreater(stats['avoided'], 0)
+        self.assertGreater(stats['landed'], 0)
+
+    def test_local_sectors_match_single_manager(self):
+        with SectorCoordinator(1600, 1200, sectors=4, events=EventLog(), seed=3,
+                               processes=False) as coordinator:
+            self.assertEqual(_play(coordinator), self.expected)
+
+    def test_process_sectors_match_single_manager(self):
+        with SectorCoordinator(1600, 1200, sectors=4, events=EventLog(), seed=3,
+                               processes=True) as coordinator:
+            self.assertEqual(_play(coordinator), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
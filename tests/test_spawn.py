@@ -0,0 +1,59 @@
+import math
+import unittest
+
+from models.airplane import Airplane, AirplaneState
+from models.events import EventLog
+from models.game_manager import GameManager
+
+
+class SpawnQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        game_manager = GameManager(events=EventLog(), seed=2)
+        for airplane in game_manager.airplanes[:]:
+            game_manager.remove_airplane(airplane)
+        game_manager.spawn_interval = math.inf
+        # Un avion en attente sur chaque emplacement d'entrée, à chaque niveau
+        self.blockers = []
+        for x, y, _, _ in game_manager.spawn_planner.slots:
+            for level in range(Airplane.MIN_LEVEL, Airplane.MAX_LEVEL + 1):
+                airplane = Airplane(x=x, y=y, level=level,
+                                    airplane_id=game_manager._new_airplane_id())
+                airplane.state = AirplaneState.HOLDING
+                game_manager.add_airplane(airplane)
+                self.blockers.append(airplane)
+        self.game_manager = game_manager
+
+    def test_blocked_spawn_is_queued(self):
+        game_manager = self.game_manager
+        count = len(game_manager.airplanes)
+
+        self.assertIsNone(game_manager.spawn_airplane())
+        self.assertEqual(game_manager.pending_spawns, 1)
+        game_manager.update(0.05)
+        self.assertEqual(len(game_manager.airplanes), count)
+        self.assertEqual(game_manager.pending_spawns, 1)
+
+    def test_queue_is_bounded(self):
+        for _ in range(GameManager.MAX_PENDING_SPAWNS + 3):
+            self.game_manager.spawn_airplane()
+        self.assertEqual(self.game_manager.pending_spawns, GameManager.MAX_PENDING_SPAWNS)
+
+    def test_queued_spawn_enters_once_a_slot_is_free(self):
+        game_manager = self.game_manager
+        game_manager.spawn_airplane()
+        # Les emplacements sont plus proches que CLEARANCE : on libère tout un niveau
+        for airplane in self.blockers:
+            if airplane.level == Airplane.MIN_LEVEL:
+                game_manager.remove_airplane(airplane)
+
+        game_manager.update(0.05)
+        self.assertEqual(game_manager.pending_spawns, 0)
+        spawned = [airplane for airplane in game_manager.airplanes
+                   if airplane not in self.blockers]
+        self.assertEqual(len(spawned), 1)
+        self.assertEqual(spawned[0].level, Airplane.MIN_LEVEL)
+
+
+if __name__ == '__main__':
+    unittest.main()
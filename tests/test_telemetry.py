@@ -0,0 +1,136 @@
+import asyncio
+import socket
+import threading
+import time
+import unittest
+
+from models.events import EventLog
+from models.game_manager import GameManager
+from models.simulation import take_snapshot
+from models.telemetry import FIELDS, TelemetryClient, TelemetryServer, frame_state
+
+
+def _game(airplanes=100):
+    game_manager = GameManager(events=EventLog(), seed=4)
+    for _ in range(airplanes):
+        game_manager.spawn_airplane()
+    return game_manager
+
+
+def _stalled_socket(server):
+    """Abonné qui ne lit jamais, avec un petit tampon de réception"""
+    sock = server.local_socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    return sock
+
+
+def _publish(server, game_manager, frames):
+    """Publie frames ticks de jeu ; retourne la durée du plus long publish()"""
+    longest = 0.0
+    for index in range(frames):
+        game_manager.update(0.05)
+        game_manager.lives = 3
+        snapshot = take_snapshot(game_manager)
+        start = time.perf_counter()
+        server.publish(snapshot)
+        longest = max(longest, time.perf_counter() - start)
+        if index % 20 == 0:
+            time.sleep(0.001)  # laisse la boucle du serveur écrire
+    return longest
+
+
+async def _drain(client, timeout=0.5):
+    """Lit les messages jusqu'à ce que le serveur se taise"""
+    messages = []
+    while True:
+        try:
+            message = await asyncio.wait_for(client.receive(), timeout)
+        except asyncio.TimeoutError:
+            return messages
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+class StreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TelemetryServer(keyframe_interval=50)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+        self.game_manager = _game()
+
+    def test_keyframe_on_join(self):
+        _publish(self.server, self.game_manager, 5)
+        time.sleep(0.1)
+
+        async def join():
+            client = await TelemetryClient.connect(sock=self.server.local_socket())
+            message = await asyncio.wait_for(client.receive(), 5)
+            await client.close()
+            return message
+
+        message = asyncio.run(join())
+        self.assertEqual(message['type'], 'keyframe')
+        self.assertEqual(message['tick'], self.game_manager.tick)
+        self.assertEqual(len(message['airplanes']), len(self.game_manager.airplanes))
+
+    def test_deltas_rebuild_last_frame(self):
+        async def follow():
+            client = await TelemetryClient.connect(sock=self.server.local_socket())
+            await asyncio.sleep(0.1)
+            for _ in range(120):
+                self.game_manager.update(0.05)
+                self.game_manager.lives = 3
+                self.server.publish(take_snapshot(self.game_manager))
+                await asyncio.sleep(0.002)
+            messages = await _drain(client)
+            await client.close()
+            return client, messages
+
+        client, messages = asyncio.run(follow())
+        snapshot = take_snapshot(self.game_manager)
+        self.assertGreater(client.deltas, 0)
+        self.assertEqual(client.tick, snapshot.tick)
+        self.assertEqual(client.airplanes, {airplane_id: dict(zip(FIELDS, record))
+                                            for airplane_id, record in frame_state(snapshot).items()})
+        self.assertEqual([message['type'] for message in messages[:1]], ['keyframe'])
+
+    def test_stalled_subscriber_does_not_block_publish(self):
+        server = TelemetryServer(buffer_limit=16 * 1024)
+        server.start()
+        self.addCleanup(server.stop)
+        stalled = _stalled_socket(server)
+        self.addCleanup(stalled.close)
+        time.sleep(0.1)
+
+        longest = _publish(server, self.game_manager, 300)
+        self.assertLess(longest, 0.05)
+        time.sleep(0.2)
+
+        subscriber, = server.subscribers
+        self.assertFalse(subscriber.synced)
+        self.assertGreater(subscriber.dropped, 0)
+        self.assertLess(subscriber.sent, server.seq)
+
+
+class StopTest(unittest.TestCase):
+
+    def test_stop_with_stalled_subscriber(self):
+        server = TelemetryServer(buffer_limit=16 * 1024)
+        server.start()
+        stalled = _stalled_socket(server)
+        try:
+            time.sleep(0.1)
+            _publish(server, _game(), 1000)
+
+            stopping = threading.Thread(target=server.stop, daemon=True)
+            stopping.start()
+            stopping.join(5)
+            self.assertFalse(stopping.is_alive())
+        finally:
+            stalled.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,22 @@
-from views.main_window import MainWindow
-from views.radar_view import RadarScene
+import importlib
+
+# PySide6 n'est chargé qu'au premier accès à MainWindow ou RadarScene
+_EXPORTS = {
+    'MainWindow': 'views.main_window',
+    'RadarScene': 'views.radar_view',
+}
 
 __all__ = ['MainWindow', 'RadarScene']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,30 +1,120 @@
+import json
 import os
+import time
 from PySide6.QtWidgets import QMainWindow, QMessageBox
 from PySide6.QtCore import QTimer, QTime, QEvent, Qt
-from PySide6.QtUiTools import QUiLoader
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtCore import QFile
 from models.game_manager import GameManager
 from models.airplane import AirplaneState
+from models.events import INFO, ConsoleSink, EventLog, FeedSink
+from models.profiling import Profiler
+from models.replay import Recording
+from models.simulation import SimulationLoop, snapshot_airplane
 from views.radar_view import RadarScene
+from views.ui_cache import UI_PATH, load_form_class
 
 
 class MainWindow(QMainWindow):
     
-    def __init__(self):
+    SIMULATION_STEP = 0.05  # pas fixe de la simulation (20 Hz)
+    DISPLAY_INTERVAL = 16   # ms entre deux rafraîchissements de l'affichage
+    PERFORMANCE_INTERVAL = 250  # ms entre deux relevés de la surimpression de performance
+    
+    # Styles des valeurs du tableau de bord, construits une fois : un label
+    # ne reçoit un setStyleSheet (et le re-polish qui suit) que s'il change d'état
+    LABEL_STYLES = {
+        None: "",
+        'green': "color: #4CAF50; font-weight: bold;",
+        'blue': "color: #2196F3; font-weight: bold;",
+        'violet': "color: #9C27B0; font-weight: bold;",
+        'red': "color: #F44336; font-weight: bold;",
+        'orange': "color: #FF9800; font-weight: bold;",
+        'yellow': "color: #FFC107; font-weight: bold;",
+    }
+    LEVEL_COLORS = {1: 'green', 2: 'blue', 3: 'violet'}
+    _UNSET = object()
+    CONSOLE_LOG_LEVEL = INFO
+    SAVE_PATH = os.path.join(os.path.expanduser('~'), '.controle_aerien.sav')
+    # Partie en cours à la fermeture, distincte de l'emplacement de F5
+    AUTOSAVE_PATH = os.path.join(os.path.expanduser('~'), '.controle_aerien-auto.sav')
+    BEST_SCORE_PATH = os.path.join(os.path.expanduser('~'), '.controle_aerien-record.json')
+    HISTORY_PATH = os.path.join(os.path.expanduser('~'), 'controle_aerien-trajectoires.npz')
+    USE_COMPILED_UI = True  # False : toujours charger ui/mainwindow.ui avec QUiLoader
+    
+    def __init__(self, record_path=None, seed=None, profile=False, performance_overlay=False,
+                 sectors=None, telemetry=None, fleet_threshold=None):
+        """
+        Args:
+            record_path: Si donné, chaque partie est enregistrée pour être
+                rejouée avec models.replay (suffixe -2, -3... après un reset)
+            seed: Graine de la première partie
+            profile: Active dès le départ le chronométrage par phase
+                (F10 pour l'activer ou le couper, F11 pour afficher le rapport)
+            performance_overlay: Affiche dès le départ la surimpression de
+                performance sur le radar (F3 pour l'afficher ou la masquer)
+            sectors: Si donné, l'espace aérien est découpé en autant de
+                secteurs simulés chacun dans son processus (models.sectors)
+            telemetry: Adresse (unix:/chemin ou hôte:port) où diffuser
+                l'état de chaque tick aux abonnés (models.telemetry)
+            fleet_threshold: Taille de flotte au-delà de laquelle le radar
+                dessine tous les avions d'un seul item (RadarScene.FLEET_THRESHOLD
+                par défaut)
+        """
         super().__init__()
         
+        self.record_path = record_path
+        self._games_recorded = 0
+        
         self.load_ui()
+        # Dernières valeurs appliquées aux widgets du tableau de bord (voir _apply)
+        self._applied = {}
+        self._shown_stats = None
+        self._shown_selected = None
         
         radar_width = 800
         radar_height = 600
-        self.game_manager = GameManager(radar_width, radar_height)
+        self.event_feed = FeedSink()
+        self._event_feed_version = -1
+        events = EventLog(sinks=[ConsoleSink(self.CONSOLE_LOG_LEVEL), self.event_feed])
+        if sectors:
+            from models.sectors import SectorCoordinator
+            self.game_manager = SectorCoordinator(radar_width, radar_height, sectors=sectors,
+                                                  events=events, seed=seed,
+                                                  profiler=Profiler(enabled=profile))
+        else:
+            self.game_manager = GameManager(radar_width, radar_height, events=events, seed=seed,
+                                            profiler=Profiler(enabled=profile))
         
-        self.radar_scene = RadarScene(radar_width, radar_height, self.game_manager)
+        self.radar_scene = RadarScene(radar_width, radar_height, self.game_manager,
+                                      fleet_threshold=fleet_threshold)
         self.ui.graphicsView.setScene(self.radar_scene)
         
+        # La simulation tourne dans son propre thread à pas fixe ; le timer
+        # ne fait qu'afficher les snapshots qu'elle publie
+        self.simulation = SimulationLoop(self.game_manager, step=self.SIMULATION_STEP)
+        self.telemetry = None
+        if telemetry:
+            from models.telemetry import TelemetryServer
+            self.telemetry = TelemetryServer(telemetry)
+            self.telemetry.start()
+            self.simulation.listeners.append(self.telemetry.publish)
+        self.simulation.start()
+        
         self.game_timer = QTimer()
         self.game_timer.timeout.connect(self.update_game)
-        self.game_timer.start(50)
+        self.game_timer.start(self.DISPLAY_INTERVAL)
+        
+        # Temps d'affichage et images en retard, relevés par update_game
+        self.render_time = 0.0
+        self.frames = 0
+        self.late_frames = 0
+        self._last_frame = None
+        self._performance_sample = None
+        self.performance_timer = QTimer()
+        self.performance_timer.timeout.connect(self.update_performance_overlay)
+        if performance_overlay:
+            self.toggle_performance_overlay()
         
         self.elapsed_time = QTime(0, 0)
         
@@ -33,13 +123,43 @@ class MainWindow(QMainWindow):
         self.ui.graphicsView.viewport().installEventFilter(self)
         
         self.update_ui()
+        
+        # NumPy (sonde de conflits, historique, sauvegarde) se charge une fois la fenêtre affichée
+        QTimer.singleShot(0, self.finish_startup)
+    
+    def finish_startup(self):
+        """Étapes du lancement qui n'ont pas besoin de retarder la première image"""
+        probe = self.create_conflict_probe()
+        history = self.create_history()
+        with self.simulation.lock:
+            self.game_manager.conflict_probe = probe
+            self.game_manager.history = history
+            self.restore_best_score()
     
     def load_ui(self):
-        ui_file_path = os.path.join(os.path.dirname(__file__), '..', 'ui', 'mainwindow.ui')
-        ui_file = QFile(ui_file_path)
+        """
+        Construit le formulaire avec la classe précompilée (views.ui_cache),
+        sans analyser le XML ; QUiLoader ne sert que si elle est périmée et
+        ne peut être régénérée.
+        """
+        form_class = load_form_class() if self.USE_COMPILED_UI else None
+        if form_class is not None:
+            # setupUi applique directement à la fenêtre la feuille de style du .ui
+            self.ui = form_class()
+            self.ui.setupUi(self)
+        else:
+            self._load_ui_file()
+        
+        self.setWindowTitle("Contrôle Aérien - Tableau de Bord Coloré")
+        self.resize(1000, 700)
+    
+    def _load_ui_file(self):
+        from PySide6.QtUiTools import QUiLoader
+        
+        ui_file = QFile(UI_PATH)
         
         if not ui_file.open(QFile.ReadOnly):
-            raise Exception(f"Cannot open {ui_file_path}: {ui_file.errorString()}")
+            raise Exception(f"Cannot open {UI_PATH}: {ui_file.errorString()}")
         
         loader = QUiLoader()
         self.ui = loader.load(ui_file, None)
@@ -48,60 +168,31 @@ class MainWindow(QMainWindow):
         if not self.ui:
             raise Exception(loader.errorString())
         
-        self.setWindowTitle("Contrôle Aérien - Tableau de Bord Coloré")
-        self.resize(1000, 700)
-        
+        # La feuille de style du .ui reste sur la fenêtre chargée : on la
+        # reporte sur celle-ci, qui reçoit le widget central
+        self.setStyleSheet(self.ui.styleSheet())
         self.setCentralWidget(self.ui.centralwidget)
-        
-        self.setStyleSheet("""
-/* Style général (Dark Mode) */
-QMainWindow {
-    background-color: #2e2e2e;
-}
-QWidget#centralwidget {
-    background-color: #2e2e2e;
-}
-QGroupBox {
-    border: 2px solid #5a5a5a;
-    border-radius: 5px;
-    margin-top: 1ex;
-    font-weight: bold;
-    color: #ffffff;
-}
-QGroupBox::title {
-    subcontrol-origin: margin;
-    subcontrol-position: top center;
-    padding: 0 3px;
-    background-color: #2e2e2e;
-}
-QLabel {
-    color: #cccccc;
-}
-QGraphicsView {
-    background-color: #1e1e1e;
-    border: 1px solid #5a5a5a;
-}
-QSplitter::handle {
-    background-color: #5a5a5a;
-}
-""")
     
     def connect_signals(self):
         self.ui.button_climb.clicked.connect(self.on_climb)
         self.ui.button_descend.clicked.connect(self.on_descend)
         self.ui.button_land.clicked.connect(self.on_land)
         self.ui.button_hold.clicked.connect(self.on_hold)
+        QShortcut(QKeySequence(Qt.Key_F3), self).activated.connect(self.toggle_performance_overlay)
+        QShortcut(QKeySequence(Qt.Key_F5), self).activated.connect(self.quick_save)
+        QShortcut(QKeySequence(Qt.Key_F8), self).activated.connect(self.export_history)
+        QShortcut(QKeySequence(Qt.Key_F9), self).activated.connect(self.quick_load)
+        QShortcut(QKeySequence(Qt.SHIFT | Qt.Key_F9), self).activated.connect(
+            lambda: self.quick_load(self.AUTOSAVE_PATH))
+        QShortcut(QKeySequence(Qt.Key_F10), self).activated.connect(self.toggle_profiling)
+        QShortcut(QKeySequence(Qt.Key_F11), self).activated.connect(self.dump_profile)
     
     def eventFilter(self, obj, event):
         if obj == self.ui.graphicsView.viewport() and event.type() == QEvent.MouseButtonPress:
             if event.button() == Qt.LeftButton:
                 scene_pos = self.ui.graphicsView.mapToScene(event.pos())
                 
-                selected = self.radar_scene.get_airplane_at_pos(scene_pos.x(), scene_pos.y())
-                
-                self.update_selected_airplane_info()
-                self.radar_scene.update_airplanes()
-                
+                self.select_at(scene_pos)
                 return True
         
         return super().eventFilter(obj, event)
@@ -110,163 +201,194 @@ QSplitter::handle {
         """Gère les clics sur le radar (méthode legacy, remplacée par eventFilter)"""
         scene_pos = self.ui.graphicsView.mapToScene(event.pos())
         
-        selected = self.radar_scene.get_airplane_at_pos(scene_pos.x(), scene_pos.y())
-        
-        self.update_selected_airplane_info()
-        self.radar_scene.update_airplanes()
+        self.select_at(scene_pos)
+    
+    def select_at(self, scene_pos):
+        """
+        Sélection au clic : seuls l'ancien et le nouvel avion sélectionnés
+        sont redessinés, sans refiger ni réafficher toute la flotte.
+        """
+        with self.simulation.lock:
+            selected = self.radar_scene.get_airplane_at_pos(scene_pos.x(), scene_pos.y())
+            selected = snapshot_airplane(self.game_manager, selected)
+            self.simulation.publish_selection(selected)
+            snapshot = self.simulation.latest()
+        
+        self.radar_scene.set_selection(selected.id if selected is not None else None)
+        if snapshot is not None:
+            self.update_selected_airplane_info(snapshot)
     
     def update_game(self):
-        dt = 0.05
-        
-        if not self.game_manager.game_over:
-            self.game_manager.update(dt)
-            
-            self.radar_scene.update_airplanes()
-            self.update_ui()
-            
-            if self.game_manager.game_over:
-                self.show_game_over()
+        """Affiche le dernier état publié par la simulation, interpolé"""
+        snapshot = self.simulation.latest()
+        if snapshot is None:
+            return
+        
+        start = time.perf_counter()
+        # Image en retard : plus de deux intervalles depuis la précédente
+        if self._last_frame is not None and start - self._last_frame > 2 * self.DISPLAY_INTERVAL / 1000:
+            self.late_frames += 1
+        self._last_frame = start
+        
+        self.radar_scene.update_airplanes(snapshot, self.simulation.previous(),
+                                          self.simulation.interpolation_alpha())
+        self.update_ui(snapshot)
+        self.render_time += time.perf_counter() - start
+        self.frames += 1
+        
+        if snapshot.game_over:
+            self.game_timer.stop()
+            self.show_game_over()
     
-    def update_ui(self):
-        self.update_stats()
-        self.update_selected_airplane_info()
+    def update_ui(self, snapshot=None):
+        profiler = self.game_manager.profiler
+        mark = profiler.start()
+        if snapshot is None:
+            snapshot = self.simulation.latest()
+        self.update_stats(snapshot)
+        self.update_selected_airplane_info(snapshot)
+        self.update_event_feed()
+        profiler.lap('ui.update_ui', mark)
     
-    def update_stats(self):
-        stats = self.game_manager.get_stats()
+    def update_event_feed(self):
+        """Recopie le fil d'événements dans le journal, seulement s'il a changé"""
+        if self.event_feed.version == self._event_feed_version:
+            return
+        self._event_feed_version = self.event_feed.version
+        feed = self.ui.eventFeed
+        feed.setPlainText("\n".join(self.event_feed.snapshot()))
+        feed.verticalScrollBar().setValue(feed.verticalScrollBar().maximum())
+    
+    def _apply(self, widget, setter, value):
+        """
+        Appelle widget.setter(value) seulement si la valeur a changé depuis
+        le dernier appel : les propriétés Qt ne sont touchées qu'aux vrais
+        changements.
+        """
+        key = (widget, setter)
+        if self._applied.get(key, self._UNSET) != value:
+            self._applied[key] = value
+            getattr(widget, setter)(value)
+    
+    def _show_status(self, message):
+        if hasattr(self.ui, 'statusbar'):
+            self._apply(self.ui.statusbar, 'showMessage', message)
+    
+    def update_stats(self, snapshot):
+        stats = snapshot.stats
+        # Même snapshot que l'image précédente : rien n'a changé
+        if stats is self._shown_stats:
+            return
+        self._shown_stats = stats
+        ui = self.ui
         
-        self.ui.stat_value_score.setText(str(stats['score']))
+        self._apply(ui.stat_value_score, 'setText', str(stats['score']))
         
         minutes = int(stats['time'] // 60)
         seconds = int(stats['time'] % 60)
-        self.ui.stat_value_time.setText(f"{minutes:02d}:{seconds:02d}")
+        self._apply(ui.stat_value_time, 'setText', f"{minutes:02d}:{seconds:02d}")
         
-        self.ui.stat_value_landed.setText(str(stats['landed']))
+        self._apply(ui.stat_value_landed, 'setText', str(stats['landed']))
         
-        self.ui.stat_value_lives.setText(str(stats['lives']))
+        self._apply(ui.stat_value_lives, 'setText', str(stats['lives']))
         
-        if stats['lives'] <= 1:
-            self.ui.stat_value_lives.setStyleSheet("color: #F44336; font-weight: bold;")
+        self._apply(ui.stat_value_lives, 'setStyleSheet',
+                    self.LABEL_STYLES['red' if stats['lives'] <= 1 else None])
         
-        status_text = f"Avions actifs: {stats['active_planes']} | Niveau: {stats['difficulty']}"
-        if hasattr(self.ui, 'statusbar'):
-            self.ui.statusbar.showMessage(status_text)
+        if snapshot.selected is None:
+            self._show_status(self._stats_status(stats))
     
-    def update_selected_airplane_info(self):
-        airplane = self.game_manager.selected_airplane
+    @staticmethod
+    def _stats_status(stats):
+        status = f"Avions actifs: {stats['active_planes']} | Niveau: {stats['difficulty']}"
+        if 'sector_planes' in stats:
+            status += f" | Secteurs: {'/'.join(map(str, stats['sector_planes']))}"
+        return status
+    
+    def update_selected_airplane_info(self, snapshot):
+        airplane = snapshot.selected
+        # Un AirplaneSnapshot est immuable : le même objet n'a rien de nouveau
+        if airplane is self._shown_selected and airplane is not None:
+            return
+        self._shown_selected = airplane
+        ui = self.ui
+        apply = self._apply
         
         if airplane:
-            self.ui.button_climb.setEnabled(airplane.level < 3)
-            self.ui.button_descend.setEnabled(airplane.level > 1)
-            self.ui.button_hold.setEnabled(True)
+            apply(ui.button_climb, 'setEnabled', airplane.level < 3)
+            apply(ui.button_descend, 'setEnabled', airplane.level > 1)
+            apply(ui.button_hold, 'setEnabled', True)
             
             if airplane.state == AirplaneState.HOLDING:
-                self.ui.button_hold.setText("Reprendre Vol")
+                apply(ui.button_hold, 'setText', "Reprendre Vol")
             else:
-                self.ui.button_hold.setText("Attendre (Hold)")
+                apply(ui.button_hold, 'setText', "Attendre (Hold)")
             
             can_land = airplane.level == 1
             in_zone = self.game_manager._is_in_landing_zone(airplane)
-            self.ui.button_land.setEnabled(can_land)
+            apply(ui.button_land, 'setEnabled', can_land)
             
             if airplane.level != 1:
-                self.ui.button_land.setText("Atterrir (Niveau 1 requis)")
+                apply(ui.button_land, 'setText', "Atterrir (Niveau 1 requis)")
             elif airplane.state == AirplaneState.LANDING:
-                if in_zone:
-                    self.ui.button_land.setText("Annuler Atterrissage")
-                else:
-                    self.ui.button_land.setText("Annuler Atterrissage")
+                apply(ui.button_land, 'setText', "Annuler Atterrissage")
             elif in_zone:
-                self.ui.button_land.setText("Atterrir (Dans zone ✓)")
+                apply(ui.button_land, 'setText', "Atterrir (Dans zone ✓)")
             else:
-                self.ui.button_land.setText("Atterrir (Rejoindre zone)")
+                apply(ui.button_land, 'setText', "Atterrir (Rejoindre zone)")
             
-            self.ui.value_airplane_name.setText(airplane.name)
-            self.ui.value_altitude.setText(f"Niveau {airplane.level}")
-            self.ui.value_speed.setText(f"{int(airplane.speed)}")
-            self.ui.value_fuel.setText(f"{int(airplane.fuel)}%")
+            apply(ui.value_airplane_name, 'setText', airplane.name)
+            apply(ui.value_altitude, 'setText', f"Niveau {airplane.level}")
+            apply(ui.value_speed, 'setText', f"{int(airplane.speed)}")
+            apply(ui.value_fuel, 'setText', f"{int(airplane.fuel)}%")
             
-            if airplane.level == 1:
-                level_color = "#4CAF50"  # Vert
-            elif airplane.level == 2:
-                level_color = "#2196F3"  # Bleu
-            else:
-                level_color = "#9C27B0"  # Violet
-            self.ui.value_altitude.setStyleSheet(f"color: {level_color}; font-weight: bold;")
+            apply(ui.value_altitude, 'setStyleSheet', self.LABEL_STYLES[self.LEVEL_COLORS[airplane.level]])
             
             if airplane.fuel <= 15:
-                fuel_color = "#F44336"  # Rouge
+                fuel_color = 'red'
             elif airplane.fuel <= 30:
-                fuel_color = "#FF9800"  # Orange
+                fuel_color = 'orange'
             else:
-                fuel_color = "#FFC107"  # Jaune
-            self.ui.value_fuel.setStyleSheet(f"color: {fuel_color}; font-weight: bold;")
+                fuel_color = 'yellow'
+            apply(ui.value_fuel, 'setStyleSheet', self.LABEL_STYLES[fuel_color])
             
             status_msg = f"✈️ {airplane.name} sélectionné - Niveau: {airplane.level} - État: {airplane.state.value}"
             if can_land:
                 status_msg += " - 🛬 PRÊT À ATTERRIR"
-            if hasattr(self.ui, 'statusbar'):
-                self.ui.statusbar.showMessage(status_msg)
+            self._show_status(status_msg)
         else:
-            self.ui.button_climb.setEnabled(False)
-            self.ui.button_descend.setEnabled(False)
-            self.ui.button_land.setEnabled(False)
-            self.ui.button_hold.setEnabled(False)
+            apply(ui.button_climb, 'setEnabled', False)
+            apply(ui.button_descend, 'setEnabled', False)
+            apply(ui.button_land, 'setEnabled', False)
+            apply(ui.button_hold, 'setEnabled', False)
             
-            self.ui.value_airplane_name.setText("Aucun")
-            self.ui.value_altitude.setText("---")
-            self.ui.value_speed.setText("---")
-            self.ui.value_fuel.setText("---")
+            apply(ui.value_airplane_name, 'setText', "Aucun")
+            apply(ui.value_altitude, 'setText', "---")
+            apply(ui.value_speed, 'setText', "---")
+            apply(ui.value_fuel, 'setText', "---")
             
-            self.ui.button_land.setText("Atterrir (Land)")
-            self.ui.button_hold.setText("Attendre (Hold)")
+            apply(ui.button_land, 'setText', "Atterrir (Land)")
+            apply(ui.button_hold, 'setText', "Attendre (Hold)")
+            self._show_status(self._stats_status(snapshot.stats))
     
     def on_climb(self):
-        if self.game_manager.selected_airplane:
-            old_level = self.game_manager.selected_airplane.level
-            self.game_manager.selected_airplane.climb()
-            new_level = self.game_manager.selected_airplane.level
-            if new_level != old_level:
-                print(f"⬆️ {self.game_manager.selected_airplane.name} - Monté au niveau {new_level}")
-            else:
-                print(f"⚠️ {self.game_manager.selected_airplane.name} - Déjà au niveau maximum")
+        self._send_command('climb')
     
     def on_descend(self):
-        if self.game_manager.selected_airplane:
-            old_level = self.game_manager.selected_airplane.level
-            self.game_manager.selected_airplane.descend()
-            new_level = self.game_manager.selected_airplane.level
-            if new_level != old_level:
-                print(f"⬇️ {self.game_manager.selected_airplane.name} - Descendu au niveau {new_level}")
-            else:
-                print(f"⚠️ {self.game_manager.selected_airplane.name} - Déjà au niveau minimum")
+        self._send_command('descend')
     
     def on_land(self):
-        if self.game_manager.selected_airplane:
-            airplane = self.game_manager.selected_airplane
-            
-            landing_x = self.game_manager.landing_zone_x
-            landing_y = self.game_manager.landing_zone_y
-            
-            if airplane.state == AirplaneState.LANDING:
-                airplane.land(landing_x, landing_y)
-                print(f"❌ {airplane.name} - Atterrissage annulé, retour en vol normal")
-            else:
-                
-                if airplane.land(landing_x, landing_y):
-                    print(f"🛬 {airplane.name} - Instruction d'atterrissage donnée, direction zone verte")
-                else:
-                    print(f"❌ {airplane.name} - Atterrissage impossible! Doit être au niveau 1")
+        self._send_command('land')
     
     def on_hold(self):
-        if self.game_manager.selected_airplane:
-            airplane = self.game_manager.selected_airplane
-            
-            if airplane.state == AirplaneState.HOLDING:
-                airplane.hold()
-                print(f"▶️ {airplane.name} - Reprise du vol")
-            else:
-                airplane.hold()
-                print(f"⏸️ {airplane.name} - Mis en attente")
+        self._send_command('hold')
+    
+    def _send_command(self, command, *args):
+        # Comme les ordres des contrôleurs, appliqué au début du prochain tick
+        with self.simulation.lock:
+            airplane_id = self.game_manager.selected_id
+            if airplane_id is not None:
+                self.game_manager.queue_commands([(airplane_id, command, args)])
     
     def show_collision_warning(self):
         msg_box = QMessageBox(self)
@@ -349,14 +471,189 @@ QSplitter::handle {
         else:
             self.close()
     
+    @staticmethod
+    def create_conflict_probe():
+        """Prédiction des conflits affichée sur le radar, si NumPy est disponible"""
+        try:
+            from models.conflict_probe import ConflictProbe
+        except ImportError:
+            return None
+        return ConflictProbe()
+    
+    @staticmethod
+    def create_history():
+        """Historique des trajectoires (traînées du radar, F8), si NumPy est disponible"""
+        try:
+            from models.history import TrajectoryHistory
+        except ImportError:
+            return None
+        return TrajectoryHistory()
+    
+    def export_history(self):
+        """Exporte les dernières trajectoires en colonnes (models.history)"""
+        history = self.game_manager.history
+        if history is None:
+            self.statusBar().showMessage("❌ Historique des trajectoires indisponible", 3000)
+            return False
+        try:
+            history.export(self.HISTORY_PATH)
+        except OSError as error:
+            self.statusBar().showMessage(f"❌ Export impossible: {error}", 3000)
+            return False
+        self.statusBar().showMessage(f"📈 Trajectoires exportées dans {self.HISTORY_PATH}", 3000)
+        return True
+    
+    def restore_best_score(self):
+        """Reprend le meilleur score enregistré, ou à défaut celui de la sauvegarde F5"""
+        best_score = None
+        try:
+            with open(self.BEST_SCORE_PATH, encoding='utf-8') as file:
+                best_score = json.load(file)['best_score']
+        except (OSError, ValueError, KeyError, TypeError):
+            try:
+                from models import savegame
+                best_score = savegame.read_meta(self.SAVE_PATH)['best_score']
+            except (ImportError, OSError, ValueError):
+                return
+        self.game_manager.best_score = max(self.game_manager.best_score, best_score)
+    
+    def save_best_score(self):
+        try:
+            with open(self.BEST_SCORE_PATH, 'w', encoding='utf-8') as file:
+                json.dump({'best_score': self.game_manager.best_score}, file)
+        except OSError:
+            pass
+    
+    def quick_save(self, path=None):
+        """Sauvegarde la partie dans path (par défaut SAVE_PATH, l'emplacement de F5)"""
+        try:
+            from models import savegame
+            with self.simulation.lock:
+                savegame.save(self.game_manager, path or self.SAVE_PATH)
+        except (ImportError, OSError) as error:
+            self.statusBar().showMessage(f"❌ Sauvegarde impossible: {error}", 3000)
+            return False
+        self.statusBar().showMessage("💾 Partie sauvegardée (F9 pour la reprendre)", 3000)
+        return True
+    
+    def autosave(self):
+        """
+        À la fermeture : la partie en cours va dans AUTOSAVE_PATH (Maj+F9
+        pour la reprendre) ; une partie terminée n'est jamais sauvegardée.
+        """
+        if not self.game_manager.game_over:
+            return self.quick_save(self.AUTOSAVE_PATH)
+        try:
+            os.remove(self.AUTOSAVE_PATH)
+        except OSError:
+            pass
+        return False
+    
+    def quick_load(self, path=None):
+        """Reprend la partie de path (par défaut SAVE_PATH, l'emplacement de F5)"""
+        try:
+            from models import savegame
+            with self.simulation.lock:
+                best_score = self.game_manager.best_score
+                savegame.load(path or self.SAVE_PATH, self.game_manager)
+                self.game_manager.best_score = max(best_score, self.game_manager.best_score)
+                self.simulation.publish()
+        except (ImportError, OSError, ValueError) as error:
+            self.statusBar().showMessage(f"❌ Chargement impossible: {error}", 3000)
+            return False
+        
+        self.radar_scene.reset()
+        self.update_ui()
+        self._last_frame = None
+        self.game_timer.start(self.DISPLAY_INTERVAL)
+        self.statusBar().showMessage("📂 Partie reprise", 3000)
+        return True
+    
+    def toggle_performance_overlay(self):
+        visible = self.radar_scene.performance_overlay is None
+        self.radar_scene.set_performance_overlay(visible)
+        if visible:
+            self._performance_sample = None
+            self.update_performance_overlay()
+            self.performance_timer.start(self.PERFORMANCE_INTERVAL)
+        else:
+            self.performance_timer.stop()
+    
+    def update_performance_overlay(self):
+        """Relevé périodique : moyennes depuis le relevé précédent"""
+        overlay = self.radar_scene.performance_overlay
+        if overlay is None:
+            return
+        simulation = self.simulation
+        sample = (time.monotonic(), simulation.steps, simulation.update_time,
+                  self.frames, self.render_time, simulation.dropped_steps, self.late_frames)
+        previous, self._performance_sample = self._performance_sample, sample
+        # Reste dans le coin visible du radar, même si la vue défile
+        overlay.setPos(self.ui.graphicsView.mapToScene(10, 10))
+        if previous is None:
+            return
+        
+        elapsed, steps, update_time, frames, render_time, dropped, late = (
+            now - before for now, before in zip(sample, previous))
+        target_rate = 1 / simulation.step
+        tick_rate = steps / elapsed if elapsed > 0 else 0.0
+        # Retard : moins de 95 % de la cadence visée, ou des pas perdus
+        behind = (simulation.running and tick_rate < 0.95 * target_rate) or dropped > 0
+        overlay.show_stats(
+            tick_rate, target_rate,
+            update_time / steps * 1000 if steps else 0.0,
+            render_time / frames * 1000 if frames else 0.0,
+            len(self.radar_scene.items()), len(self.game_manager.airplanes),
+            simulation.dropped_steps, self.late_frames, behind)
+    
+    def toggle_profiling(self):
+        profiler = self.game_manager.profiler
+        profiler.enabled = not profiler.enabled
+        if profiler.enabled:
+            profiler.reset()
+            self.statusBar().showMessage("⏱️ Profilage activé (F11 pour le rapport)", 3000)
+        else:
+            self.statusBar().showMessage("⏱️ Profilage coupé", 3000)
+    
+    def dump_profile(self):
+        """Affiche en console le temps passé par phase"""
+        self.game_manager.profiler.dump()
+    
+    def save_recording(self):
+        if not self.record_path:
+            return
+        self._games_recorded += 1
+        path = self.record_path
+        if self._games_recorded > 1:
+            root, ext = os.path.splitext(path)
+            path = f"{root}-{self._games_recorded}{ext}"
+        with self.simulation.lock:
+            recording = Recording.from_game(self.game_manager, self.SIMULATION_STEP)
+        recording.save(path)
+    
     def restart_game(self):
-        self.game_manager.reset()
-        
-        self.radar_scene.airplane_items.clear()
-        self.radar_scene.explosion_items.clear()
-        self.radar_scene.clear()
+        self.save_recording()
+        with self.simulation.lock:
+            self.game_manager.reset()
+            self.simulation.publish()
         
-        self.radar_scene.draw_landing_zone()
-        self.radar_scene.draw_distance_circles()
+        self.radar_scene.reset()
         
         self.update_ui()
+        self._last_frame = None
+        self.game_timer.start(self.DISPLAY_INTERVAL)
+    
+    def closeEvent(self, event):
+        self.game_timer.stop()
+        self.performance_timer.stop()
+        self.simulation.stop()
+        if self.telemetry is not None:
+            self.telemetry.stop()
+        self.save_recording()
+        self.autosave()
+        self.save_best_score()
+        if self.game_manager.profiler.enabled:
+            self.dump_profile()
+        self.game_manager.events.close()
+        self.game_manager.close()
+        super().closeEvent(event)
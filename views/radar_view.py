@@ -1,97 +1,457 @@
-from PySide6.QtWidgets import QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem, QGraphicsPolygonItem
-from PySide6.QtCore import Qt, QPointF
-from PySide6.QtGui import QPen, QBrush, QColor, QPolygonF, QFont
+from PySide6.QtWidgets import (QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem,
+                               QGraphicsPolygonItem, QGraphicsLineItem, QGraphicsSimpleTextItem,
+                               QGraphicsItem, QStyleOptionGraphicsItem)
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import (QPen, QBrush, QColor, QPolygonF, QFont, QPainter, QPainterPath,
+                           QPixmap, QTransform, QFontMetricsF)
 from models.airplane import AirplaneState
+from models.events import EventType
+from models.simulation import take_snapshot
+from collections import deque
 import math
 
 
-class AirplaneGraphicsItem(QGraphicsPolygonItem):
+class AirplanePalette:
+    """
+    Formes et pinceaux partagés par tous les avions du radar.
+
+    Construits une seule fois au premier usage, puis réutilisés par chaque
+    AirplaneGraphicsItem au lieu d'allouer des QPolygonF/QBrush/QPen à
+    chaque rafraîchissement.
+    """
     
-    def __init__(self, airplane, game_manager):
-        super().__init__()
-        self.airplane = airplane
-        self.game_manager = game_manager
-        self.setZValue(10)
-        self.create_airplane_shape()
-        
-        self.label = QGraphicsTextItem(self)
-        self.label.setDefaultTextColor(QColor(255, 255, 255))
-        self.label.setPos(-20, -30)
-        
-        self.update_appearance()
+    COLORS = {
+        'emergency': (244, 67, 54),
+        'danger': (255, 87, 34),
+        'landing': (255, 152, 0),
+        'holding': (121, 85, 72),
+        'selected': (255, 215, 0),
+        'normal': (33, 150, 243),
+    }
     
-    def create_airplane_shape(self):
-        """Crée la forme de l'avion (triangle) avec taille selon le niveau"""
-        size_multiplier = self.airplane.level * 0.5
+    _instance = None
+    
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        self.shapes = {level: self._triangle(level) for level in range(1, 4)}
+        self.brushes = {name: QBrush(QColor(*rgb)) for name, rgb in self.COLORS.items()}
+        self.pens = {
+            'normal': QPen(QColor(255, 255, 255), 2),
+            'danger': QPen(QColor(244, 67, 54), 3),
+            'hover': QPen(QColor(255, 255, 0), 3),
+        }
+    
+    @staticmethod
+    def _triangle(level):
+        """Forme de l'avion (triangle) avec taille selon le niveau"""
+        size_multiplier = level * 0.5
         
         base_size = 10
         height = base_size * size_multiplier
         width = 7 * size_multiplier
         
-        triangle = QPolygonF([
+        return QPolygonF([
             QPointF(0, -height),
             QPointF(-width, height),
             QPointF(width, height)
         ])
-        self.setPolygon(triangle)
+
+
+class AirplaneGraphicsItem(QGraphicsPolygonItem):
+    """
+    Avion du radar, dessiné à partir d'un AirplaneSnapshot.
+    
+    L'item retient les dernières valeurs appliquées (niveau, couleur,
+    contour, texte, position, rotation) et ne touche aux propriétés Qt que
+    lorsqu'elles changent.
+    """
+    
+    def __init__(self, airplane, selected=False):
+        super().__init__()
+        self.airplane = airplane
+        self.selected = selected  # tenu par RadarScene.set_selection
+        self.setZValue(10)
         self.setFlag(QGraphicsPolygonItem.ItemIsSelectable, True)
         self.setAcceptHoverEvents(True)
-    
-    def update_appearance(self):
-        airplane = self.airplane
-        self.create_airplane_shape()
         
-        is_in_danger_zone = False
-        if self.game_manager:
-            for other in self.game_manager.airplanes:
-                if other != airplane and airplane.is_near(other):
-                    is_in_danger_zone = True
-                    break
+        self._hovered = False
+        self._level = None
+        self._color = None
+        self._pen = None
+        self._text = None
+        self._pos = None
+        self._rotation = None
+        
+        self.label = QGraphicsTextItem(self)
+        self.label.setDefaultTextColor(QColor(255, 255, 255))
+        self.label.setPos(-20, -30)
         
+        self.update_appearance()
+    
+    def create_airplane_shape(self):
+        """Applique la forme partagée correspondant au niveau de l'avion"""
+        self._level = self.airplane.level
+        self.setPolygon(AirplanePalette.get().shapes[self._level])
+    
+    @staticmethod
+    def pen_class(airplane, selected=False):
+        # Proximité lue dans la table des conflits du tick (GameManager.conflicts)
+        if airplane.in_danger_zone and not selected:
+            return 'danger'
+        return 'normal'
+    
+    @staticmethod
+    def color_class(airplane, selected=False):
         if airplane.is_in_danger():
-            color = QColor(244, 67, 54)
-        elif is_in_danger_zone:
-            color = QColor(255, 87, 34)
+            return 'emergency'
+        elif airplane.in_danger_zone:
+            return 'danger'
         elif airplane.state == AirplaneState.LANDING:
-            color = QColor(255, 152, 0)
+            return 'landing'
         elif airplane.state == AirplaneState.HOLDING:
-            color = QColor(121, 85, 72)
-        elif airplane.selected:
-            color = QColor(255, 215, 0)
-        else:
-            color = QColor(33, 150, 243)
+            return 'holding'
+        elif selected:
+            return 'selected'
+        return 'normal'
+    
+    def _pen_class(self):
+        if self._hovered:
+            return 'hover'
+        return self.pen_class(self.airplane, self.selected)
+    
+    def update_appearance(self, pose=None):
+        """
+        Args:
+            pose: (x, y, heading) interpolé à afficher, sinon celui du snapshot
+        """
+        airplane = self.airplane
+        palette = AirplanePalette.get()
         
-        self.setBrush(QBrush(color))
+        if airplane.level != self._level:
+            self.create_airplane_shape()
         
-        if is_in_danger_zone and not airplane.selected:
-            self.setPen(QPen(QColor(244, 67, 54), 3))
-        else:
-            self.setPen(QPen(QColor(255, 255, 255), 2))
+        color = self.color_class(airplane, self.selected)
+        if color != self._color:
+            self._color = color
+            self.setBrush(palette.brushes[color])
+        
+        self._refresh_pen()
+        
+        text = f"{airplane.name}\nN{airplane.level}"
+        if text != self._text:
+            self._text = text
+            self.label.setPlainText(text)
         
-        self.label.setPlainText(f"{airplane.name}\nN{airplane.level}")
-        self.setPos(airplane.x, airplane.y)
-        self.setRotation(airplane.heading)
+        x, y, heading = pose or (airplane.x, airplane.y, airplane.heading)
+        if (x, y) != self._pos:
+            self._pos = (x, y)
+            self.setPos(x, y)
+        if heading != self._rotation:
+            self._rotation = heading
+            self.setRotation(heading)
+    
+    def _refresh_pen(self):
+        pen = self._pen_class()
+        if pen != self._pen:
+            self._pen = pen
+            self.setPen(AirplanePalette.get().pens[pen])
     
     def hoverEnterEvent(self, event):
-        self.setPen(QPen(QColor(255, 255, 0), 3))
+        self._hovered = True
+        self._refresh_pen()
         super().hoverEnterEvent(event)
     
     def hoverLeaveEvent(self, event):
-        self.setPen(QPen(QColor(255, 255, 255), 2))
+        self._hovered = False
+        self._refresh_pen()
         super().hoverLeaveEvent(event)
 
 
+class TrailItem(QGraphicsItem):
+    """
+    Traînée d'un avion, prolongée au fil des relevés de models.history.
+    
+    Les points sont ajoutés au bout d'un QPainterPath sans jamais le
+    reconstruire. Pour que la traînée s'estompe et garde une longueur
+    bornée, le chemin est découpé en SEGMENTS tronçons : chaque tronçon est
+    tracé plus transparent que le suivant, et le plus ancien est abandonné
+    quand un nouveau commence.
+    """
+    
+    SEGMENTS = 4
+    COLOR = (144, 202, 249)
+    _pens = None
+    
+    def __init__(self, segment_points):
+        """
+        Args:
+            segment_points: Points par tronçon
+        """
+        super().__init__()
+        self.setZValue(4)
+        self.segment_points = segment_points
+        self.cursor = 0  # curseur de TrajectoryHistory.updates
+        self._paths = deque()  # (chemin, points), le plus ancien en tête
+        self._last = None
+        self._rect = QRectF()
+        if TrailItem._pens is None:
+            TrailItem._pens = []
+            for age in range(self.SEGMENTS):
+                color = QColor(*self.COLOR)
+                color.setAlpha(200 * (self.SEGMENTS - age) // self.SEGMENTS)
+                TrailItem._pens.append(QPen(color, 1.5))
+    
+    def extend(self, points):
+        self.prepareGeometryChange()
+        for x, y in points:
+            point = QPointF(x, y)
+            if not self._paths or self._paths[-1][1] >= self.segment_points:
+                path = QPainterPath(self._last if self._last is not None else point)
+                self._paths.append([path, 0])
+                if len(self._paths) > self.SEGMENTS:
+                    self._paths.popleft()
+                    self._rect = QRectF()
+                    for old_path, _ in self._paths:
+                        self._rect = self._rect.united(old_path.boundingRect())
+            entry = self._paths[-1]
+            entry[0].lineTo(point)
+            entry[1] += 1
+            self._last = point
+            # Un rectangle vide serait ignoré par united()
+            self._rect = self._rect.united(QRectF(x - 0.5, y - 0.5, 1, 1))
+        self.update()
+    
+    def boundingRect(self):
+        return self._rect.adjusted(-1, -1, 1, 1)
+    
+    def paint(self, painter, option, widget=None):
+        pens = self._pens
+        newest = len(self._paths) - 1
+        for index, (path, _) in enumerate(self._paths):
+            painter.strokePath(path, pens[newest - index])
+
+
+class FleetItem(QGraphicsItem):
+    """
+    Toute la flotte en un seul item, pour les grandes flottes.
+    
+    Un item par avion coûte, au-delà de quelques milliers d'avions, plus
+    dans l'index de la scène et la distribution des paint() que le dessin
+    lui-même. FleetItem dessine chaque avion dans un seul paint() en
+    copiant un sprite précalculé par niveau, couleur, contour et cap
+    (arrondi à HEADING_STEP degrés). Les noms ne sont écrits qu'à partir
+    d'un zoom de LABEL_MIN_ZOOM et tant que la partie exposée contient au
+    plus LABEL_MAX_VISIBLE avions.
+    """
+    
+    HEADING_STEP = 5         # degrés entre deux sprites d'une même forme
+    SPRITE_SCALE = 2         # résolution des sprites (nette jusqu'au zoom x2)
+    LABEL_MIN_ZOOM = 1.5     # échelle de la vue en dessous de laquelle les noms sont masqués
+    LABEL_MAX_VISIBLE = 200  # avions visibles au-delà desquels les noms sont masqués
+    MARGIN = 100             # avions hors du radar encore dessinés
+    LABEL_SAMPLE = "DLH999"  # nom le plus large, pour la marge de découpe
+    
+    def __init__(self, rect):
+        super().__init__()
+        self.setZValue(10)
+        # exposedRect renseigné : seuls les avions de la zone à repeindre sont dessinés
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self._rect = QRectF(rect).adjusted(-self.MARGIN, -self.MARGIN, self.MARGIN, self.MARGIN)
+        self._sprites = {}
+        self._font = QFont("Arial", 8)
+        self._label_pen = QPen(QColor(255, 255, 255))
+        self._cull_margin = self._reach()
+        self.entries = []  # (x, y, cap, niveau, couleur, contour, nom)
+        self.positions = {}  # id -> (x, y), pour les conflits prévus
+    
+    def boundingRect(self):
+        return self._rect
+    
+    def set_fleet(self, entries, positions):
+        """Remplace les avions dessinés et demande un seul repaint"""
+        self.entries = entries
+        self.positions = positions
+        self.update()
+    
+    def _reach(self):
+        """Distance maximale entre le centre d'un avion et ce qu'il dessine (sprite et nom)"""
+        palette = AirplanePalette.get()
+        outline = max(pen.widthF() for pen in palette.pens.values())
+        half_size = max(math.hypot(point.x(), point.y())
+                        for shape in palette.shapes.values() for point in shape) + outline
+        return half_size + QFontMetricsF(self._font).horizontalAdvance(self.LABEL_SAMPLE)
+    
+    def sprite(self, level, color, pen, heading):
+        """Sprite (pixmap, décalage) de l'avion, rendu au premier usage"""
+        step = int(round(heading / self.HEADING_STEP)) % (360 // self.HEADING_STEP)
+        key = (level, color, pen, step)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._render_sprite(level, color, pen,
+                                                              step * self.HEADING_STEP)
+        return sprite
+    
+    def _render_sprite(self, level, color, pen, heading):
+        palette = AirplanePalette.get()
+        shape = QTransform().rotate(heading).map(palette.shapes[level])
+        outline = palette.pens[pen]
+        bounds = shape.boundingRect().adjusted(*(extent * outline.widthF()
+                                                 for extent in (-1, -1, 1, 1)))
+        scale = self.SPRITE_SCALE
+        pixmap = QPixmap(int(bounds.width() * scale) + 1, int(bounds.height() * scale) + 1)
+        pixmap.setDevicePixelRatio(scale)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-bounds.left(), -bounds.top())
+        painter.setPen(outline)
+        painter.setBrush(palette.brushes[color])
+        painter.drawPolygon(shape)
+        painter.end()
+        return pixmap, bounds.topLeft()
+    
+    def paint(self, painter, option, widget=None):
+        # Un avion dont le centre est juste hors de la zone exposée peut y
+        # déborder par son sprite ou son nom : la zone est élargie d'autant
+        margin = self._cull_margin
+        exposed = option.exposedRect.adjusted(-margin, -margin, margin, margin)
+        left, top = exposed.left(), exposed.top()
+        right, bottom = exposed.right(), exposed.bottom()
+        sprite = self.sprite
+        labels = []
+        for entry in self.entries:
+            x, y, heading, level, color, pen, name = entry
+            if x < left or x > right or y < top or y > bottom:
+                continue
+            pixmap, offset = sprite(level, color, pen, heading)
+            painter.drawPixmap(QPointF(x + offset.x(), y + offset.y()), pixmap)
+            labels.append(entry)
+        
+        zoom = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if zoom < self.LABEL_MIN_ZOOM or len(labels) > self.LABEL_MAX_VISIBLE:
+            return
+        painter.setFont(self._font)
+        painter.setPen(self._label_pen)
+        for x, y, heading, level, color, pen, name in labels:
+            painter.drawText(QPointF(x - 20, y - 18), name)
+            painter.drawText(QPointF(x - 20, y - 6), f"N{level}")
+
+
+class PerformanceOverlay(QGraphicsSimpleTextItem):
+    """
+    Mesures de performance en surimpression sur le radar.
+    
+    Un seul item texte sur fond sombre, réécrit par show_stats quelques
+    fois par seconde (et seulement si le texte change) : il ne coûte rien
+    aux images intermédiaires. Il passe en rouge quand la simulation
+    n'atteint plus sa cadence ou que des pas et images sont perdus.
+    """
+    
+    PADDING = 6
+    COLORS = {False: QColor(200, 230, 201), True: QColor(255, 82, 82)}
+    
+    def __init__(self):
+        super().__init__()
+        self.setZValue(100)
+        self.setPos(10, 10)
+        # Taille fixe à l'écran, quel que soit le zoom de la vue
+        self.setFlag(QGraphicsSimpleTextItem.ItemIgnoresTransformations, True)
+        font = QFont("Monospace", 8)
+        font.setStyleHint(QFont.Monospace)
+        self.setFont(font)
+        self._background = QBrush(QColor(0, 0, 0, 170))
+        self._text = None
+        self._behind = None
+        self.show_stats(0.0, 0.0, 0.0, 0.0, 0, 0, 0, 0)
+    
+    def boundingRect(self):
+        padding = self.PADDING
+        return super().boundingRect().adjusted(-padding, -padding, padding, padding)
+    
+    def paint(self, painter, option, widget=None):
+        painter.fillRect(self.boundingRect(), self._background)
+        super().paint(painter, option, widget)
+    
+    def show_stats(self, tick_rate, target_rate, sim_ms, render_ms, items, fleet,
+                   dropped, late, behind=False):
+        """
+        Args:
+            tick_rate, target_rate: ticks par seconde mesurés et visés
+            sim_ms: ms par tick dans GameManager.update
+            render_ms: ms par image pour synchroniser la scène et le tableau de bord
+            items, fleet: items de la scène, avions en vol
+            dropped, late: pas de simulation abandonnés, images en retard
+            behind: la simulation a pris du retard depuis le dernier relevé
+        """
+        text = (f"ticks/s {tick_rate:5.1f} / {target_rate:.0f}\n"
+                f"simulation {sim_ms:6.2f} ms/tick\n"
+                f"affichage  {render_ms:6.2f} ms/image\n"
+                f"items {items}  avions {fleet}\n"
+                f"pas perdus {dropped}  images en retard {late}")
+        if text != self._text:
+            self.prepareGeometryChange()
+            self._text = text
+            self.setText(text)
+        if behind != self._behind:
+            self._behind = behind
+            self.setBrush(QBrush(self.COLORS[behind]))
+
+
 class RadarScene(QGraphicsScene):
     
-    def __init__(self, width, height, game_manager):
+    EXPLOSION_ALPHA_STEPS = 64  # niveaux de transparence précalculés
+    MAX_DRAWN_CONFLICTS = 12    # conflits prévus affichés (les plus proches)
+    URGENT_CONFLICT_TIME = 3.0  # secondes : en dessous, le conflit est en rouge
+    FLEET_THRESHOLD = 1500      # avions au-delà desquels la flotte passe dans un FleetItem
+    
+    def __init__(self, width, height, game_manager, fleet_threshold=None):
+        """
+        Args:
+            fleet_threshold: Taille de flotte au-delà de laquelle les avions
+                sont dessinés par un seul FleetItem (FLEET_THRESHOLD par
+                défaut) ; le radar revient à un item par avion en dessous
+                des trois quarts de ce seuil
+        """
         super().__init__(0, 0, width, height)
         self.game_manager = game_manager
+        self.fleet_threshold = self.FLEET_THRESHOLD if fleet_threshold is None else fleet_threshold
         self.airplane_items = {}
-        self.explosion_items = []
+        self.trail_items = {}  # id -> TrailItem, si le jeu a un historique (models.history)
+        self.fleet_item = None  # FleetItem quand la flotte dépasse fleet_threshold
+        self.selected_id = None
+        self.performance_overlay = None
+        self.explosion_items = []  # pool de (cercle, texte) réutilisés
+        self.conflict_items = []  # pool de (ligne, ligne, repère, texte)
         
         self.setBackgroundBrush(QBrush(QColor(30, 30, 30)))
         self.draw_landing_zone()
         self.draw_distance_circles()
+        self.create_explosion_pool()
+        self.create_conflict_pool()
+    
+    def reset(self):
+        """Vide la scène et recrée les éléments fixes"""
+        self.airplane_items.clear()
+        self.trail_items.clear()
+        self.fleet_item = None
+        self.selected_id = None
+        self.explosion_items.clear()
+        self.conflict_items.clear()
+        overlay = self.performance_overlay is not None
+        self.performance_overlay = None
+        self.clear()
+        if overlay:
+            self.set_performance_overlay(True)
+        
+        self.draw_landing_zone()
+        self.draw_distance_circles()
+        self.create_explosion_pool()
+        self.create_conflict_pool()
     
     def draw_landing_zone(self):
         x = self.game_manager.landing_zone_x
@@ -138,77 +498,307 @@ class RadarScene(QGraphicsScene):
             circle.setZValue(0)
             self.addItem(circle)
     
-    def update_airplanes(self):
+    def set_performance_overlay(self, visible):
+        """Affiche ou retire PerformanceOverlay ; retourne l'item ou None"""
+        if visible and self.performance_overlay is None:
+            self.performance_overlay = PerformanceOverlay()
+            self.addItem(self.performance_overlay)
+        elif not visible and self.performance_overlay is not None:
+            self.removeItem(self.performance_overlay)
+            self.performance_overlay = None
+        return self.performance_overlay
+    
+    def create_explosion_pool(self):
+        """
+        Crée une fois pour toutes les items d'explosion, cachés au repos.
+        
+        Le pool a la capacité du tampon de collisions du jeu : une rafale de
+        collisions ne crée ni item, ni police, ni pinceau.
+        """
+        orange = QColor(255, 69, 0)
+        self._explosion_brushes = []
+        for step in range(self.EXPLOSION_ALPHA_STEPS + 1):
+            color = QColor(orange)
+            color.setAlpha(int(step * 255 / self.EXPLOSION_ALPHA_STEPS))
+            self._explosion_brushes.append(QBrush(color))
+        
+        pen = QPen(QColor(255, 165, 0), 3)
+        font = QFont("Arial", 24, QFont.Bold)
+        
+        for _ in range(self.game_manager.collision_positions.capacity):
+            circle = QGraphicsEllipseItem()
+            circle.setPen(pen)
+            circle.setZValue(20)
+            circle.hide()
+            self.addItem(circle)
+            
+            boom_text = QGraphicsTextItem("💥")
+            boom_text.setDefaultTextColor(QColor(255, 255, 0))
+            boom_text.setFont(font)
+            boom_text.setZValue(21)
+            boom_text.hide()
+            self.addItem(boom_text)
+            
+            self.explosion_items.append((circle, boom_text))
+    
+    def create_conflict_pool(self):
+        """
+        Items des conflits prévus (models.conflict_probe), créés une fois :
+        un trait de chaque avion vers le point de plus proche approche, un
+        repère sur ce point et le délai en secondes.
+        """
+        self._conflict_pens = {}
+        for urgent, color in ((False, QColor(255, 193, 7)), (True, QColor(255, 82, 82))):
+            pen = QPen(color, 1.5, Qt.DashLine)
+            self._conflict_pens[urgent] = (pen, QPen(color, 2), color)
+        font = QFont("Arial", 8)
+        
+        for _ in range(self.MAX_DRAWN_CONFLICTS):
+            line1 = QGraphicsLineItem()
+            line2 = QGraphicsLineItem()
+            marker = QGraphicsEllipseItem(-6, -6, 12, 12)
+            label = QGraphicsTextItem()
+            label.setFont(font)
+            for item in (line1, line2, marker, label):
+                item.setZValue(5)
+                item.hide()
+                self.addItem(item)
+            self.conflict_items.append((line1, line2, marker, label))
+        self._conflict_state = [None] * self.MAX_DRAWN_CONFLICTS
+    
+    def update_airplanes(self, snapshot=None, previous=None, alpha=1.0):
+        """
+        Synchronise les items avec un FrameSnapshot.
+        
+        Args:
+            snapshot: état à afficher ; par défaut, l'état courant du jeu
+            previous: snapshot précédent, pour interpoler les positions
+            alpha: 0 = position de previous, 1 = position de snapshot
+        """
+        profiler = self.game_manager.profiler
+        start = mark = profiler.start()
+        if snapshot is None:
+            snapshot = take_snapshot(self.game_manager)
+        
+        previous_by_id = {}
+        if previous is not None and alpha < 1.0:
+            previous_by_id = {airplane.id: airplane for airplane in previous.airplanes}
+        
+        selected_id = snapshot.selected.id if snapshot.selected is not None else None
+        if selected_id != self.selected_id:
+            self.set_selection(selected_id)
+        
+        if self._use_fleet_item(len(snapshot.airplanes)):
+            self._update_fleet(snapshot.airplanes, previous_by_id, alpha)
+            mark = profiler.lap('radar.airplanes', mark)
+        else:
+            self._update_items(snapshot.airplanes, previous_by_id, alpha)
+            mark = profiler.lap('radar.airplanes', mark)
+            self._update_trails(snapshot)
+            mark = profiler.lap('radar.trails', mark)
+        
+        self.update_explosions(snapshot.explosions)
+        mark = profiler.lap('radar.explosions', mark)
+        self.update_conflicts(snapshot.conflicts)
+        profiler.lap('radar.conflicts', mark)
+        profiler.lap('radar.update_airplanes', start)
+    
+    def _use_fleet_item(self, fleet_size):
+        """Bascule entre un item par avion et FleetItem, avec hystérésis"""
+        if self.fleet_item is None and fleet_size > self.fleet_threshold:
+            for item in self.airplane_items.values():
+                self.removeItem(item)
+            self.airplane_items.clear()
+            # Pas de traînées pour les grandes flottes
+            for item in self.trail_items.values():
+                self.removeItem(item)
+            self.trail_items.clear()
+            self.fleet_item = FleetItem(self.sceneRect())
+            self.addItem(self.fleet_item)
+        elif self.fleet_item is not None and fleet_size < self.fleet_threshold * 3 // 4:
+            self.removeItem(self.fleet_item)
+            self.fleet_item = None
+        return self.fleet_item is not None
+    
+    def _update_fleet(self, airplanes, previous_by_id, alpha):
+        """Passe la flotte au FleetItem, qui la redessine en un seul paint()"""
+        color_class = AirplaneGraphicsItem.color_class
+        pen_class = AirplaneGraphicsItem.pen_class
+        interpolate = self._interpolate
+        selected_id = self.selected_id
+        entries = []
+        positions = {}
+        for airplane in airplanes:
+            before = previous_by_id.get(airplane.id)
+            if before:
+                x, y, heading = interpolate(before, airplane, alpha)
+            else:
+                x, y, heading = airplane.x, airplane.y, airplane.heading
+            selected = airplane.id == selected_id
+            entries.append((x, y, heading, airplane.level, color_class(airplane, selected),
+                            pen_class(airplane, selected), airplane.name))
+            positions[airplane.id] = (x, y)
+        self.fleet_item.set_fleet(entries, positions)
+    
+    def _update_items(self, airplanes, previous_by_id, alpha):
+        """Un AirplaneGraphicsItem par avion, mis à jour seulement s'il change"""
         current_ids = set()
         
-        for airplane in self.game_manager.airplanes:
+        for airplane in airplanes:
             current_ids.add(airplane.id)
             
+            before = previous_by_id.get(airplane.id)
+            pose = self._interpolate(before, airplane, alpha) if before else None
+            
             if airplane.id not in self.airplane_items:
-                item = AirplaneGraphicsItem(airplane, self.game_manager)
+                item = AirplaneGraphicsItem(airplane, airplane.id == self.selected_id)
                 self.airplane_items[airplane.id] = item
                 self.addItem(item)
-                self.addItem(item.label)
             else:
                 item = self.airplane_items[airplane.id]
-                item.update_appearance()
+                item.airplane = airplane
+                item.update_appearance(pose)
         
         # Supprimer les items des avions qui n'existent plus
         to_remove = []
         for airplane_id, item in self.airplane_items.items():
             if airplane_id not in current_ids:
                 to_remove.append(airplane_id)
-                self.removeItem(item.label)
                 self.removeItem(item)
         
         for airplane_id in to_remove:
             del self.airplane_items[airplane_id]
-        
-        self.update_explosions()
     
-    def update_explosions(self):
-        """Met à jour l'affichage des explosions"""
-        for item in self.explosion_items:
-            if item.scene() == self:
-                self.removeItem(item)
-        self.explosion_items.clear()
+    def _update_trails(self, snapshot):
+        """Prolonge les traînées avec les points relevés jusqu'au tick affiché"""
+        history = self.game_manager.history
+        trail_items = self.trail_items
+        cursors = {}
+        if history is not None:
+            for airplane in snapshot.airplanes:
+                item = trail_items.get(airplane.id)
+                cursors[airplane.id] = item.cursor if item is not None else 0
+            segment_points = max(1, history.length // TrailItem.SEGMENTS)
+            for airplane_id, (cursor, points) in history.updates(cursors, snapshot.tick).items():
+                item = trail_items.get(airplane_id)
+                if item is None:
+                    item = trail_items[airplane_id] = TrailItem(segment_points)
+                    self.addItem(item)
+                item.cursor = cursor
+                item.extend(points)
         
-        for collision in self.game_manager.collision_positions:
-            x = collision['x']
-            y = collision['y']
-            timer = collision['timer']
+        # Traînées des avions qui n'existent plus
+        if len(trail_items) > len(cursors):
+            for airplane_id in [airplane_id for airplane_id in trail_items
+                                if airplane_id not in cursors]:
+                self.removeItem(trail_items.pop(airplane_id))
+    
+    def set_selection(self, airplane_id):
+        """Change l'avion sélectionné en ne redessinant que l'ancien et le nouveau"""
+        if airplane_id == self.selected_id:
+            return
+        if self.fleet_item is not None:
+            # Couleurs recalculées par le prochain update_airplanes
+            self.selected_id = airplane_id
+            return
+        for item_id, selected in ((self.selected_id, False), (airplane_id, True)):
+            item = self.airplane_items.get(item_id)
+            if item is not None:
+                item.selected = selected
+                item.update_appearance(item._pos + (item._rotation,))
+        self.selected_id = airplane_id
+    
+    @staticmethod
+    def _interpolate(before, after, alpha):
+        """Pose (x, y, heading) entre deux snapshots, cap par le plus court"""
+        heading_diff = (after.heading - before.heading + 180) % 360 - 180
+        return (before.x + (after.x - before.x) * alpha,
+                before.y + (after.y - before.y) * alpha,
+                (before.heading + heading_diff * alpha) % 360)
+    
+    def update_explosions(self, explosions):
+        """Met à jour l'affichage des explosions (tuples (x, y, timer))"""
+        used = 0
+        for (x, y, timer), (circle, boom_text) in zip(explosions, self.explosion_items):
+            used += 1
             
             if timer > 0.5:
                 size = (1.0 - timer) * 100
             else:
                 size = timer * 100
             
-            explosion_circle = QGraphicsEllipseItem(
-                x - size/2, y - size/2, size, size
-            )
-            color = QColor(255, 69, 0)
-            color.setAlpha(int(timer * 255))
-            explosion_circle.setBrush(QBrush(color))
-            explosion_circle.setPen(QPen(QColor(255, 165, 0), 3))
-            explosion_circle.setZValue(20)
-            self.addItem(explosion_circle)
-            self.explosion_items.append(explosion_circle)
+            circle.setRect(x - size/2, y - size/2, size, size)
+            alpha_step = int(min(1.0, timer) * self.EXPLOSION_ALPHA_STEPS)
+            circle.setBrush(self._explosion_brushes[alpha_step])
+            circle.show()
             
             if timer > 0.7:
-                boom_text = QGraphicsTextItem("💥")
-                boom_text.setDefaultTextColor(QColor(255, 255, 0))
-                font = QFont("Arial", 24, QFont.Bold)
-                boom_text.setFont(font)
                 boom_text.setPos(x - 20, y - 30)
-                boom_text.setZValue(21)
-                self.addItem(boom_text)
-                self.explosion_items.append(boom_text)
+                boom_text.show()
+            elif boom_text.isVisible():
+                boom_text.hide()
+        
+        for circle, boom_text in self.explosion_items[used:]:
+            if circle.isVisible():
+                circle.hide()
+            if boom_text.isVisible():
+                boom_text.hide()
+    
+    def update_conflicts(self, conflicts):
+        """Relie les avions en conflit prévu à leur point de plus proche approche"""
+        used = 0
+        for conflict in conflicts:
+            if used == self.MAX_DRAWN_CONFLICTS:
+                break
+            id1, id2 = conflict.airplane_ids
+            pos1 = self._airplane_pos(id1)
+            pos2 = self._airplane_pos(id2)
+            if pos1 is None or pos2 is None:
+                continue
+            
+            line1, line2, marker, label = self.conflict_items[used]
+            urgent = conflict.time < self.URGENT_CONFLICT_TIME
+            text = f"{conflict.time:.0f}s"
+            state = (urgent, text)
+            if state != self._conflict_state[used]:
+                self._conflict_state[used] = state
+                line_pen, marker_pen, color = self._conflict_pens[urgent]
+                line1.setPen(line_pen)
+                line2.setPen(line_pen)
+                marker.setPen(marker_pen)
+                label.setDefaultTextColor(color)
+                label.setPlainText(text)
+            used += 1
+            
+            x, y = conflict.x, conflict.y
+            line1.setLine(pos1[0], pos1[1], x, y)
+            line2.setLine(pos2[0], pos2[1], x, y)
+            marker.setPos(x, y)
+            label.setPos(x + 6, y - 18)
+            for item in (line1, line2, marker, label):
+                if not item.isVisible():
+                    item.show()
+        
+        for items in self.conflict_items[used:]:
+            for item in items:
+                if item.isVisible():
+                    item.hide()
+    
+    def _airplane_pos(self, airplane_id):
+        """Dernière position (x, y) affichée d'un avion, ou None"""
+        if self.fleet_item is not None:
+            return self.fleet_item.positions.get(airplane_id)
+        item = self.airplane_items.get(airplane_id)
+        return item._pos if item is not None else None
     
     def get_airplane_at_pos(self, x, y):
         """Trouve l'avion à une position donnée"""
         selected = self.game_manager.select_airplane(x, y)
         
         if selected:
-            print(f"✈️ Avion sélectionné: {selected.name} - Niveau: {selected.level}, Fuel: {int(selected.fuel)}%")
+            self.game_manager.emit(
+                EventType.SELECTION,
+                f"✈️ Avion sélectionné: {selected.name} - Niveau: {selected.level}, Fuel: {int(selected.fuel)}%",
+                airplane_id=selected.id)
         
         return selected
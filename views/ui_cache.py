@@ -0,0 +1,103 @@
+"""
+Classe de formulaire précompilée pour ui/mainwindow.ui.
+
+views/ui_mainwindow.py est produit par pyside6-uic ; sa deuxième ligne
+porte l'empreinte SHA-256 du .ui dont il est issu. Au lancement, seule
+cette empreinte est comparée : si le .ui a changé, le module est régénéré,
+et si pyside6-uic n'est pas disponible, MainWindow se rabat sur QUiLoader.
+
+Régénération manuelle :
+    python -m views.ui_cache
+"""
+import hashlib
+import importlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+UI_PATH = os.path.join(os.path.dirname(__file__), '..', 'ui', 'mainwindow.ui')
+FORM_PATH = os.path.join(os.path.dirname(__file__), 'ui_mainwindow.py')
+FORM_MODULE = 'views.ui_mainwindow'
+HEADER = '# ui-sha256: '
+
+# uic écrit les caractères hors BMP (émojis des titres) en paires de
+# substitution UTF-16, que Python garde telles quelles et que Qt refuse
+SURROGATE_PAIR = re.compile(r'\\u(d[89ab][0-9a-f]{2})\\u(d[c-f][0-9a-f]{2})', re.IGNORECASE)
+
+
+def ui_digest(ui_path=UI_PATH):
+    with open(ui_path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def form_digest(form_path=FORM_PATH):
+    """Empreinte notée dans le module généré, ou None"""
+    try:
+        with open(form_path, encoding='utf-8') as file:
+            for line in (file.readline(), file.readline()):
+                if line.startswith(HEADER):
+                    return line[len(HEADER):].strip()
+    except OSError:
+        pass
+    return None
+
+
+def is_current(ui_path=UI_PATH, form_path=FORM_PATH):
+    return form_digest(form_path) == ui_digest(ui_path)
+
+
+def _uic_command():
+    uic = shutil.which('pyside6-uic')
+    if uic:
+        return [uic]
+    return [sys.executable, '-m', 'PySide6.scripts.pyside_tool', 'uic']
+
+
+def _join_surrogates(match):
+    high, low = int(match.group(1), 16), int(match.group(2), 16)
+    return f"\\U{0x10000 + (high - 0xD800) * 0x400 + (low - 0xDC00):08x}"
+
+
+def compile_form(ui_path=UI_PATH, form_path=FORM_PATH):
+    """
+    Régénère le module avec pyside6-uic.
+
+    Raises:
+        OSError, subprocess.CalledProcessError: uic absent ou en échec,
+            ou dossier non inscriptible
+    """
+    result = subprocess.run(_uic_command() + [ui_path], check=True, capture_output=True,
+                            text=True, encoding='utf-8')
+    source = SURROGATE_PAIR.sub(_join_surrogates, result.stdout)
+    lines = source.splitlines(keepends=True)
+    # L'empreinte suit la ligne d'encodage, qui doit rester en tête
+    lines.insert(1 if lines and lines[0].startswith('# -*-') else 0,
+                 f"{HEADER}{ui_digest(ui_path)}\n")
+    temporary = form_path + '.tmp'
+    with open(temporary, 'w', encoding='utf-8') as file:
+        file.writelines(lines)
+    os.replace(temporary, form_path)
+
+
+def load_form_class():
+    """
+    Ui_MainWindow à jour, régénéré si besoin.
+
+    Returns:
+        La classe, ou None si le module est périmé et ne peut être régénéré
+    """
+    if not is_current():
+        try:
+            compile_form()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+        if FORM_MODULE in sys.modules:
+            importlib.reload(sys.modules[FORM_MODULE])
+    return importlib.import_module(FORM_MODULE).Ui_MainWindow
+
+
+if __name__ == '__main__':
+    compile_form()
+    print(f"{FORM_PATH} régénéré ({form_digest()})")
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+# ui-sha256: 3702d0dd38f67023574dd9435d06b3594e280828b1e0edb7bcad83f8791548fc
+
+################################################################################
+## Form generated from reading UI file 'mainwindow.ui'
+##
+## Created by: Qt User Interface Compiler version 6.7.3
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QFrame, QGraphicsView,
+    QGroupBox, QHBoxLayout, QLabel, QMainWindow,
+    QPlainTextEdit, QPushButton, QSizePolicy, QSplitter,
+    QStatusBar, QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1000, 700)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.horizontalLayout = QHBoxLayout(self.centralwidget)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.mainSplitter = QSplitter(self.centralwidget)
+        self.mainSplitter.setObjectName(u"mainSplitter")
+        self.mainSplitter.setOrientation(Qt.Horizontal)
+        self.mainSplitter.setHandleWidth(10)
+        self.mainSplitter.setChildrenCollapsible(False)
+        self.leftPanel = QWidget(self.mainSplitter)
+        self.leftPanel.setObjectName(u"leftPanel")
+        self.verticalLayout_left = QVBoxLayout(self.leftPanel)
+        self.verticalLayout_left.setSpacing(12)
+        self.verticalLayout_left.setObjectName(u"verticalLayout_left")
+        self.verticalLayout_left.setContentsMargins(0, 0, 0, 0)
+        self.graphicsView = QGraphicsView(self.leftPanel)
+        self.graphicsView.setObjectName(u"graphicsView")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(3)
+        sizePolicy.setHeightForWidth(self.graphicsView.sizePolicy().hasHeightForWidth())
+        self.graphicsView.setSizePolicy(sizePolicy)
+        self.graphicsView.setFrameShape(QFrame.StyledPanel)
+        self.graphicsView.setFrameShadow(QFrame.Sunken)
+        self.graphicsView.setLineWidth(1)
+
+        self.verticalLayout_left.addWidget(self.graphicsView)
+
+        self.generalInfoGroup = QGroupBox(self.leftPanel)
+        self.generalInfoGroup.setObjectName(u"generalInfoGroup")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(1)
+        sizePolicy1.setHeightForWidth(self.generalInfoGroup.sizePolicy().hasHeightForWidth())
+        self.generalInfoGroup.setSizePolicy(sizePolicy1)
+        self.formLayout_info = QFormLayout(self.generalInfoGroup)
+        self.formLayout_info.setObjectName(u"formLayout_info")
+        self.formLayout_info.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        self.label_airplane_name = QLabel(self.generalInfoGroup)
+        self.label_airplane_name.setObjectName(u"label_airplane_name")
+
+        self.formLayout_info.setWidget(0, QFormLayout.LabelRole, self.label_airplane_name)
+
+        self.value_airplane_name = QLabel(self.generalInfoGroup)
+        self.value_airplane_name.setObjectName(u"value_airplane_name")
+        font = QFont()
+        font.setBold(True)
+        self.value_airplane_name.setFont(font)
+
+        self.formLayout_info.setWidget(0, QFormLayout.FieldRole, self.value_airplane_name)
+
+        self.label_altitude = QLabel(self.generalInfoGroup)
+        self.label_altitude.setObjectName(u"label_altitude")
+
+        self.formLayout_info.setWidget(1, QFormLayout.LabelRole, self.label_altitude)
+
+        self.value_altitude = QLabel(self.generalInfoGroup)
+        self.value_altitude.setObjectName(u"value_altitude")
+        self.value_altitude.setFont(font)
+
+        self.formLayout_info.setWidget(1, QFormLayout.FieldRole, self.value_altitude)
+
+        self.label_speed = QLabel(self.generalInfoGroup)
+        self.label_speed.setObjectName(u"label_speed")
+
+        self.formLayout_info.setWidget(2, QFormLayout.LabelRole, self.label_speed)
+
+        self.value_speed = QLabel(self.generalInfoGroup)
+        self.value_speed.setObjectName(u"value_speed")
+        self.value_speed.setFont(font)
+
+        self.formLayout_info.setWidget(2, QFormLayout.FieldRole, self.value_speed)
+
+        self.label_fuel = QLabel(self.generalInfoGroup)
+        self.label_fuel.setObjectName(u"label_fuel")
+
+        self.formLayout_info.setWidget(3, QFormLayout.LabelRole, self.label_fuel)
+
+        self.value_fuel = QLabel(self.generalInfoGroup)
+        self.value_fuel.setObjectName(u"value_fuel")
+
+        self.formLayout_info.setWidget(3, QFormLayout.FieldRole, self.value_fuel)
+
+
+        self.verticalLayout_left.addWidget(self.generalInfoGroup)
+
+        self.mainSplitter.addWidget(self.leftPanel)
+        self.rightPanel = QWidget(self.mainSplitter)
+        self.rightPanel.setObjectName(u"rightPanel")
+        self.verticalLayout_right = QVBoxLayout(self.rightPanel)
+        self.verticalLayout_right.setSpacing(12)
+        self.verticalLayout_right.setObjectName(u"verticalLayout_right")
+        self.verticalLayout_right.setContentsMargins(0, 0, 0, 0)
+        self.controlsGroup = QGroupBox(self.rightPanel)
+        self.controlsGroup.setObjectName(u"controlsGroup")
+        sizePolicy1.setHeightForWidth(self.controlsGroup.sizePolicy().hasHeightForWidth())
+        self.controlsGroup.setSizePolicy(sizePolicy1)
+        self.verticalLayout_controls = QVBoxLayout(self.controlsGroup)
+        self.verticalLayout_controls.setSpacing(5)
+        self.verticalLayout_controls.setObjectName(u"verticalLayout_controls")
+        self.button_climb = QPushButton(self.controlsGroup)
+        self.button_climb.setObjectName(u"button_climb")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.MinimumExpanding, QSizePolicy.Policy.Expanding)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(1)
+        sizePolicy2.setHeightForWidth(self.button_climb.sizePolicy().hasHeightForWidth())
+        self.button_climb.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout_controls.addWidget(self.button_climb)
+
+        self.button_descend = QPushButton(self.controlsGroup)
+        self.button_descend.setObjectName(u"button_descend")
+        sizePolicy2.setHeightForWidth(self.button_descend.sizePolicy().hasHeightForWidth())
+        self.button_descend.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout_controls.addWidget(self.button_descend)
+
+        self.button_land = QPushButton(self.controlsGroup)
+        self.button_land.setObjectName(u"button_land")
+        sizePolicy2.setHeightForWidth(self.button_land.sizePolicy().hasHeightForWidth())
+        self.button_land.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout_controls.addWidget(self.button_land)
+
+        self.button_hold = QPushButton(self.controlsGroup)
+        self.button_hold.setObjectName(u"button_hold")
+        sizePolicy2.setHeightForWidth(self.button_hold.sizePolicy().hasHeightForWidth())
+        self.button_hold.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout_controls.addWidget(self.button_hold)
+
+
+        self.verticalLayout_right.addWidget(self.controlsGroup)
+
+        self.statsGroup = QGroupBox(self.rightPanel)
+        self.statsGroup.setObjectName(u"statsGroup")
+        sizePolicy1.setHeightForWidth(self.statsGroup.sizePolicy().hasHeightForWidth())
+        self.statsGroup.setSizePolicy(sizePolicy1)
+        self.formLayout_stats = QFormLayout(self.statsGroup)
+        self.formLayout_stats.setObjectName(u"formLayout_stats")
+        self.formLayout_stats.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+        self.formLayout_stats.setLabelAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+        self.formLayout_stats.setFormAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignTop)
+        self.formLayout_stats.setRowWrapPolicy(QFormLayout.DontWrapRows)
+        self.formLayout_stats.setHorizontalSpacing(30)
+        self.stat_label_score = QLabel(self.statsGroup)
+        self.stat_label_score.setObjectName(u"stat_label_score")
+        sizePolicy1.setHeightForWidth(self.stat_label_score.sizePolicy().hasHeightForWidth())
+        self.stat_label_score.setSizePolicy(sizePolicy1)
+        self.stat_label_score.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(0, QFormLayout.LabelRole, self.stat_label_score)
+
+        self.stat_value_score = QLabel(self.statsGroup)
+        self.stat_value_score.setObjectName(u"stat_value_score")
+        sizePolicy1.setHeightForWidth(self.stat_value_score.sizePolicy().hasHeightForWidth())
+        self.stat_value_score.setSizePolicy(sizePolicy1)
+        font1 = QFont()
+        font1.setPointSize(10)
+        font1.setBold(True)
+        self.stat_value_score.setFont(font1)
+        self.stat_value_score.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(0, QFormLayout.FieldRole, self.stat_value_score)
+
+        self.stat_label_time = QLabel(self.statsGroup)
+        self.stat_label_time.setObjectName(u"stat_label_time")
+        sizePolicy1.setHeightForWidth(self.stat_label_time.sizePolicy().hasHeightForWidth())
+        self.stat_label_time.setSizePolicy(sizePolicy1)
+        self.stat_label_time.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(1, QFormLayout.LabelRole, self.stat_label_time)
+
+        self.stat_value_time = QLabel(self.statsGroup)
+        self.stat_value_time.setObjectName(u"stat_value_time")
+        sizePolicy1.setHeightForWidth(self.stat_value_time.sizePolicy().hasHeightForWidth())
+        self.stat_value_time.setSizePolicy(sizePolicy1)
+        self.stat_value_time.setFont(font)
+        self.stat_value_time.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(1, QFormLayout.FieldRole, self.stat_value_time)
+
+        self.stat_label_landed = QLabel(self.statsGroup)
+        self.stat_label_landed.setObjectName(u"stat_label_landed")
+        sizePolicy1.setHeightForWidth(self.stat_label_landed.sizePolicy().hasHeightForWidth())
+        self.stat_label_landed.setSizePolicy(sizePolicy1)
+        self.stat_label_landed.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(2, QFormLayout.LabelRole, self.stat_label_landed)
+
+        self.stat_value_landed = QLabel(self.statsGroup)
+        self.stat_value_landed.setObjectName(u"stat_value_landed")
+        sizePolicy1.setHeightForWidth(self.stat_value_landed.sizePolicy().hasHeightForWidth())
+        self.stat_value_landed.setSizePolicy(sizePolicy1)
+        self.stat_value_landed.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(2, QFormLayout.FieldRole, self.stat_value_landed)
+
+        self.stat_label_lives = QLabel(self.statsGroup)
+        self.stat_label_lives.setObjectName(u"stat_label_lives")
+        sizePolicy1.setHeightForWidth(self.stat_label_lives.sizePolicy().hasHeightForWidth())
+        self.stat_label_lives.setSizePolicy(sizePolicy1)
+        self.stat_label_lives.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(3, QFormLayout.LabelRole, self.stat_label_lives)
+
+        self.stat_value_lives = QLabel(self.statsGroup)
+        self.stat_value_lives.setObjectName(u"stat_value_lives")
+        sizePolicy1.setHeightForWidth(self.stat_value_lives.sizePolicy().hasHeightForWidth())
+        self.stat_value_lives.setSizePolicy(sizePolicy1)
+        self.stat_value_lives.setFont(font)
+        self.stat_value_lives.setAlignment(Qt.AlignLeading|Qt.AlignLeft|Qt.AlignVCenter)
+
+        self.formLayout_stats.setWidget(3, QFormLayout.FieldRole, self.stat_value_lives)
+
+
+        self.verticalLayout_right.addWidget(self.statsGroup)
+
+        self.eventsGroup = QGroupBox(self.rightPanel)
+        self.eventsGroup.setObjectName(u"eventsGroup")
+        self.verticalLayout_events = QVBoxLayout(self.eventsGroup)
+        self.verticalLayout_events.setObjectName(u"verticalLayout_events")
+        self.eventFeed = QPlainTextEdit(self.eventsGroup)
+        self.eventFeed.setObjectName(u"eventFeed")
+        self.eventFeed.setReadOnly(True)
+
+        self.verticalLayout_events.addWidget(self.eventFeed)
+
+
+        self.verticalLayout_right.addWidget(self.eventsGroup)
+
+        self.mainSplitter.addWidget(self.rightPanel)
+
+        self.horizontalLayout.addWidget(self.mainSplitter)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Contr\u00f4le A\u00e9rien - Tableau de Bord Color\u00e9", None))
+        MainWindow.setStyleSheet(QCoreApplication.translate("MainWindow", u"/* Style g\u00e9n\u00e9ral (Dark Mode) */\n"
+"QMainWindow {\n"
+"    background-color: #2e2e2e;\n"
+"}\n"
+"QWidget#centralwidget {\n"
+"    background-color: #2e2e2e;\n"
+"}\n"
+"QGroupBox {\n"
+"    border: 2px solid #5a5a5a;\n"
+"    border-radius: 5px;\n"
+"    margin-top: 1ex;\n"
+"    font-weight: bold;\n"
+"    color: #ffffff; /* Texte du titre en blanc */\n"
+"}\n"
+"QGroupBox::title {\n"
+"    subcontrol-origin: margin;\n"
+"    subcontrol-position: top center;\n"
+"    padding: 0 3px;\n"
+"    background-color: #2e2e2e;\n"
+"}\n"
+"QLabel {\n"
+"    color: #cccccc; /* Texte g\u00e9n\u00e9ral des labels */\n"
+"}\n"
+"QGraphicsView {\n"
+"    background-color: #1e1e1e; /* Fond de la carte ou vue graphique */\n"
+"    border: 1px solid #5a5a5a;\n"
+"}\n"
+"QSplitter::handle {\n"
+"    background-color: #5a5a5a;\n"
+"}", None))
+        self.generalInfoGroup.setTitle(QCoreApplication.translate("MainWindow", u"\u2708\ufe0f Informations de l'Avion S\u00e9lectionn\u00e9", None))
+        self.label_airplane_name.setText(QCoreApplication.translate("MainWindow", u"Nom de l'Avion:", None))
+        self.value_airplane_name.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #FFD700;", None))
+        self.value_airplane_name.setText(QCoreApplication.translate("MainWindow", u"Vol AFR123", None))
+        self.label_altitude.setText(QCoreApplication.translate("MainWindow", u"Altitude Actuelle (ft):", None))
+        self.value_altitude.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #4CAF50;", None))
+        self.value_altitude.setText(QCoreApplication.translate("MainWindow", u"15,000", None))
+        self.label_speed.setText(QCoreApplication.translate("MainWindow", u"Vitesse (kts):", None))
+        self.value_speed.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #2196F3;", None))
+        self.value_speed.setText(QCoreApplication.translate("MainWindow", u"250", None))
+        self.label_fuel.setText(QCoreApplication.translate("MainWindow", u"Carburant Restant (%):", None))
+        self.value_fuel.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #FFC107;", None))
+        self.value_fuel.setText(QCoreApplication.translate("MainWindow", u"85%", None))
+        self.controlsGroup.setTitle(QCoreApplication.translate("MainWindow", u"\u2b06\ufe0f Contr\u00f4les (Actions)", None))
+        self.button_climb.setStyleSheet(QCoreApplication.translate("MainWindow", u"QPushButton { background-color: #4CAF50; color: white; border: 1px solid #388E3C; }\n"
+"QPushButton:hover { background-color: #66BB6A; }", None))
+        self.button_climb.setText(QCoreApplication.translate("MainWindow", u"Monter (Climb)", None))
+        self.button_descend.setStyleSheet(QCoreApplication.translate("MainWindow", u"QPushButton { background-color: #2196F3; color: white; border: 1px solid #1976D2; }\n"
+"QPushButton:hover { background-color: #42A5F5; }", None))
+        self.button_descend.setText(QCoreApplication.translate("MainWindow", u"Descendre (Descend)", None))
+        self.button_land.setStyleSheet(QCoreApplication.translate("MainWindow", u"QPushButton { background-color: #FF9800; color: black; border: 1px solid #F57C00; }\n"
+"QPushButton:hover { background-color: #FFB74D; }", None))
+        self.button_land.setText(QCoreApplication.translate("MainWindow", u"Atterrir (Land)", None))
+        self.button_hold.setStyleSheet(QCoreApplication.translate("MainWindow", u"QPushButton { background-color: #795548; color: white; border: 1px solid #5D4037; }\n"
+"QPushButton:hover { background-color: #A1887F; }", None))
+        self.button_hold.setText(QCoreApplication.translate("MainWindow", u"Attendre (Hold)", None))
+        self.statsGroup.setTitle(QCoreApplication.translate("MainWindow", u"\U0001f3c6 Statistiques du Jeu", None))
+        self.stat_label_score.setText(QCoreApplication.translate("MainWindow", u"Score Actuel:", None))
+        self.stat_value_score.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #FFEB3B;", None))
+        self.stat_value_score.setText(QCoreApplication.translate("MainWindow", u"1250", None))
+        self.stat_label_time.setText(QCoreApplication.translate("MainWindow", u"Temps \u00c9coul\u00e9:", None))
+        self.stat_value_time.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #00BCD4;", None))
+        self.stat_value_time.setText(QCoreApplication.translate("MainWindow", u"05:45", None))
+        self.stat_label_landed.setText(QCoreApplication.translate("MainWindow", u"Avions Atterris:", None))
+        self.stat_value_landed.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #8BC34A;", None))
+        self.stat_value_landed.setText(QCoreApplication.translate("MainWindow", u"12", None))
+        self.stat_label_lives.setText(QCoreApplication.translate("MainWindow", u"Vies Restantes:", None))
+        self.stat_value_lives.setStyleSheet(QCoreApplication.translate("MainWindow", u"color: #F44336; /* Rouge pour les vies restantes (critique) */", None))
+        self.stat_value_lives.setText(QCoreApplication.translate("MainWindow", u"3", None))
+        self.eventsGroup.setTitle(QCoreApplication.translate("MainWindow", u"\U0001f4cb Journal", None))
+        self.eventFeed.setStyleSheet(QCoreApplication.translate("MainWindow", u"background-color: #1e1e1e; color: #cccccc; border: none;", None))
+    # retranslateUi
+